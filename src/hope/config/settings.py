@@ -148,6 +148,13 @@ class Settings(BaseSettings):
         description="Vector database provider"
     )
     
+    # Process-wide torch setting, applied once at startup; "high" allows
+    # TF32 tensor-core matmuls on Ampere+ GPUs for every loaded model
+    torch_matmul_precision: Literal["highest", "high", "medium"] = Field(
+        default="highest",
+        description="torch float32 matmul precision (highest, high, medium)"
+    )
+    
     # Nested settings
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     jwt: JWTSettings = Field(default_factory=JWTSettings)
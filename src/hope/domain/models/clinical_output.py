@@ -15,7 +15,7 @@ and interpretive boundaries require psychologist review.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
-from typing import Optional
+from typing import Mapping, Optional
 from uuid import UUID, uuid4
 
 from hope.domain.enums.panic_severity import PanicSeverity, UrgencyLevel
@@ -362,7 +362,7 @@ class ClinicalAssessment:
     
     # Audit trail
     raw_text_hash: str = ""
-    model_versions: dict[str, str] = field(default_factory=dict)
+    model_versions: Mapping[str, str] = field(default_factory=dict)
     embeddings: Optional[list[float]] = None
     
     def __post_init__(self) -> None:
@@ -415,5 +415,5 @@ class ClinicalAssessment:
             "crisis_protocol": self.requires_crisis_protocol,
             "human_review": self.requires_human_review,
             "raw_text_hash": self.raw_text_hash,
-            "model_versions": self.model_versions,
+            "model_versions": dict(self.model_versions),
         }
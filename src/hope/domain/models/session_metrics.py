@@ -13,14 +13,23 @@ from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID, uuid4
 
+import numpy as np
+
 from hope.domain.enums.panic_severity import PanicSeverity
 
+# Initial capacity of the trajectory columns; doubled when full
+_TRAJECTORY_CAPACITY = 16
 
-@dataclass
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
 class IntensityDataPoint:
     """
     Single intensity measurement at a point in time.
     
+    Immutable: points are snapshots of SessionMetrics column storage.
+    
     Attributes:
         timestamp: When measurement was taken
         intensity: Panic intensity (0.0-1.0)
@@ -72,7 +81,7 @@ class InterventionRecord:
         
         Returns:
             Effectiveness score (0.0-1.0) or None if not calculable
-            
+        
         CLINICAL_VALIDATION_REQUIRED: Effectiveness metric
         definition needs clinical input.
         """
@@ -116,6 +125,8 @@ class SessionMetrics:
         started_at: Session start time
         
         intensity_trajectory: Time series of intensity measurements
+            (built on demand from column storage)
+        intensities: Read-only view of the intensity column
         interventions: Record of interventions applied
         
         peak_intensity: Maximum intensity during session
@@ -134,7 +145,6 @@ class SessionMetrics:
     started_at: datetime = field(default_factory=datetime.utcnow)
     
     # Time series data
-    intensity_trajectory: list[IntensityDataPoint] = field(default_factory=list)
     interventions: list[InterventionRecord] = field(default_factory=list)
     
     # Peak metrics
@@ -150,6 +160,33 @@ class SessionMetrics:
     total_messages: int = 0
     escalation_occurred: bool = False
     
+    # Bumped on every intervention change; keys the cached
+    # most-effective intervention
+    _interventions_version: int = field(default=0, init=False, repr=False, compare=False)
+    _most_effective_cache: Optional[tuple[int, Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Intensity trajectory stored column-wise: analytics only read the
+    # intensity column, which stays a contiguous float64 array.
+    # Timestamps are microsecond offsets from started_at.
+    _size: int = field(default=0, init=False, repr=False, compare=False)
+    _intensities: np.ndarray = field(
+        default_factory=lambda: np.empty(_TRAJECTORY_CAPACITY, dtype=np.float64),
+        init=False, repr=False, compare=False,
+    )
+    _severities: np.ndarray = field(
+        default_factory=lambda: np.empty(_TRAJECTORY_CAPACITY, dtype=np.int8),
+        init=False, repr=False, compare=False,
+    )
+    _offsets_us: np.ndarray = field(
+        default_factory=lambda: np.empty(_TRAJECTORY_CAPACITY, dtype=np.int64),
+        init=False, repr=False, compare=False,
+    )
+    _applied: list[Optional[str]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    
     # CALM_THRESHOLD: Intensity below which user is considered "calm"
     # CLINICAL_VALIDATION_REQUIRED
     CALM_THRESHOLD: float = 0.25
@@ -159,7 +196,9 @@ class SessionMetrics:
         intensity: float,
         severity: PanicSeverity,
         intervention: Optional[str] = None,
-    ) -> None:
+        *,
+        offset_us: int,
+    ) -> int:
         """
         Add a new intensity data point.
         
@@ -167,18 +206,24 @@ class SessionMetrics:
             intensity: Current panic intensity
             severity: Current severity classification
             intervention: Intervention applied (if any)
+            offset_us: Microseconds since started_at on the session's
+                (monotonic) clock; no wall-clock read per message
+        
+        Returns:
+            Number of data points after adding this one
         """
-        now = datetime.utcnow()
-        
-        data_point = IntensityDataPoint(
-            timestamp=now,
-            intensity=intensity,
-            severity=severity,
-            message_index=len(self.intensity_trajectory),
-            intervention_applied=intervention,
-        )
-        self.intensity_trajectory.append(data_point)
-        self.total_messages = len(self.intensity_trajectory)
+        now = self.started_at + timedelta(microseconds=offset_us)
+        
+        index = self._size
+        if index == len(self._intensities):
+            self._grow()
+        
+        self._intensities[index] = intensity
+        self._severities[index] = severity
+        self._offsets_us[index] = offset_us
+        self._applied.append(intervention)
+        self._size = index + 1
+        self.total_messages = self._size
         
         # Update peak if this is highest
         if intensity > self.peak_intensity:
@@ -194,7 +239,51 @@ class SessionMetrics:
         
         # Record intervention
         if intervention:
-            self._record_intervention(intervention, intensity)
+            self._record_intervention(intervention, intensity, now)
+        
+        return self._size
+    
+    @property
+    def intensities(self) -> np.ndarray:
+        """Read-only view of the recorded intensities, oldest first."""
+        view = self._intensities[:self._size]
+        view.flags.writeable = False
+        return view
+    
+    @property
+    def intensity_trajectory(self) -> tuple[IntensityDataPoint, ...]:
+        """
+        Trajectory as data points, built from the column storage.
+        
+        Returns an immutable snapshot so attempts to append to or edit
+        it fail loudly; record measurements with add_data_point().
+        """
+        size = self._size
+        started_at = self.started_at
+        return tuple(
+            IntensityDataPoint(
+                timestamp=started_at + timedelta(microseconds=offset),
+                intensity=intensity,
+                severity=PanicSeverity(severity),
+                message_index=index,
+                intervention_applied=intervention,
+            )
+            for index, (intensity, severity, offset, intervention) in enumerate(zip(
+                self._intensities[:size].tolist(),
+                self._severities[:size].tolist(),
+                self._offsets_us[:size].tolist(),
+                self._applied,
+            ))
+        )
+    
+    def _grow(self) -> None:
+        """Double the capacity of the trajectory columns."""
+        capacity = 2 * len(self._intensities)
+        for name in ("_intensities", "_severities", "_offsets_us"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
     
     def _update_time_to_calm(self) -> None:
         """Calculate time from peak to calm."""
@@ -206,21 +295,27 @@ class SessionMetrics:
             return
         
         # Find first point after peak that dropped below threshold
-        for point in self.intensity_trajectory:
-            if point.timestamp > self.peak_timestamp:
-                if point.intensity < self.CALM_THRESHOLD:
-                    self.time_to_calm = point.timestamp - self.peak_timestamp
-                    break
+        size = self._size
+        offsets = self._offsets_us[:size]
+        peak_offset = (self.peak_timestamp - self.started_at) // _MICROSECOND
+        calm = np.flatnonzero(
+            (offsets > peak_offset) & (self._intensities[:size] < self.CALM_THRESHOLD)
+        )
+        if calm.size:
+            self.time_to_calm = timedelta(
+                microseconds=int(offsets[calm[0]] - peak_offset)
+            )
     
     def _record_intervention(
         self,
         intervention_type: str,
         intensity_before: float,
+        applied_at: datetime,
     ) -> None:
         """Record a new intervention."""
         record = InterventionRecord(
             intervention_type=intervention_type,
-            applied_at=datetime.utcnow(),
+            applied_at=applied_at,
             intensity_before=intensity_before,
         )
         self.interventions.append(record)
@@ -229,10 +324,12 @@ class SessionMetrics:
         if len(self.interventions) > 1:
             prev = self.interventions[-2]
             prev.intensity_after = intensity_before
-            prev.messages_to_effect = len(self.intensity_trajectory) - 1
+            prev.messages_to_effect = self._size - 1
             prev.was_effective = (
                 prev.intensity_after < prev.intensity_before
             )
+        
+        self.mark_interventions_changed()
     
     def get_intensity_change(self) -> float:
         """
@@ -242,33 +339,45 @@ class SessionMetrics:
             Change from first to last measurement
             Negative = improvement, Positive = worsening
         """
-        if len(self.intensity_trajectory) < 2:
+        if self._size < 2:
             return 0.0
         
-        first = self.intensity_trajectory[0].intensity
-        last = self.intensity_trajectory[-1].intensity
-        return last - first
+        return float(self._intensities[self._size - 1] - self._intensities[0])
+    
+    def mark_interventions_changed(self) -> None:
+        """
+        Invalidate cached intervention aggregates.
+        
+        Call after appending to or mutating interventions directly.
+        """
+        self._interventions_version += 1
     
     def get_most_effective_intervention(self) -> Optional[str]:
-        """Get the intervention with highest effectiveness."""
-        effective = [
-            (i.intervention_type, i.calculate_effectiveness())
-            for i in self.interventions
-            if i.calculate_effectiveness() is not None
-        ]
-        
-        if not effective:
-            return None
+        """
+        Get the intervention with highest effectiveness.
+        
+        Cached until interventions change (see mark_interventions_changed).
+        """
+        cache = self._most_effective_cache
+        if cache is not None and cache[0] == self._interventions_version:
+            return cache[1]
+        
+        best_type: Optional[str] = None
+        best_score = 0.0
+        for intervention in self.interventions:
+            score = intervention.calculate_effectiveness()
+            if score is not None and (best_type is None or score > best_score):
+                best_type, best_score = intervention.intervention_type, score
         
-        return max(effective, key=lambda x: x[1])[0]
+        self._most_effective_cache = (self._interventions_version, best_type)
+        return best_type
     
     def get_average_intensity(self) -> float:
         """Calculate average intensity across session."""
-        if not self.intensity_trajectory:
+        if not self._size:
             return 0.0
         
-        total = sum(p.intensity for p in self.intensity_trajectory)
-        return total / len(self.intensity_trajectory)
+        return float(self._intensities[:self._size].mean())
     
     def was_session_successful(self) -> bool:
         """
@@ -281,7 +390,7 @@ class SessionMetrics:
             True if final intensity is below threshold
             and lower than peak
         """
-        if not self.intensity_trajectory:
+        if not self._size:
             return True  # No distress detected
         
         return (
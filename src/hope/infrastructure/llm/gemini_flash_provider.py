@@ -24,6 +24,7 @@ from hope.infrastructure.llm.provider import (
     RateLimitError,
     ContentFilterError,
 )
+from hope.infrastructure.metrics.prometheus_metrics import LLMTimer
 from hope.services.prompt.prompt_builder import BuiltPrompt
 
 logger = get_logger(__name__)
@@ -183,75 +184,80 @@ Response style:
         # Gemini Flash supports system instructions natively
         user_content = self._build_user_content(prompt)
         
-        start_time = time.time()
-        
-        try:
-            # Generation config optimized for panic mode
-            generation_config = GenerationConfig(
-                max_output_tokens=max_tokens or prompt.max_tokens or self.DEFAULT_MAX_TOKENS,
-                temperature=temperature or prompt.temperature or self.DEFAULT_TEMPERATURE,
-            )
-            
-            # Use generate_content_async for proper async support
-            response = await gemini_model.generate_content_async(
-                user_content,
-                generation_config=generation_config,
-            )
-            
-            latency_ms = int((time.time() - start_time) * 1000)
+        async with LLMTimer(
+            self.provider_name, rate_limit_errors=(RateLimitError,)
+        ) as timer:
+            start_time = time.time()
             
-            # Check for blocked content
-            if response.prompt_feedback:
-                block_reason = getattr(response.prompt_feedback, 'block_reason', None)
-                if block_reason:
-                    logger.warning(
-                        "Gemini content blocked",
-                        reason=str(block_reason),
-                    )
-                    raise ContentFilterError(
-                        provider=self.provider_name,
-                        filter_reason=str(block_reason),
-                    )
-            
-            # Extract content
-            content = ""
-            if response.candidates:
-                candidate = response.candidates[0]
-                if candidate.content and candidate.content.parts:
-                    content = candidate.content.parts[0].text or ""
+            try:
+                # Generation config optimized for panic mode
+                generation_config = GenerationConfig(
+                    max_output_tokens=max_tokens or prompt.max_tokens or self.DEFAULT_MAX_TOKENS,
+                    temperature=temperature or prompt.temperature or self.DEFAULT_TEMPERATURE,
+                )
                 
-                # Check finish reason
-                finish_reason = str(getattr(candidate, 'finish_reason', 'STOP'))
-                if 'SAFETY' in finish_reason:
-                    raise ContentFilterError(
-                        provider=self.provider_name,
-                        filter_reason="Response blocked by safety filters",
-                    )
-            
-            # Estimate token usage
-            usage = self._estimate_usage(user_content, content)
-            
-            logger.debug(
-                "Gemini Flash response generated",
-                model=model_name,
-                latency_ms=latency_ms,
-                content_length=len(content),
-            )
-            
-            return LLMResponse(
-                content=content,
-                finish_reason="stop",
-                usage=usage,
-                model=model_name,
-                provider=self.provider_name,
-                latency_ms=latency_ms,
-                raw_response=response,
-            )
-            
-        except ContentFilterError:
-            raise
-        except Exception as e:
-            self._handle_error(e)
+                # Use generate_content_async for proper async support
+                response = await gemini_model.generate_content_async(
+                    user_content,
+                    generation_config=generation_config,
+                )
+                
+                latency_ms = int((time.time() - start_time) * 1000)
+                
+                # Check for blocked content
+                if response.prompt_feedback:
+                    block_reason = getattr(response.prompt_feedback, 'block_reason', None)
+                    if block_reason:
+                        logger.warning(
+                            "Gemini content blocked",
+                            reason=str(block_reason),
+                        )
+                        raise ContentFilterError(
+                            provider=self.provider_name,
+                            filter_reason=str(block_reason),
+                        )
+                
+                # Extract content
+                content = ""
+                if response.candidates:
+                    candidate = response.candidates[0]
+                    if candidate.content and candidate.content.parts:
+                        content = candidate.content.parts[0].text or ""
+                    
+                    # Check finish reason
+                    finish_reason = str(getattr(candidate, 'finish_reason', 'STOP'))
+                    if 'SAFETY' in finish_reason:
+                        raise ContentFilterError(
+                            provider=self.provider_name,
+                            filter_reason="Response blocked by safety filters",
+                        )
+                
+                # Estimate token usage
+                usage = self._estimate_usage(user_content, content)
+                
+                logger.debug(
+                    "Gemini Flash response generated",
+                    model=model_name,
+                    latency_ms=latency_ms,
+                    content_length=len(content),
+                )
+                
+                timer.record_usage(usage)
+                
+                return LLMResponse(
+                    content=content,
+                    finish_reason="stop",
+                    usage=usage,
+                    model=model_name,
+                    provider=self.provider_name,
+                    latency_ms=latency_ms,
+                    raw_response=response,
+                )
+                
+            except ContentFilterError:
+                raise
+            except Exception as e:
+                self._handle_error(e)
     
     def _build_user_content(self, prompt: BuiltPrompt) -> str:
         """Build user content from prompt."""
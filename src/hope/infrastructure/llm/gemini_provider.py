@@ -20,6 +20,7 @@ from hope.infrastructure.llm.provider import (
     RateLimitError,
     ContentFilterError,
 )
+from hope.infrastructure.metrics.prometheus_metrics import LLMTimer
 from hope.services.prompt.prompt_builder import BuiltPrompt
 
 logger = get_logger(__name__)
@@ -148,77 +149,83 @@ class GeminiProvider(LLMProvider):
 
 User message: {prompt.user_message}"""
         
-        start_time = time.time()
-        
-        try:
-            # Generate response
-            generation_config = GenerationConfig(
-                max_output_tokens=max_tokens or prompt.max_tokens,
-                temperature=temperature or prompt.temperature,
-            )
-            
-            response = await chat.send_message_async(
-                full_prompt,
-                generation_config=generation_config,
-            )
-            
-            latency_ms = int((time.time() - start_time) * 1000)
+        async with LLMTimer(
+            self.provider_name, rate_limit_errors=(RateLimitError,)
+        ) as timer:
+            start_time = time.time()
             
-            # Check for blocked content
-            if response.prompt_feedback and response.prompt_feedback.block_reason:
-                raise ContentFilterError(
-                    provider=self.provider_name,
-                    filter_reason=str(response.prompt_feedback.block_reason),
+            try:
+                # Generate response
+                generation_config = GenerationConfig(
+                    max_output_tokens=max_tokens or prompt.max_tokens,
+                    temperature=temperature or prompt.temperature,
                 )
-            
-            content = response.text or ""
-            
-            # Gemini doesn't provide detailed usage like OpenAI
-            # Estimate based on text length
-            usage = {
-                "prompt_tokens": len(full_prompt.split()) * 1.3,  # Rough estimate
-                "completion_tokens": len(content.split()) * 1.3,
-                "total_tokens": (len(full_prompt.split()) + len(content.split())) * 1.3,
-            }
-            
-            logger.debug(
-                "Gemini completion generated",
-                model=model_name,
-                latency_ms=latency_ms,
-            )
-            
-            return LLMResponse(
-                content=content,
-                finish_reason="stop",
-                usage={k: int(v) for k, v in usage.items()},
-                model=model_name,
-                provider=self.provider_name,
-                latency_ms=latency_ms,
-                raw_response=response,
-            )
-            
-        except Exception as e:
-            error_msg = str(e).lower()
-            
-            if "quota" in error_msg or "rate" in error_msg:
-                logger.warning("Gemini rate limit hit", error=str(e))
-                raise RateLimitError(
+                
+                response = await chat.send_message_async(
+                    full_prompt,
+                    generation_config=generation_config,
+                )
+                
+                latency_ms = int((time.time() - start_time) * 1000)
+                
+                # Check for blocked content
+                if response.prompt_feedback and response.prompt_feedback.block_reason:
+                    raise ContentFilterError(
+                        provider=self.provider_name,
+                        filter_reason=str(response.prompt_feedback.block_reason),
+                    )
+                
+                content = response.text or ""
+                
+                # Gemini doesn't provide detailed usage like OpenAI
+                # Estimate based on text length
+                usage = {
+                    "prompt_tokens": len(full_prompt.split()) * 1.3,  # Rough estimate
+                    "completion_tokens": len(content.split()) * 1.3,
+                    "total_tokens": (len(full_prompt.split()) + len(content.split())) * 1.3,
+                }
+                
+                logger.debug(
+                    "Gemini completion generated",
+                    model=model_name,
+                    latency_ms=latency_ms,
+                )
+                
+                usage = {k: int(v) for k, v in usage.items()}
+                timer.record_usage(usage)
+                
+                return LLMResponse(
+                    content=content,
+                    finish_reason="stop",
+                    usage=usage,
+                    model=model_name,
                     provider=self.provider_name,
-                    retry_after_seconds=60,
+                    latency_ms=latency_ms,
+                    raw_response=response,
                 )
-            
-            if "safety" in error_msg or "blocked" in error_msg:
-                raise ContentFilterError(
+                
+            except Exception as e:
+                error_msg = str(e).lower()
+                
+                if "quota" in error_msg or "rate" in error_msg:
+                    logger.warning("Gemini rate limit hit", error=str(e))
+                    raise RateLimitError(
+                        provider=self.provider_name,
+                        retry_after_seconds=60,
+                    )
+                
+                if "safety" in error_msg or "blocked" in error_msg:
+                    raise ContentFilterError(
+                        provider=self.provider_name,
+                        filter_reason=str(e),
+                    )
+                
+                logger.error("Gemini API error", error=str(e))
+                raise LLMProviderError(
+                    f"Gemini API error: {str(e)}",
                     provider=self.provider_name,
-                    filter_reason=str(e),
+                    original_error=e,
                 )
-            
-            logger.error("Gemini API error", error=str(e))
-            raise LLMProviderError(
-                f"Gemini API error: {str(e)}",
-                provider=self.provider_name,
-                original_error=e,
-            )
     
     async def health_check(self) -> bool:
         """Check Gemini API availability."""
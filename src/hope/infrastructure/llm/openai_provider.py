@@ -25,6 +25,7 @@ from hope.infrastructure.llm.provider import (
     RateLimitError,
     ContentFilterError,
 )
+from hope.infrastructure.metrics.prometheus_metrics import LLMTimer
 from hope.services.prompt.prompt_builder import BuiltPrompt
 
 logger = get_logger(__name__)
@@ -123,76 +124,81 @@ class OpenAIProvider(LLMProvider):
         messages = prompt.to_messages()
         model_name = model or self._default_model
         
-        start_time = time.time()
-        
-        try:
-            response = await client.chat.completions.create(
-                model=model_name,
-                messages=messages,
-                max_tokens=max_tokens or prompt.max_tokens or self._default_max_tokens,
-                temperature=temperature or prompt.temperature or self._default_temperature,
-            )
-            
-            latency_ms = int((time.time() - start_time) * 1000)
+        async with LLMTimer(
+            self.provider_name, rate_limit_errors=(RateLimitError,)
+        ) as timer:
+            start_time = time.time()
             
-            # Extract response
-            choice = response.choices[0]
-            content = choice.message.content or ""
-            finish_reason = choice.finish_reason or "stop"
-            
-            # Check for content filter
-            if finish_reason == "content_filter":
-                raise ContentFilterError(
+            try:
+                response = await client.chat.completions.create(
+                    model=model_name,
+                    messages=messages,
+                    max_tokens=max_tokens or prompt.max_tokens or self._default_max_tokens,
+                    temperature=temperature or prompt.temperature or self._default_temperature,
+                )
+                
+                latency_ms = int((time.time() - start_time) * 1000)
+                
+                # Extract response
+                choice = response.choices[0]
+                content = choice.message.content or ""
+                finish_reason = choice.finish_reason or "stop"
+                
+                # Check for content filter
+                if finish_reason == "content_filter":
+                    raise ContentFilterError(
+                        provider=self.provider_name,
+                        filter_reason="Content was filtered by OpenAI safety systems",
+                    )
+                
+                usage = {
+                    "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
+                    "completion_tokens": response.usage.completion_tokens if response.usage else 0,
+                    "total_tokens": response.usage.total_tokens if response.usage else 0,
+                }
+                
+                logger.debug(
+                    "OpenAI completion generated",
+                    model=model_name,
+                    tokens=usage.get("total_tokens"),
+                    latency_ms=latency_ms,
+                )
+                
+                timer.record_usage(usage)
+                
+                return LLMResponse(
+                    content=content,
+                    finish_reason=finish_reason,
+                    usage=usage,
+                    model=model_name,
                     provider=self.provider_name,
-                    filter_reason="Content was filtered by OpenAI safety systems",
+                    latency_ms=latency_ms,
+                    raw_response=response,
+                )
+                
+            except OpenAIRateLimitError as e:
+                logger.warning("OpenAI rate limit hit", error=str(e))
+                raise RateLimitError(
+                    provider=self.provider_name,
+                    retry_after_seconds=60,
+                )
+                
+            except APIError as e:
+                logger.error("OpenAI API error", error=str(e))
+                raise LLMProviderError(
+                    f"OpenAI API error: {str(e)}",
+                    provider=self.provider_name,
+                    is_retryable=True,
+                    original_error=e,
+                )
+                
+            except Exception as e:
+                logger.error("Unexpected OpenAI error", error=str(e))
+                raise LLMProviderError(
+                    f"Unexpected error: {str(e)}",
+                    provider=self.provider_name,
+                    original_error=e,
                 )
-            
-            usage = {
-                "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-                "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-                "total_tokens": response.usage.total_tokens if response.usage else 0,
-            }
-            
-            logger.debug(
-                "OpenAI completion generated",
-                model=model_name,
-                tokens=usage.get("total_tokens"),
-                latency_ms=latency_ms,
-            )
-            
-            return LLMResponse(
-                content=content,
-                finish_reason=finish_reason,
-                usage=usage,
-                model=model_name,
-                provider=self.provider_name,
-                latency_ms=latency_ms,
-                raw_response=response,
-            )
-            
-        except OpenAIRateLimitError as e:
-            logger.warning("OpenAI rate limit hit", error=str(e))
-            raise RateLimitError(
-                provider=self.provider_name,
-                retry_after_seconds=60,
-            )
-            
-        except APIError as e:
-            logger.error("OpenAI API error", error=str(e))
-            raise LLMProviderError(
-                f"OpenAI API error: {str(e)}",
-                provider=self.provider_name,
-                is_retryable=True,
-                original_error=e,
-            )
-            
-        except Exception as e:
-            logger.error("Unexpected OpenAI error", error=str(e))
-            raise LLMProviderError(
-                f"Unexpected error: {str(e)}",
-                provider=self.provider_name,
-                original_error=e,
-            )
     
     async def health_check(self) -> bool:
         """Check OpenAI API availability."""
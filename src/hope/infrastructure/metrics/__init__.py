@@ -23,6 +23,7 @@ from hope.infrastructure.metrics.prometheus_metrics import (
     WEBSOCKET_CONNECTIONS,
     RATE_LIMIT_EXCEEDED,
     # Helpers
+    LLMTimer,
     track_llm_request,
     track_panic_session,
     track_escalation,
@@ -50,6 +51,7 @@ __all__ = [
     "HTTP_REQUEST_DURATION",
     "WEBSOCKET_CONNECTIONS",
     "RATE_LIMIT_EXCEEDED",
+    "LLMTimer",
     "track_llm_request",
     "track_panic_session",
     "track_escalation",
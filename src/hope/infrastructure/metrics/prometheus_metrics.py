@@ -9,7 +9,8 @@ Only increment/observe; never block on metrics operations.
 """
 
 import time
-from functools import wraps
+from functools import lru_cache, wraps
+from types import TracebackType
 from typing import Callable, Optional
 
 from prometheus_client import (
@@ -164,33 +165,105 @@ SYSTEM_INFO.info({
 # HELPER FUNCTIONS
 # =============================================================================
 
-def track_llm_request(provider: str) -> Callable:
-    """Decorator to track LLM request metrics."""
+@lru_cache(maxsize=None)
+def _llm_metric_children(provider: str) -> tuple:
+    """Resolve and cache labelled LLM metric children for a provider."""
+    return (
+        LLM_REQUESTS_TOTAL.labels(provider=provider, status="success"),
+        LLM_REQUESTS_TOTAL.labels(provider=provider, status="error"),
+        LLM_REQUESTS_TOTAL.labels(provider=provider, status="rate_limited"),
+        LLM_LATENCY.labels(provider=provider),
+        LLM_TOKENS_USED.labels(provider=provider, type="input"),
+        LLM_TOKENS_USED.labels(provider=provider, type="output"),
+    )
+
+
+class LLMTimer:
+    """
+    Async context manager tracking LLM request metrics.
+    
+    A failure counts as rate limited if it is an instance of one of
+    rate_limit_errors (the caller's provider exception types; this
+    module cannot import them, the llm package imports it) or carries
+    an HTTP 429 status_code, as untranslated SDK errors do.
+    
+    Usage:
+        async with LLMTimer("openai", rate_limit_errors=(RateLimitError,)) as timer:
+            response = await client.generate(...)
+            timer.record_usage(response.usage)
+    """
+    
+    __slots__ = (
+        "_rate_limit_errors",
+        "_start",
+        "_success",
+        "_error",
+        "_rate_limited",
+        "_latency",
+        "_input_tokens",
+        "_output_tokens",
+    )
+    
+    def __init__(
+        self,
+        provider: str,
+        rate_limit_errors: tuple[type[BaseException], ...] = (),
+    ) -> None:
+        self._rate_limit_errors = rate_limit_errors
+        self._start = 0.0
+        (
+            self._success,
+            self._error,
+            self._rate_limited,
+            self._latency,
+            self._input_tokens,
+            self._output_tokens,
+        ) = _llm_metric_children(provider)
+    
+    async def __aenter__(self) -> "LLMTimer":
+        self._start = time.perf_counter()
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> bool:
+        self._latency.observe(time.perf_counter() - self._start)
+        if exc is None:
+            self._success.inc()
+        elif (
+            isinstance(exc, self._rate_limit_errors)
+            or getattr(exc, "status_code", None) == 429
+        ):
+            self._rate_limited.inc()
+        else:
+            self._error.inc()
+        return False
+    
+    def record_usage(self, usage: dict) -> None:
+        """Record token usage from an LLM response."""
+        self._input_tokens.inc(usage.get("prompt_tokens", 0))
+        self._output_tokens.inc(usage.get("completion_tokens", 0))
+
+
+def track_llm_request(
+    provider: str,
+    rate_limit_errors: tuple[type[BaseException], ...] = (),
+) -> Callable:
+    """Decorator to track LLM request metrics (wraps LLMTimer)."""
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            try:
+            async with LLMTimer(provider, rate_limit_errors) as timer:
                 result = await func(*args, **kwargs)
-                LLM_REQUESTS_TOTAL.labels(provider=provider, status="success").inc()
                 
                 # Track tokens if available
                 if hasattr(result, 'usage'):
-                    LLM_TOKENS_USED.labels(provider=provider, type="input").inc(
-                        result.usage.get("prompt_tokens", 0)
-                    )
-                    LLM_TOKENS_USED.labels(provider=provider, type="output").inc(
-                        result.usage.get("completion_tokens", 0)
-                    )
+                    timer.record_usage(result.usage)
                 
                 return result
-            except Exception as e:
-                error_type = "rate_limited" if "rate" in str(e).lower() else "error"
-                LLM_REQUESTS_TOTAL.labels(provider=provider, status=error_type).inc()
-                raise
-            finally:
-                duration = time.time() - start_time
-                LLM_LATENCY.labels(provider=provider).observe(duration)
         return wrapper
     return decorator
 
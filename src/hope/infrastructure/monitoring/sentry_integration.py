@@ -8,14 +8,10 @@ SECURITY: All sensitive fields are stripped before sending to Sentry.
 """
 
 import re
+import threading
+from functools import lru_cache
 from typing import Any, Optional
 
-import sentry_sdk
-from sentry_sdk.integrations.fastapi import FastApiIntegration
-from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
-from sentry_sdk.integrations.asyncio import AsyncioIntegration
-from sentry_sdk.integrations.logging import LoggingIntegration
-
 from hope.config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -30,6 +26,56 @@ SENSITIVE_PATTERNS = [
     r"authorization[\"']?\s*[:=]\s*[\"']?[^\"'\s,}]+",
 ]
 
+# Applied one after another: a single alternation would stop at the
+# leftmost branch (e.g. "Authorization: Bearer") and leave the token
+_SENSITIVE_RES = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in SENSITIVE_PATTERNS
+)
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional accelerator
+    hyperscan = None
+
+
+def _build_hyperscan_db() -> Optional[Any]:
+    """Compile SENSITIVE_PATTERNS into a Hyperscan block database if available."""
+    if hyperscan is None:
+        return None
+    
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(
+        expressions=[pattern.encode() for pattern in SENSITIVE_PATTERNS],
+        ids=list(range(len(SENSITIVE_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST]
+        * len(SENSITIVE_PATTERNS),
+    )
+    return db
+
+
+_HYPERSCAN_DB = _build_hyperscan_db()
+
+# Hyperscan scratch space is not thread-safe; one per thread
+_hyperscan_local = threading.local()
+
+# Keywords anchoring every pattern above; strings without one cannot match
+_SENSITIVE_TOKENS = (
+    "password",
+    "api",
+    "token",
+    "secret",
+    "bearer",
+    "authorization",
+    "credential",
+    "jwt",
+)
+
+# Shortest string any pattern can match, e.g. "token=x"
+_MIN_SENSITIVE_MATCH_LEN = 7
+
+# Every pattern except the bearer one needs an assignment character
+_ASSIGN_CHARS = frozenset("=:")
+
 SENSITIVE_KEYS = frozenset({
     "password",
     "token",
@@ -45,38 +91,128 @@ SENSITIVE_KEYS = frozenset({
     "session_token",
 })
 
+_SENSITIVE_SUBSTRINGS = tuple(SENSITIVE_KEYS)
+
 
 def _scrub_string(value: str) -> str:
     """Scrub sensitive patterns from string."""
-    result = value
-    for pattern in SENSITIVE_PATTERNS:
-        result = re.sub(pattern, "[REDACTED]", result, flags=re.IGNORECASE)
-    return result
+    if len(value) < _MIN_SENSITIVE_MATCH_LEN:
+        return value
+    lowered = value.casefold()
+    if not any(token in lowered for token in _SENSITIVE_TOKENS):
+        return value
+    if "bearer" not in lowered and not any(char in value for char in _ASSIGN_CHARS):
+        return value
+    # Hyperscan's caseless matching and \s are ASCII-only
+    if _HYPERSCAN_DB is not None and value.isascii():
+        return _hyperscan_scrub(value)
+    for pattern in _SENSITIVE_RES:
+        value = pattern.sub("[REDACTED]", value)
+    return value
 
 
-def _scrub_dict(data: dict) -> dict:
-    """Recursively scrub sensitive data from dictionary."""
-    result = {}
-    for key, value in data.items():
-        key_lower = key.lower().replace("-", "_")
+def _hyperscan_scrub(value: str) -> str:
+    """
+    Redact Hyperscan match spans, merging overlapping matches.
+    
+    Every pattern is matched against the original string, so the union
+    of spans covers at least what the sequential re passes redact.
+    """
+    data = value.encode()
+    spans: list[tuple[int, int]] = []
+    
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        spans.append((start, end))
+    
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = hyperscan.Scratch(_HYPERSCAN_DB)
+        _hyperscan_local.scratch = scratch
+    
+    _HYPERSCAN_DB.scan(data, match_event_handler=on_match, scratch=scratch)
+    if not spans:
+        return value
+    
+    # Hyperscan reports every end offset; keep the widest span per region
+    spans.sort()
+    parts = []
+    cursor = 0
+    span_start, span_end = spans[0]
+    for start, end in spans[1:]:
+        if start < span_end:
+            span_end = max(span_end, end)
+            continue
+        parts.append(data[cursor:span_start])
+        parts.append(b"[REDACTED]")
+        cursor = span_end
+        span_start, span_end = start, end
+    parts.append(data[cursor:span_start])
+    parts.append(b"[REDACTED]")
+    parts.append(data[span_end:])
+    
+    return b"".join(parts).decode(errors="replace")
+
+
+@lru_cache(maxsize=512)
+def _norm_key(key: str) -> str:
+    """Normalize a header/field name for sensitive key matching."""
+    return key.lower().replace("-", "_")
+
+
+def _is_sensitive_key(key: str) -> bool:
+    """Check whether a dictionary key names sensitive data."""
+    key_lower = _norm_key(key)
+    return key_lower in SENSITIVE_KEYS or any(
+        sensitive in key_lower for sensitive in _SENSITIVE_SUBSTRINGS
+    )
+
+
+def _scrub_inplace(data: Any) -> None:
+    """Scrub sensitive data from nested dicts and lists in place."""
+    stack = [data]
+    while stack:
+        container = stack.pop()
         
-        if any(sensitive in key_lower for sensitive in SENSITIVE_KEYS):
-            result[key] = "[REDACTED]"
-        elif isinstance(value, dict):
-            result[key] = _scrub_dict(value)
-        elif isinstance(value, list):
-            result[key] = [
-                _scrub_dict(item) if isinstance(item, dict)
-                else _scrub_string(str(item)) if isinstance(item, str)
-                else item
-                for item in value
-            ]
+        if isinstance(container, dict):
+            for key, value in container.items():
+                if _is_sensitive_key(key):
+                    container[key] = "[REDACTED]"
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+                elif isinstance(value, str):
+                    container[key] = _scrub_string(value)
+        elif isinstance(container, list):
+            for index, item in enumerate(container):
+                if isinstance(item, (dict, list)):
+                    stack.append(item)
+                elif isinstance(item, str):
+                    container[index] = _scrub_string(item)
+
+
+def _copy_containers(data: Any) -> Any:
+    """Copy the dict/list structure of data, sharing every other value."""
+    if isinstance(data, dict):
+        return {key: _copy_containers(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy_containers(item) for item in data]
+    return data
+
+
+def _scrub_headers(headers: dict) -> None:
+    """Scrub a flat {name: value} header mapping in place (no nesting)."""
+    for name, value in headers.items():
+        if _is_sensitive_key(name):
+            headers[name] = "[REDACTED]"
         elif isinstance(value, str):
-            result[key] = _scrub_string(value)
-        else:
-            result[key] = value
-    
-    return result
+            headers[name] = _scrub_string(value)
+
+
+# Sub-keys of event["request"] that may carry sensitive data,
+# with the scrubber specialized for each one's shape
+_REQUEST_SCRUBBERS = (
+    ("data", _scrub_inplace),
+    ("headers", _scrub_headers),
+)
 
 
 def before_send(event: dict, hint: dict) -> Optional[dict]:
@@ -88,21 +224,27 @@ def before_send(event: dict, hint: dict) -> Optional[dict]:
     - Filters unwanted events
     """
     # Scrub request data
-    if "request" in event:
-        if "data" in event["request"]:
-            event["request"]["data"] = _scrub_dict(event["request"]["data"])
-        if "headers" in event["request"]:
-            event["request"]["headers"] = _scrub_dict(event["request"]["headers"])
+    request = event.get("request")
+    if request:
+        for field_name, scrub in _REQUEST_SCRUBBERS:
+            value = request.get(field_name)
+            if value:
+                scrub(value)
     
     # Scrub breadcrumbs
-    if "breadcrumbs" in event:
-        for breadcrumb in event.get("breadcrumbs", {}).get("values", []):
-            if "data" in breadcrumb and isinstance(breadcrumb["data"], dict):
-                breadcrumb["data"] = _scrub_dict(breadcrumb["data"])
+    breadcrumbs = event.get("breadcrumbs")
+    if breadcrumbs:
+        for breadcrumb in breadcrumbs.get("values", []):
+            data = breadcrumb.get("data")
+            if not data:
+                continue
+            if isinstance(data, dict):
+                _scrub_inplace(data)
     
     # Scrub extra context
-    if "extra" in event:
-        event["extra"] = _scrub_dict(event["extra"])
+    extra = event.get("extra")
+    if extra:
+        _scrub_inplace(extra)
     
     return event
 
@@ -139,6 +281,13 @@ def init_sentry(
         logger.warning("Sentry DSN not configured, error tracking disabled")
         return
     
+    # Deferred so a disabled Sentry costs nothing at import time
+    import sentry_sdk
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+    from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+    from sentry_sdk.integrations.asyncio import AsyncioIntegration
+    from sentry_sdk.integrations.logging import LoggingIntegration
+    
     sentry_sdk.init(
         dsn=dsn,
         environment=environment,
@@ -177,6 +326,8 @@ def set_user_context(user_id: str, session_id: Optional[str] = None) -> None:
     
     Uses anonymized IDs only - no PII.
     """
+    import sentry_sdk
+    
     sentry_sdk.set_user({
         "id": user_id,
         "session_id": session_id,
@@ -189,6 +340,8 @@ def set_panic_context(
     risk_level: Optional[str] = None,
 ) -> None:
     """Set panic session context for debugging."""
+    import sentry_sdk
+    
     sentry_sdk.set_context("panic_session", {
         "session_id": session_id,
         "severity": severity,
@@ -206,6 +359,8 @@ def capture_safety_event(
     
     Used for tracking escalations, crisis signals, etc.
     """
+    import sentry_sdk
+    
     with sentry_sdk.push_scope() as scope:
         scope.set_tag("category", "safety")
         if extra:
@@ -228,11 +383,18 @@ def capture_exception_with_context(
     
     Returns: Sentry event ID
     """
+    import sentry_sdk
+    
     with sentry_sdk.push_scope() as scope:
         if session_id:
             scope.set_tag("session_id", session_id)
         if extra:
-            for key, value in _scrub_dict(extra).items():
+            # Copy only the containers the scrubber rewrites, so the
+            # caller's dict is left untouched without deep-copying
+            # arbitrary (possibly uncopyable) leaf values
+            scrubbed = _copy_containers(extra)
+            _scrub_inplace(scrubbed)
+            for key, value in scrubbed.items():
                 scope.set_extra(key, value)
         
         return sentry_sdk.capture_exception(exception)
@@ -1,17 +1,18 @@
 """
 Vector Database Client Interface
 
-Abstract interface for vector database operations.
+Structural interface for vector database operations.
 Enables swapping between Pinecone, Weaviate, or other providers.
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Optional, Protocol, Union, runtime_checkable
 from uuid import UUID
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class VectorSearchResult:
     """
     Result from vector similarity search.
@@ -27,35 +28,33 @@ class VectorSearchResult:
     metadata: dict = field(default_factory=dict)
 
 
-class VectorDBClient(ABC):
+@runtime_checkable
+class VectorDBClient(Protocol):
     """
-    Abstract vector database client.
+    Structural vector database client interface.
     
     Provides operations for storing and searching
-    emotional context embeddings.
+    emotional context embeddings. Implementations satisfy
+    it by shape; no inheritance required.
     """
     
     @property
-    @abstractmethod
     def provider_name(self) -> str:
         """Get provider name."""
-        pass
+        ...
     
-    @abstractmethod
     async def initialize(self) -> None:
         """Initialize client and connection."""
-        pass
+        ...
     
-    @abstractmethod
     async def close(self) -> None:
         """Close client connection."""
-        pass
+        ...
     
-    @abstractmethod
     async def upsert(
         self,
         id: str,
-        vector: list[float],
+        vector: Union[list[float], np.ndarray],
         metadata: dict,
     ) -> bool:
         """
@@ -69,14 +68,14 @@ class VectorDBClient(ABC):
         Returns:
             True if successful
         """
-        pass
+        ...
     
-    @abstractmethod
     async def search(
         self,
-        vector: list[float],
+        vector: Union[list[float], np.ndarray],
         top_k: int = 10,
         filter: Optional[dict] = None,
+        min_score: float = 0.0,
     ) -> list[VectorSearchResult]:
         """
         Search for similar vectors.
@@ -85,13 +84,14 @@ class VectorDBClient(ABC):
             vector: Query vector
             top_k: Number of results to return
             filter: Optional metadata filter
+            min_score: Drop matches scoring below this (applied by the
+                database where it supports a score threshold)
             
         Returns:
             List of similar vectors with scores
         """
-        pass
+        ...
     
-    @abstractmethod
     async def delete(self, id: str) -> bool:
         """
         Delete a vector by ID.
@@ -102,9 +102,8 @@ class VectorDBClient(ABC):
         Returns:
             True if deleted
         """
-        pass
+        ...
     
-    @abstractmethod
     async def health_check(self) -> bool:
         """Check vector database connectivity."""
-        pass
+        ...
@@ -5,21 +5,75 @@ Implementation of vector database client for Pinecone.
 Handles emotional history storage and similarity search.
 """
 
-from typing import Optional
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Optional, Union
 
+import numpy as np
 from pinecone import Pinecone, ServerlessSpec
 
 from hope.config import get_settings
 from hope.config.logging_config import get_logger
-from hope.infrastructure.vector_db.client import VectorDBClient, VectorSearchResult
+from hope.infrastructure.vector_db.client import VectorSearchResult
 
 logger = get_logger(__name__)
 
+# Index name -> monotonic time its existence was last confirmed
+_index_exists_cache: dict[str, float] = {}
 
-class PineconeVectorClient(VectorDBClient):
+# Shared pool for blocking Pinecone SDK calls, bounding concurrent connections
+_SDK_MAX_WORKERS = 16
+_sdk_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_sdk_executor() -> ThreadPoolExecutor:
+    """Get or create the shared Pinecone SDK thread pool."""
+    global _sdk_executor
+    if _sdk_executor is None:
+        _sdk_executor = ThreadPoolExecutor(
+            max_workers=_SDK_MAX_WORKERS,
+            thread_name_prefix="pinecone",
+        )
+    return _sdk_executor
+
+
+@lru_cache()
+def _pinecone_config() -> tuple[str, str, str]:
+    """Resolve Pinecone settings once: (api_key, index_name, environment)."""
+    settings = get_settings()
+    return (
+        settings.pinecone.api_key.get_secret_value(),
+        settings.pinecone.index_name,
+        settings.pinecone.environment,
+    )
+
+
+def _quantize(vector: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Symmetric int8 quantization of an embedding.
+    
+    Cosine similarity is scale-invariant, so quantized vectors can be
+    compared directly against each other (and against unquantized ones).
+    
+    Returns:
+        Quantized values in [-127, 127] and the scale used
+    """
+    peak = float(np.abs(vector).max(initial=0.0))
+    if peak == 0.0:
+        return vector, 1.0
+    
+    scale = 127.0 / peak
+    return np.rint(vector * scale), scale
+
+
+class PineconeVectorClient:
     """
     Pinecone vector database client.
     
+    Implements the VectorDBClient protocol.
+    
     Manages emotional context embeddings for:
     - Storing user emotional states
     - Retrieving similar past experiences
@@ -35,10 +89,19 @@ class PineconeVectorClient(VectorDBClient):
     # Embedding dimension (must match model output)
     DIMENSION = 384  # all-MiniLM-L6-v2
     
+    # Upsert batching: flush when this many vectors are queued,
+    # or after this delay, whichever comes first
+    UPSERT_BATCH_SIZE = 64
+    UPSERT_MAX_DELAY_SECONDS = 0.05
+    
+    # How long a confirmed index existence check stays valid
+    INDEX_CACHE_TTL_SECONDS = 300.0
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         index_name: Optional[str] = None,
+        quantize: bool = False,
     ) -> None:
         """
         Initialize Pinecone client.
@@ -46,16 +109,32 @@ class PineconeVectorClient(VectorDBClient):
         Args:
             api_key: Pinecone API key (defaults to settings)
             index_name: Index name (defaults to settings)
+            quantize: Round vectors to the int8 grid before sending.
+                Opt-in and lossy: cosine similarity shifts slightly and
+                each record gains a quant_scale metadata field, while
+                values are still sent and stored as float32, so it
+                saves no storage or bandwidth.
         """
-        settings = get_settings()
+        default_api_key, default_index_name, environment = _pinecone_config()
         
-        self._api_key = api_key or settings.pinecone.api_key.get_secret_value()
-        self._index_name = index_name or settings.pinecone.index_name
-        self._environment = settings.pinecone.environment
+        self._api_key = api_key or default_api_key
+        self._index_name = index_name or default_index_name
+        self._environment = environment
+        self._quantize = quantize
         
         self._pc: Optional[Pinecone] = None
         self._index = None
         self._initialized = False
+        
+        # Bound index methods, resolved once in initialize()
+        self._do_upsert = None
+        self._do_query = None
+        self._do_delete = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Buffered vectors, each with the future its upsert() awaits
+        self._pending: list[tuple[str, np.ndarray, dict, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
     
     @property
     def provider_name(self) -> str:
@@ -74,99 +153,190 @@ class PineconeVectorClient(VectorDBClient):
             self._pc = Pinecone(api_key=self._api_key)
             
             # Check if index exists, create if not
-            existing_indexes = self._pc.list_indexes()
-            index_names = [idx.name for idx in existing_indexes]
-            
-            if self._index_name not in index_names:
-                logger.info(f"Creating Pinecone index: {self._index_name}")
-                self._pc.create_index(
-                    name=self._index_name,
-                    dimension=self.DIMENSION,
-                    metric="cosine",
-                    spec=ServerlessSpec(
-                        cloud="aws",
-                        region="us-east-1",
-                    ),
-                )
+            if not self._index_known_to_exist():
+                existing_indexes = self._pc.list_indexes()
+                index_names = [idx.name for idx in existing_indexes]
+                
+                if self._index_name not in index_names:
+                    logger.info("Creating Pinecone index", index_name=self._index_name)
+                    self._pc.create_index(
+                        name=self._index_name,
+                        dimension=self.DIMENSION,
+                        metric="cosine",
+                        spec=ServerlessSpec(
+                            cloud="aws",
+                            region="us-east-1",
+                        ),
+                    )
+                
+                _index_exists_cache[self._index_name] = time.monotonic()
             
             self._index = self._pc.Index(self._index_name)
+            self._do_upsert = self._index.upsert
+            self._do_query = self._index.query
+            self._do_delete = self._index.delete
+            self._executor = _get_sdk_executor()
             self._initialized = True
             logger.info("Pinecone client initialized")
-            
+        
         except Exception as e:
-            logger.error(f"Failed to initialize Pinecone: {e}")
+            logger.error("Failed to initialize Pinecone", error=str(e))
             raise
     
+    def _index_known_to_exist(self) -> bool:
+        """Check whether index existence was confirmed within the TTL."""
+        checked_at = _index_exists_cache.get(self._index_name)
+        if checked_at is None:
+            return False
+        return time.monotonic() - checked_at < self.INDEX_CACHE_TTL_SECONDS
+    
     async def close(self) -> None:
-        """Close Pinecone connection."""
+        """Close Pinecone connection, writing any buffered vectors first."""
+        # Let a scheduled flush finish rather than cancelling it mid-write
+        flush_task, self._flush_task = self._flush_task, None
+        if flush_task is not None:
+            await flush_task
+        await self.flush()
+        
         # Pinecone client doesn't require explicit close
         self._index = None
         self._pc = None
+        self._do_upsert = None
+        self._do_query = None
+        self._do_delete = None
         self._initialized = False
     
     async def upsert(
         self,
         id: str,
-        vector: list[float],
+        vector: Union[list[float], np.ndarray],
         metadata: dict,
     ) -> bool:
         """
         Insert or update emotional context embedding.
         
+        Concurrent upserts are buffered and sent in batches; each call
+        returns once the batch holding its vector has been written.
+        
         Args:
             id: Unique identifier (usually UUID)
-            vector: Embedding vector (384 dimensions)
+            vector: Embedding vector (384 dimensions), list or ndarray
             metadata: Context metadata (user_id, timestamp, etc.)
-            
+        
         Returns:
-            True if successful
+            True if the vector was written successfully
         """
-        if not self._initialized:
+        if self._do_upsert is None:
             await self.initialize()
+            if self._do_upsert is None:
+                logger.warning("Pinecone not available, skipping upsert")
+                return False
         
-        if not self._index:
-            logger.warning("Pinecone not available, skipping upsert")
-            return False
+        values = np.ascontiguousarray(vector, dtype=np.float32)
+        if self._quantize:
+            values, scale = _quantize(values)
+            metadata = {**metadata, "quant_scale": scale}
         
-        try:
-            self._index.upsert(
-                vectors=[(id, vector, metadata)],
-            )
-            
-            logger.debug(f"Upserted vector: {id}")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((id, values, metadata, future))
+        
+        if len(self._pending) >= self.UPSERT_BATCH_SIZE:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+        
+        return await future
+    
+    async def flush(self) -> bool:
+        """
+        Send all buffered vectors in a single upsert call.
+        
+        Resolves every buffered upsert() with the outcome.
+        
+        Returns:
+            True if successful (or nothing was pending)
+        """
+        if not self._pending:
             return True
-            
+        
+        batch, self._pending = self._pending, []
+        
+        success = False
+        try:
+            if self._do_upsert is None:
+                logger.warning("Pinecone not available, dropping buffered upserts")
+            else:
+                await self._run_sdk(
+                    self._do_upsert,
+                    vectors=[
+                        (id, values.tolist(), metadata)
+                        for id, values, metadata, _ in batch
+                    ],
+                )
+                logger.debug("Upserted vectors", count=len(batch))
+                success = True
+        
         except Exception as e:
-            logger.error(f"Pinecone upsert failed: {e}")
-            return False
+            logger.error("Pinecone upsert failed", count=len(batch), error=str(e))
+        
+        finally:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_result(success)
+        
+        return success
+    
+    async def _run_sdk(self, func: Callable[..., Any], /, **kwargs: Any) -> Any:
+        """Run a blocking SDK call on the shared thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, **kwargs))
+    
+    async def _delayed_flush(self) -> None:
+        """
+        Flush buffered vectors after the batching delay.
+        
+        Loops so vectors queued while a write is in flight are sent too.
+        """
+        while self._pending:
+            await asyncio.sleep(self.UPSERT_MAX_DELAY_SECONDS)
+            await self.flush()
     
     async def search(
         self,
-        vector: list[float],
+        vector: Union[list[float], np.ndarray],
         top_k: int = 10,
         filter: Optional[dict] = None,
+        min_score: float = 0.0,
     ) -> list[VectorSearchResult]:
         """
         Search for similar emotional contexts.
         
+        Pinecone has no server-side score threshold, so min_score is
+        applied here before any result objects are built.
+        
         Args:
-            vector: Query embedding
+            vector: Query embedding, list or ndarray
             top_k: Number of results
             filter: Metadata filter (e.g., {"user_id": "..."})
-            
+            min_score: Minimum similarity score to return
+        
         Returns:
             List of similar contexts with scores
         """
-        if not self._initialized:
+        if self._do_query is None:
             await self.initialize()
+            if self._do_query is None:
+                logger.warning("Pinecone not available, returning empty results")
+                return []
         
-        if not self._index:
-            logger.warning("Pinecone not available, returning empty results")
-            return []
+        values = np.ascontiguousarray(vector, dtype=np.float32)
+        if self._quantize:
+            values, _ = _quantize(values)
         
         try:
-            response = self._index.query(
-                vector=vector,
+            response = await self._run_sdk(
+                self._do_query,
+                vector=values.tolist(),
                 top_k=top_k,
                 filter=filter,
                 include_metadata=True,
@@ -179,28 +349,28 @@ class PineconeVectorClient(VectorDBClient):
                     metadata=match.metadata or {},
                 )
                 for match in response.matches
+                if match.score >= min_score
             ]
             
-            logger.debug(f"Vector search returned {len(results)} results")
+            logger.debug("Vector search completed", result_count=len(results))
             return results
-            
+        
         except Exception as e:
-            logger.error(f"Pinecone search failed: {e}")
+            logger.error("Pinecone search failed", error=str(e))
             return []
     
     async def delete(self, id: str) -> bool:
         """Delete vector by ID."""
-        if not self._initialized:
+        if self._do_delete is None:
             await self.initialize()
-        
-        if not self._index:
-            return False
+            if self._do_delete is None:
+                return False
         
         try:
-            self._index.delete(ids=[id])
+            await self._run_sdk(self._do_delete, ids=[id])
             return True
         except Exception as e:
-            logger.error(f"Pinecone delete failed: {e}")
+            logger.error("Pinecone delete failed", error=str(e))
             return False
     
     async def health_check(self) -> bool:
@@ -215,7 +385,7 @@ class PineconeVectorClient(VectorDBClient):
     
     async def search_by_user(
         self,
-        vector: list[float],
+        vector: Union[list[float], np.ndarray],
         user_id: str,
         top_k: int = 10,
     ) -> list[VectorSearchResult]:
@@ -228,7 +398,7 @@ class PineconeVectorClient(VectorDBClient):
             vector: Query embedding
             user_id: User ID to filter by
             top_k: Number of results
-            
+        
         Returns:
             Similar contexts for this user
         """
@@ -12,7 +12,7 @@ This is the production entry point for the HOPE backend.
 """
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import TYPE_CHECKING, AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -21,20 +21,23 @@ from fastapi.responses import JSONResponse
 from hope.config import get_settings
 from hope.config.logging_config import configure_logging, get_logger
 from hope.infrastructure.database import get_db_manager
-from hope.services.orchestration.response_orchestrator import ResponseOrchestrator
 from hope.api.v1.router import api_router
 from hope.api.middleware.error_handler import ErrorHandlerMiddleware
 
+if TYPE_CHECKING:
+    # Imported lazily in lifespan(); it pulls in the ML stack
+    from hope.services.orchestration.response_orchestrator import ResponseOrchestrator
+
 # Initialize settings and logging
 settings = get_settings()
 configure_logging(settings)
 logger = get_logger(__name__)
 
 # Global orchestrator instance (initialized during startup)
-_orchestrator: ResponseOrchestrator | None = None
+_orchestrator: "ResponseOrchestrator | None" = None
 
 
-def get_orchestrator() -> ResponseOrchestrator:
+def get_orchestrator() -> "ResponseOrchestrator":
     """Get the global orchestrator instance."""
     if _orchestrator is None:
         raise RuntimeError("Orchestrator not initialized")
@@ -63,7 +66,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await db.initialize()
         logger.info("Database connection initialized")
         
+        if settings.torch_matmul_precision != "highest":
+            # Process-wide: applies to every model loaded below
+            import torch
+            torch.set_float32_matmul_precision(settings.torch_matmul_precision)
+        
         # Initialize orchestrator (and ML models)
+        from hope.services.orchestration.response_orchestrator import ResponseOrchestrator
+        
         _orchestrator = ResponseOrchestrator()
         if settings.env != "development":
             # Only pre-load models in non-dev environments
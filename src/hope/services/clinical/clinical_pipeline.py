@@ -11,8 +11,10 @@ The ClinicalAssessment produced by this pipeline is the ONLY
 input allowed to the Decision Engine.
 """
 
+import asyncio
 import hashlib
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Coroutine, Mapping, Optional
 from uuid import UUID
 
 from hope.domain.models.clinical_output import (
@@ -68,6 +70,33 @@ class ClinicalPipeline:
     # Model versions for tracking
     PIPELINE_VERSION = "2.0.0"
     
+    # Bare acknowledgements that skip the ML models outside an active
+    # session. Kept to an explicit list: short messages such as "help me"
+    # or "getting worse" can be urgent and must always be analyzed.
+    # CLINICAL_VALIDATION_REQUIRED
+    LOW_SIGNAL_ACKNOWLEDGEMENTS: frozenset[str] = frozenset({
+        "ok",
+        "okay",
+        "k",
+        "yes",
+        "yeah",
+        "yep",
+        "sure",
+        "thanks",
+        "thank you",
+        "thx",
+        "got it",
+        "شكرا",
+        "شكرًا",
+        "حسنا",
+        "حسنًا",
+        "تمام",
+        "نعم",
+    })
+    
+    # Trailing punctuation ignored when matching acknowledgements
+    _ACK_STRIP_CHARS = " .!?,;:…،؛؟"
+    
     def __init__(
         self,
         severity_classifier: Optional[PanicSeverityClassifier] = None,
@@ -93,6 +122,17 @@ class ClinicalPipeline:
         self._text_analyzer = TextAnalyzer()
         self._vector_client = vector_client
         
+        # Versions are fixed once components are constructed; share one
+        # read-only mapping across every assessment
+        self._model_versions: Mapping[str, str] = MappingProxyType({
+            "pipeline": self.PIPELINE_VERSION,
+            "severity_classifier": self._classifier.config.version,
+            "emotion_detector": self._emotion.config.version,
+        })
+        
+        # Side-effect tasks (pattern storage) kept off the response path
+        self._bg_tasks: set[asyncio.Task[Any]] = set()
+        
         self._initialized = False
     
     async def initialize(self) -> None:
@@ -119,6 +159,12 @@ class ClinicalPipeline:
     
     async def shutdown(self) -> None:
         """Shutdown and unload models."""
+        # Let in-flight pattern writes finish before tearing down; each
+        # resolves only once its (batched) upsert was written. The vector
+        # client is injected and may be shared, so its owner closes it.
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+        
         await self._classifier.unload()
         await self._emotion.unload()
         await self._embeddings.unload()
@@ -142,7 +188,7 @@ class ClinicalPipeline:
             user_id: User ID
             session_id: Session ID (if in session)
             message_id: Message ID (for tracking)
-            
+        
         Returns:
             ClinicalAssessment contract output
         """
@@ -168,14 +214,23 @@ class ClinicalPipeline:
                 text, user_id, session_id, message_id, text_analysis
             )
         
-        # Step 3: Generate embeddings (for pattern matching and storage)
-        embeddings = await self._embeddings.get_embeddings(text)
+        # Step 2b: Bare acknowledgements ("ok", "thanks") outside an
+        # active session skip the ML models entirely
+        if self._is_low_signal(text, session_id):
+            return self._create_low_signal_assessment(
+                text, user_id, session_id, message_id, text_analysis
+            )
         
-        # Step 4: Severity classification (ML)
-        severity = await self._classifier.predict(text)
+        # Case-fold once for every keyword-based component
+        text_lower = text.casefold()
         
-        # Step 5: Emotion detection (ML)
-        emotion_profile = await self._emotion.detect(text)
+        # Steps 3-5: Embeddings, severity classification and emotion
+        # detection are independent model forwards; run them concurrently
+        embeddings, severity, emotion_profile = await asyncio.gather(
+            self._embeddings.get_embeddings(text),
+            self._classifier.predict(text),
+            self._emotion.detect(text, text_lower=text_lower),
+        )
         
         # Step 6: Extract distress indicators
         distress = self._extract_distress_indicators(text_analysis)
@@ -185,6 +240,7 @@ class ClinicalPipeline:
             text=text,
             user_id=user_id,
             embeddings=embeddings,
+            text_lower=text_lower,
         )
         
         # Step 8: Update session analyzer (if in session)
@@ -227,14 +283,14 @@ class ClinicalPipeline:
             embeddings=embeddings,
         )
         
-        # Step 13: Store pattern for future matching
+        # Step 13: Store pattern for future matching (in background)
         if self._vector_client and embeddings:
-            await self._patterns.store_pattern(
+            self._spawn_background(self._patterns.store_pattern(
                 user_id=user_id,
                 embeddings=embeddings,
                 triggers=triggers.immediate_triggers,
                 severity=severity.predicted_severity.name,
-            )
+            ))
         
         logger.info(
             "Clinical analysis complete",
@@ -263,6 +319,45 @@ class ClinicalPipeline:
             confidence_score=1.0,
         )
     
+    def _is_low_signal(self, text: str, session_id: Optional[UUID]) -> bool:
+        """
+        Check whether input is a bare acknowledgement outside a session.
+        
+        Messages inside an active session always run the full pipeline
+        so the session trajectory only ever holds real assessments.
+        """
+        if session_id is not None and SessionAnalyzerRegistry.get(session_id) is not None:
+            return False
+        normalized = " ".join(text.casefold().split()).strip(self._ACK_STRIP_CHARS)
+        return normalized in self.LOW_SIGNAL_ACKNOWLEDGEMENTS
+    
+    def _create_low_signal_assessment(
+        self,
+        text: str,
+        user_id: UUID,
+        session_id: Optional[UUID],
+        message_id: Optional[UUID],
+        text_analysis,
+    ) -> ClinicalAssessment:
+        """
+        Create assessment for low-signal input without running ML.
+        
+        Nothing is recorded in the session analyzer.
+        """
+        return ClinicalAssessment(
+            user_id=user_id,
+            session_id=session_id,
+            message_id=message_id,
+            severity=SeverityClassification(
+                predicted_severity=PanicSeverity.NONE,
+                confidence=1.0,
+            ),
+            distress_indicators=self._extract_distress_indicators(text_analysis),
+            confidence_score=1.0,
+            raw_text_hash=self._hash_text(text),
+            model_versions=self._get_model_versions(),
+        )
+    
     async def _create_crisis_assessment(
         self,
         text: str,
@@ -283,8 +378,9 @@ class ClinicalPipeline:
             indicators=text_analysis.crisis_indicators,
         )
         
-        # Get embeddings for crisis event storage
-        embeddings = await self._embeddings.get_embeddings(text)
+        # Embed and store the crisis event off the response path
+        if self._vector_client:
+            self._spawn_background(self._store_crisis_pattern(text, user_id))
         
         # Update session if active
         if session_id:
@@ -310,9 +406,27 @@ class ClinicalPipeline:
             uncertainty_flags=["crisis_indicators_detected"],
             raw_text_hash=self._hash_text(text),
             model_versions=self._get_model_versions(),
-            embeddings=embeddings,
         )
     
+    async def _store_crisis_pattern(self, text: str, user_id: UUID) -> None:
+        """Embed crisis text and store it for future pattern matching."""
+        try:
+            embeddings = await self._embeddings.get_embeddings(text)
+            await self._patterns.store_pattern(
+                user_id=user_id,
+                embeddings=embeddings,
+                triggers=[],
+                severity=PanicSeverity.CRITICAL.name,
+            )
+        except Exception as e:
+            logger.error("Failed to store crisis pattern", error=str(e))
+    
+    def _spawn_background(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Run a side-effect coroutine without blocking the caller."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+    
     def _extract_distress_indicators(
         self,
         text_analysis,
@@ -412,16 +526,12 @@ class ClinicalPipeline:
         return flags
     
     def _hash_text(self, text: str) -> str:
-        """Create hash of text for audit trail."""
-        return hashlib.sha256(text.encode()).hexdigest()[:16]
+        """Create hash of text for audit trail (non-cryptographic use)."""
+        return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
     
-    def _get_model_versions(self) -> dict[str, str]:
-        """Get versions of all models used."""
-        return {
-            "pipeline": self.PIPELINE_VERSION,
-            "severity_classifier": self._classifier.config.version,
-            "emotion_detector": self._emotion.config.version,
-        }
+    def _get_model_versions(self) -> Mapping[str, str]:
+        """Get versions of all models used (read-only, shared)."""
+        return self._model_versions
     
     def get_session_metrics(self, session_id: UUID) -> Optional[dict]:
         """
@@ -429,7 +539,7 @@ class ClinicalPipeline:
         
         Args:
             session_id: Session ID
-            
+        
         Returns:
             Session metrics or None
         """
@@ -444,7 +554,7 @@ class ClinicalPipeline:
         
         Args:
             session_id: Session ID
-            
+        
         Returns:
             Final session metrics or None
         """
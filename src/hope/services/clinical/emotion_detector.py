@@ -12,21 +12,36 @@ mapping need clinical validation.
 """
 
 import asyncio
+import string
 from dataclasses import dataclass
-from typing import Optional
+from typing import Hashable, Optional
 
+import numpy as np
 import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+from torch.ao.quantization import quantize_dynamic
+from transformers import AutoModelForSequenceClassification
 
 from hope.domain.models.clinical_output import (
     EmotionCategory,
     EmotionScore,
     EmotionProfile,
 )
+from hope.services.detection.batch_scheduler import BatchScheduler
+from hope.services.detection.executors import (
+    get_inference_executor,
+    get_load_executor,
+)
+from hope.services.detection.inference_cache import InferenceCache
+from hope.services.detection.keyword_matcher import KeywordMatcher
+from hope.services.detection.model_optimization import compile_for_inference
+from hope.services.detection.tokenizer_registry import SharedTokenizer, get_tokenizer
 from hope.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Punctuation stripped from word edges before whole-word marker lookup
+_WORD_PUNCTUATION = string.punctuation + "؟،؛"
+
 
 @dataclass
 class EmotionDetectorConfig:
@@ -44,12 +59,33 @@ class EmotionDetectorConfig:
     # Map generic emotions to panic-relevant categories
     max_length: int = 256
     device: str = "cuda" if torch.cuda.is_available() else "cpu"
+    
+    # Dynamic int8 quantization of Linear layers when running on CPU
+    quantize_on_cpu: bool = True
+    
+    # Optional torch.compile (adds warm-up time at load; falls back to
+    # eager if compilation fails)
+    compile_model: bool = False
+    compile_mode: str = "reduce-overhead"
+    
     version: str = "1.0.0"
     
     # Intensity thresholds
     # CLINICAL_VALIDATION_REQUIRED
     high_intensity_threshold: float = 0.7
     volatility_threshold: float = 0.5
+    
+    # Base prediction cache for repeated utterances
+    cache_size: int = 2048
+    cache_ttl_seconds: float = 300.0
+    
+    # Micro-batching of concurrent requests
+    batch_size: int = 16
+    batch_max_wait_ms: float = 5.0
+    
+    # Token-length buckets; a micro-batch is split so each text is
+    # padded only alongside texts of similar length
+    length_buckets: tuple[int, ...] = (32, 64, 128, 256)
 
 
 class EmotionDetector:
@@ -73,6 +109,12 @@ class EmotionDetector:
         profile = await detector.detect("I feel like I'm going to die")
     """
     
+    # Fixed index order for per-category score vectors
+    CATEGORIES: tuple[EmotionCategory, ...] = tuple(EmotionCategory)
+    CAT_IDX: dict[EmotionCategory, int] = {
+        category: idx for idx, category in enumerate(EmotionCategory)
+    }
+    
     # Mapping from generic emotions to panic-relevant categories
     # CLINICAL_VALIDATION_REQUIRED
     EMOTION_MAPPING: dict[str, list[EmotionCategory]] = {
@@ -119,15 +161,40 @@ class EmotionDetector:
         ],
     }
     
+    # Words that amplify stated emotion (matched as whole words)
+    # CLINICAL_VALIDATION_REQUIRED
+    INTENSITY_MARKERS: frozenset[str] = frozenset({
+        "extremely", "very", "so", "really", "incredibly",
+        "terribly", "absolutely", "completely", "totally",
+        "جداً", "للغاية",  # Arabic: very, extremely
+    })
+    
     def __init__(
         self,
         config: Optional[EmotionDetectorConfig] = None,
     ) -> None:
         """Initialize emotion detector."""
         self.config = config or EmotionDetectorConfig()
-        self._tokenizer: Optional[AutoTokenizer] = None
+        self._keyword_matcher = KeywordMatcher(self.PANIC_EMOTION_KEYWORDS)
+        self._tokenizer: Optional[SharedTokenizer] = None
         self._model: Optional[AutoModelForSequenceClassification] = None
         self._loaded = False
+        self._map_label_ids = np.empty(0, dtype=np.intp)
+        self._map_cat_idxs = np.empty(0, dtype=np.intp)
+        self._host_ids: Optional[torch.Tensor] = None
+        self._host_mask: Optional[torch.Tensor] = None
+        self._device_ids: Optional[torch.Tensor] = None
+        self._device_mask: Optional[torch.Tensor] = None
+        self._prediction_cache: InferenceCache[np.ndarray] = InferenceCache(
+            max_size=self.config.cache_size,
+            ttl_seconds=self.config.cache_ttl_seconds,
+        )
+        self._scheduler: BatchScheduler[np.ndarray] = BatchScheduler(
+            self._infer_batch,
+            max_batch_size=self.config.batch_size,
+            max_wait_ms=self.config.batch_max_wait_ms,
+            executor=get_inference_executor(),
+        )
     
     async def load(self) -> None:
         """Load emotion detection model."""
@@ -139,35 +206,72 @@ class EmotionDetector:
             model=self.config.model_name,
         )
         
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         
         def _load():
-            tokenizer = AutoTokenizer.from_pretrained(self.config.model_name)
+            tokenizer = get_tokenizer(self.config.model_name)
             model = AutoModelForSequenceClassification.from_pretrained(
                 self.config.model_name
             )
             model.to(self.config.device)
             model.eval()
+            if self.config.quantize_on_cpu and self.config.device == "cpu":
+                model = quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            if self.config.compile_model:
+                model = compile_for_inference(
+                    model, tokenizer, self.config.device, self.config.compile_mode
+                )
             return tokenizer, model
         
-        self._tokenizer, self._model = await loop.run_in_executor(None, _load)
+        self._tokenizer, self._model = await loop.run_in_executor(
+            get_load_executor(), _load
+        )
+        self._build_label_tables()
+        self._allocate_buffers()
         self._loaded = True
         logger.info("Emotion detector loaded")
     
+    def _build_label_tables(self) -> None:
+        """
+        Resolve EMOTION_MAPPING against the model's label ids.
+        
+        Produces parallel (label id, category index) arrays so that
+        mapping needs no string lowercasing or dict lookups per call.
+        """
+        id2label = self._model.config.id2label
+        pairs = [
+            (label_id, self.CAT_IDX[category])
+            for label_id in range(len(id2label))
+            for category in self.EMOTION_MAPPING.get(id2label[label_id].lower(), [])
+        ]
+        self._map_label_ids = np.array([p[0] for p in pairs], dtype=np.intp)
+        self._map_cat_idxs = np.array([p[1] for p in pairs], dtype=np.intp)
+    
     async def unload(self) -> None:
         """Unload model."""
+        await self._scheduler.stop()
         self._tokenizer = None
         self._model = None
+        self._host_ids = self._host_mask = None
+        self._device_ids = self._device_mask = None
         self._loaded = False
+        self._prediction_cache.clear()
         if torch.cuda.is_available():
             torch.cuda.empty_cache()
     
-    async def detect(self, text: str) -> EmotionProfile:
+    async def detect(
+        self,
+        text: str,
+        text_lower: Optional[str] = None,
+    ) -> EmotionProfile:
         """
         Detect emotions in text.
         
         Args:
             text: Input text (Arabic or English)
+            text_lower: Precomputed text.casefold(), if the caller has it
             
         Returns:
             EmotionProfile with detected emotions
@@ -178,31 +282,37 @@ class EmotionDetector:
         if not text or not text.strip():
             return EmotionProfile()
         
-        # Get base emotion predictions
-        base_predictions = await self._get_base_predictions(text)
+        # Get base emotion probabilities (indexed by model label id)
+        probs = await self._get_base_predictions(text)
+        
+        # One substring pass finds every category keyword
+        if text_lower is None:
+            text_lower = text.casefold()
+        keyword_hits = self._keyword_matcher.labels_in(text_lower)
         
         # Map to panic-relevant categories
-        panic_emotions = self._map_to_panic_emotions(
-            base_predictions, text
-        )
+        panic_emotions = self._map_to_panic_emotions(probs, keyword_hits)
         
         # Calculate volatility
-        volatility = self._calculate_volatility(base_predictions)
+        volatility = self._calculate_volatility(probs)
+        
+        # Build profile: filter low-confidence, order by confidence (desc)
+        indices = np.flatnonzero(panic_emotions > 0.1)
+        indices = indices[np.argsort(-panic_emotions[indices], kind="stable")]
+        confidences = panic_emotions[indices].astype(np.float64)
+        intensities = self._estimate_intensity(confidences, text)
         
-        # Build profile
         emotion_scores = [
             EmotionScore(
-                category=category,
-                confidence=score,
-                intensity=self._estimate_intensity(score, text, category),
+                category=self.CATEGORIES[idx],
+                confidence=float(confidence),
+                intensity=float(intensity),
+            )
+            for idx, confidence, intensity in zip(
+                indices, confidences, intensities
             )
-            for category, score in panic_emotions.items()
-            if score > 0.1  # Filter low-confidence
         ]
         
-        # Sort by confidence
-        emotion_scores.sort(key=lambda e: e.confidence, reverse=True)
-        
         return EmotionProfile(
             emotions=emotion_scores,
             emotional_volatility=volatility,
@@ -210,125 +320,218 @@ class EmotionDetector:
     
     async def _get_base_predictions(
         self, text: str
-    ) -> dict[str, float]:
-        """Get predictions from base emotion model."""
-        loop = asyncio.get_event_loop()
-        
-        def _inference():
-            inputs = self._tokenizer(
-                text,
-                max_length=self.config.max_length,
-                padding="max_length",
-                truncation=True,
-                return_tensors="pt",
+    ) -> np.ndarray:
+        """
+        Get probabilities from base emotion model (cached per text).
+        
+        Returns:
+            Probabilities indexed by model label id (read-only)
+        """
+        cached = self._prediction_cache.get(text)
+        if cached is not None:
+            return cached
+        
+        probs = await self._scheduler.submit(text)
+        self._prediction_cache.set(text, probs)
+        
+        return probs
+    
+    def _infer_batch(self, texts: list[str]) -> np.ndarray:
+        """
+        Run inference over a micro-batch.
+        
+        Texts are tokenized once without padding, grouped by
+        length bucket, and each group is padded only to its own
+        longest sequence before its forward pass.
+        
+        Returns:
+            Probabilities [batch, num_labels], in input order
+        """
+        encoded = self._tokenizer(
+            texts,
+            max_length=self.config.max_length,
+            truncation=True,
+            return_attention_mask=False,
+        )["input_ids"]
+        
+        probs = np.empty(
+            (len(texts), self._model.config.num_labels), dtype=np.float32
+        )
+        
+        for indices in self._group_by_length(encoded):
+            input_ids, attention_mask = self._pad_group(
+                [encoded[i] for i in indices]
             )
-            inputs = {k: v.to(self.config.device) for k, v in inputs.items()}
             
-            with torch.no_grad():
-                outputs = self._model(**inputs)
-                probs = torch.softmax(outputs.logits, dim=-1)
+            with torch.inference_mode():
+                outputs = self._model(
+                    input_ids=input_ids,
+                    attention_mask=attention_mask,
+                )
+                group_probs = torch.softmax(outputs.logits, dim=-1)
             
-            return probs.cpu().numpy()[0]
+            probs[indices] = group_probs.cpu().numpy()
+        
+        return probs
+    
+    def _group_by_length(
+        self,
+        encoded: list[list[int]],
+    ) -> list[list[int]]:
+        """Group sequence indices by the smallest bucket that fits them."""
+        groups: dict[int, list[int]] = {}
+        for i, ids in enumerate(encoded):
+            bucket = next(
+                (b for b in self.config.length_buckets if len(ids) <= b),
+                self.config.max_length,
+            )
+            groups.setdefault(bucket, []).append(i)
+        return list(groups.values())
+    
+    def _allocate_buffers(self) -> None:
+        """
+        Preallocate input buffers for one full micro-batch.
         
-        probs = await loop.run_in_executor(None, _inference)
+        Buffers are flat so any (rows, width) slice can be viewed as a
+        contiguous 2-D tensor. On CUDA, host staging buffers are pinned
+        and device buffers are allocated once; on CPU they coincide.
+        Reuse is safe because the batch scheduler runs one batch at a
+        time per detector.
+        """
+        capacity = self.config.batch_size * self.config.max_length
+        pin_memory = self.config.device.startswith("cuda")
         
-        # Get label names from model config
-        id2label = self._model.config.id2label
+        self._host_ids = torch.empty(capacity, dtype=torch.long, pin_memory=pin_memory)
+        self._host_mask = torch.empty(capacity, dtype=torch.long, pin_memory=pin_memory)
+        
+        if pin_memory:
+            self._device_ids = torch.empty(
+                capacity, dtype=torch.long, device=self.config.device
+            )
+            self._device_mask = torch.empty(
+                capacity, dtype=torch.long, device=self.config.device
+            )
+        else:
+            self._device_ids = self._host_ids
+            self._device_mask = self._host_mask
+    
+    def _pad_group(
+        self,
+        sequences: list[list[int]],
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Right-pad token id sequences to the longest in the group.
         
-        return {
-            id2label[i].lower(): float(probs[i])
-            for i in range(len(probs))
-        }
+        Writes into the preallocated buffers when the group fits and
+        returns device tensors ready for the forward pass.
+        """
+        rows = len(sequences)
+        width = max(len(ids) for ids in sequences)
+        size = rows * width
+        fits = self._host_ids is not None and size <= self._host_ids.numel()
+        
+        if fits:
+            host_ids = self._host_ids[:size].view(rows, width)
+            host_mask = self._host_mask[:size].view(rows, width)
+        else:
+            host_ids = torch.empty((rows, width), dtype=torch.long)
+            host_mask = torch.empty((rows, width), dtype=torch.long)
+        
+        ids_np = host_ids.numpy()
+        mask_np = host_mask.numpy()
+        ids_np.fill(self._tokenizer.pad_token_id)
+        mask_np.fill(0)
+        
+        for row, ids in enumerate(sequences):
+            ids_np[row, :len(ids)] = ids
+            mask_np[row, :len(ids)] = 1
+        
+        if not fits:
+            return host_ids.to(self.config.device), host_mask.to(self.config.device)
+        
+        if self._device_ids is self._host_ids:
+            return host_ids, host_mask
+        
+        device_ids = self._device_ids[:size].view(rows, width)
+        device_mask = self._device_mask[:size].view(rows, width)
+        device_ids.copy_(host_ids, non_blocking=True)
+        device_mask.copy_(host_mask, non_blocking=True)
+        return device_ids, device_mask
     
     def _map_to_panic_emotions(
         self,
-        base_predictions: dict[str, float],
-        text: str,
-    ) -> dict[EmotionCategory, float]:
+        probs: np.ndarray,
+        keyword_hits: set[Hashable],
+    ) -> np.ndarray:
         """
         Map base emotions to panic-relevant categories.
         
         Combines model predictions with keyword analysis
         for more accurate panic-specific detection.
+        
+        Returns:
+            Scores indexed like CATEGORIES
         """
-        panic_scores: dict[EmotionCategory, float] = {
-            category: 0.0 for category in EmotionCategory
-        }
-        
-        # Apply base emotion mapping
-        for base_emotion, score in base_predictions.items():
-            mapped_categories = self.EMOTION_MAPPING.get(base_emotion, [])
-            for category in mapped_categories:
-                # Take max if multiple sources
-                panic_scores[category] = max(
-                    panic_scores[category],
-                    score
-                )
+        panic_scores = np.zeros(len(self.CATEGORIES), dtype=np.float32)
+        
+        # Apply base emotion mapping (max if multiple sources)
+        np.maximum.at(
+            panic_scores, self._map_cat_idxs, probs[self._map_label_ids]
+        )
         
         # Boost with keyword detection
-        text_lower = text.lower()
-        for category, keywords in self.PANIC_EMOTION_KEYWORDS.items():
-            keyword_found = any(kw in text_lower for kw in keywords)
-            if keyword_found:
+        for category in self.PANIC_EMOTION_KEYWORDS:
+            if category in keyword_hits:
                 # Boost existing score or set minimum
-                current = panic_scores[category]
-                panic_scores[category] = max(current + 0.2, 0.5)
+                idx = self.CAT_IDX[category]
+                panic_scores[idx] = max(panic_scores[idx] + 0.2, 0.5)
         
         # Normalize to [0, 1]
-        max_score = max(panic_scores.values()) if panic_scores else 1.0
-        if max_score > 1.0:
-            panic_scores = {
-                k: v / max_score for k, v in panic_scores.items()
-            }
+        panic_scores /= max(float(panic_scores.max()), 1.0)
         
         return panic_scores
     
     def _estimate_intensity(
         self,
-        confidence: float,
+        confidences: np.ndarray,
         text: str,
-        category: EmotionCategory,
-    ) -> float:
+    ) -> np.ndarray:
         """
-        Estimate emotional intensity.
+        Estimate emotional intensity for all detected categories.
         
-        Considers confidence, text intensity markers,
-        and category-specific patterns.
+        Considers confidence and text intensity markers. The text
+        statistics are computed once and applied to every category
+        as vector operations.
         
         CLINICAL_VALIDATION_REQUIRED: Intensity estimation
         methodology needs clinical validation.
         """
-        base_intensity = confidence
-        
-        # Intensity markers
-        intensity_markers = [
-            "extremely", "very", "so", "really", "incredibly",
-            "terribly", "absolutely", "completely", "totally",
-            "جداً", "للغاية",  # Arabic: very, extremely
-        ]
-        
-        text_lower = text.lower()
+        base_intensity = confidences
+        words = text.split()
         
-        # Boost for intensity markers
-        if any(marker in text_lower for marker in intensity_markers):
-            base_intensity = min(1.0, base_intensity * 1.3)
+        # Boost for intensity markers (whole-word set lookup)
+        if not self.INTENSITY_MARKERS.isdisjoint(
+            w.strip(_WORD_PUNCTUATION).casefold() for w in words
+        ):
+            base_intensity = np.minimum(1.0, base_intensity * 1.3)
         
         # Boost for exclamation marks (urgency indicator)
         exclamation_count = text.count("!")
         if exclamation_count > 0:
-            base_intensity = min(1.0, base_intensity + 0.05 * exclamation_count)
+            base_intensity = np.minimum(
+                1.0, base_intensity + 0.05 * exclamation_count
+            )
         
         # Boost for ALL CAPS
-        words = text.split()
         caps_ratio = sum(1 for w in words if w.isupper()) / max(len(words), 1)
         if caps_ratio > 0.3:
-            base_intensity = min(1.0, base_intensity * 1.2)
+            base_intensity = np.minimum(1.0, base_intensity * 1.2)
         
-        return min(1.0, base_intensity)
+        return np.minimum(1.0, base_intensity)
     
     def _calculate_volatility(
         self,
-        base_predictions: dict[str, float],
+        probs: np.ndarray,
     ) -> float:
         """
         Calculate emotional volatility.
@@ -339,13 +542,11 @@ class EmotionDetector:
         Returns:
             Volatility score (0.0-1.0)
         """
-        scores = list(base_predictions.values())
-        if not scores:
+        if probs.size == 0:
             return 0.0
         
         # Volatility = variance of emotion scores
-        mean = sum(scores) / len(scores)
-        variance = sum((s - mean) ** 2 for s in scores) / len(scores)
+        variance = float(probs.var(dtype=np.float64))
         
         # Normalize to [0, 1] range
         # Max variance for uniform [0,1] is 0.25
@@ -12,15 +12,31 @@ boundaries require clinical dataset and psychologist validation.
 """
 
 import asyncio
+import threading
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
 import torch
 import torch.nn as nn
-from transformers import AutoTokenizer, AutoModel
+from torch.ao.quantization import quantize_dynamic
+from transformers import AutoModel
 
 from hope.domain.enums.panic_severity import PanicSeverity
 from hope.domain.models.clinical_output import SeverityClassification
+from hope.services.detection.batch_scheduler import BatchScheduler
+from hope.services.detection.executors import (
+    get_inference_executor,
+    get_load_executor,
+)
+from hope.services.detection.inference_cache import InferenceCache
+from hope.services.detection.model_registry import get_shared_model
+from hope.services.detection.model_optimization import (
+    compile_module_for_inference,
+    export_onnx_for_inference,
+    trace_for_inference,
+)
+from hope.services.detection.tokenizer_registry import SharedTokenizer, get_tokenizer
 from hope.config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -50,6 +66,38 @@ class ClassifierConfig:
     max_length: int = 256
     device: str = "cuda" if torch.cuda.is_available() else "cpu"
     
+    # Inference backend: "torch", or "onnx" to export the fused model
+    # to ONNX Runtime at load (falls back to torch if unavailable)
+    backend: str = "torch"
+    onnx_path: Optional[str] = None  # App-owned path to keep the export (None: none kept)
+    
+    # Dynamic int8 quantization of Linear layers when running on CPU
+    # (torch backend only)
+    quantize_on_cpu: bool = True
+    
+    # bfloat16 autocast for the unquantized model on AVX-512 CPUs
+    # (only used when quantize_on_cpu is off)
+    bf16_autocast_on_cpu: bool = False
+    
+    # float16 autocast on CUDA (Tensor Cores); weights stay float32
+    fp16_autocast_on_cuda: bool = True
+    
+    # Optional torch.compile of the fused model + head (adds warm-up
+    # time at load; falls back to eager if compilation fails)
+    compile_model: bool = False
+    compile_mode: str = "reduce-overhead"
+    
+    # TorchScript-trace base model + head as one frozen graph
+    # (ignored when compile_model or autocast is in use)
+    torchscript: bool = True
+    
+    # Micro-batching of concurrent predict() calls
+    batch_size: int = 16
+    batch_max_wait_ms: float = 5.0
+    
+    # Token id cache for repeated utterances (0 disables)
+    token_cache_size: int = 1024
+    
     # Model version for tracking
     version: str = "1.0.0"
 
@@ -78,7 +126,7 @@ class SeverityClassificationHead(nn.Module):
         
         Args:
             pooled_output: Pooled transformer output [batch, hidden_size]
-            
+        
         Returns:
             logits: Class logits [batch, num_classes]
         """
@@ -87,6 +135,43 @@ class SeverityClassificationHead(nn.Module):
         return logits
 
 
+class _FusedClassifier(nn.Module):
+    """
+    Base model, [CLS] pooling, classification head and softmax as
+    one module.
+    
+    Gives torch.jit.trace a single graph over the whole forward pass,
+    so the softmax epilogue is fused with the head on device.
+    """
+    
+    def __init__(self, base_model: nn.Module, head: nn.Module) -> None:
+        super().__init__()
+        
+        self.base_model = base_model
+        self.head = head
+    
+    def forward(
+        self,
+        input_ids: torch.Tensor,
+        attention_mask: torch.Tensor,
+    ) -> torch.Tensor:
+        """
+        Forward pass.
+        
+        Args:
+            input_ids: Token ids [batch, seq_len]
+            attention_mask: Attention mask [batch, seq_len]
+        
+        Returns:
+            probs: Class probabilities [batch, num_classes]
+        """
+        outputs = self.base_model(input_ids=input_ids, attention_mask=attention_mask)
+        
+        # Use [CLS] token (first token) as pooled representation
+        logits = self.head(outputs.last_hidden_state[:, 0, :])
+        return torch.softmax(logits, dim=-1)
+
+
 class PanicSeverityClassifier:
     """
     Transformer-based panic severity classifier.
@@ -109,14 +194,14 @@ class PanicSeverityClassifier:
     text and returns structured predictions. No session state.
     """
     
-    # Severity class mapping
-    SEVERITY_CLASSES: list[PanicSeverity] = [
+    # Severity class mapping (index = classifier output column)
+    SEVERITY_CLASSES: tuple[PanicSeverity, ...] = (
         PanicSeverity.NONE,
         PanicSeverity.MILD,
         PanicSeverity.MODERATE,
         PanicSeverity.SEVERE,
         PanicSeverity.CRITICAL,
-    ]
+    )
     
     def __init__(
         self,
@@ -129,10 +214,24 @@ class PanicSeverityClassifier:
             config: Classifier configuration
         """
         self.config = config or ClassifierConfig()
-        self._tokenizer: Optional[AutoTokenizer] = None
+        self._tokenizer: Optional[SharedTokenizer] = None
         self._base_model: Optional[AutoModel] = None
         self._classifier_head: Optional[SeverityClassificationHead] = None
+        self._forward: Optional[Callable[..., torch.Tensor]] = None
+        # Encodings never go stale; the lock is needed because batches
+        # from predict() and predict_batch() tokenize on different threads
+        self._token_cache: InferenceCache[tuple[int, ...]] = InferenceCache(
+            max_size=self.config.token_cache_size,
+            ttl_seconds=float("inf"),
+        )
+        self._token_cache_lock = threading.Lock()
         self._loaded = False
+        self._scheduler: BatchScheduler[np.ndarray] = BatchScheduler(
+            self._infer_batch,
+            max_batch_size=self.config.batch_size,
+            max_wait_ms=self.config.batch_max_wait_ms,
+            executor=get_inference_executor(),
+        )
     
     async def load(self) -> None:
         """
@@ -150,36 +249,150 @@ class PanicSeverityClassifier:
         )
         
         # Load tokenizer and base model in thread pool
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         
-        def _load_models():
-            tokenizer = AutoTokenizer.from_pretrained(self.config.model_name)
+        def _load_base_model() -> nn.Module:
             base_model = AutoModel.from_pretrained(self.config.model_name)
             base_model.to(self.config.device)
             base_model.eval()
-            return tokenizer, base_model
+            base_model.requires_grad_(False)
+            if self._should_quantize():
+                # FBGEMM provides the x86 int8 GEMM kernels
+                if "fbgemm" in torch.backends.quantized.supported_engines:
+                    torch.backends.quantized.engine = "fbgemm"
+                base_model = quantize_dynamic(
+                    base_model, {nn.Linear}, dtype=torch.qint8
+                )
+            return base_model
+        
+        def _load_models():
+            # Instances with the same checkpoint/device/precision share
+            # one copy of the base model weights
+            key = (
+                "panic_severity_base",
+                self.config.model_name,
+                self.config.device,
+                self._should_quantize(),
+            )
+            tokenizer = get_tokenizer(self.config.model_name)
+            return tokenizer, get_shared_model(key, _load_base_model)
         
         self._tokenizer, self._base_model = await loop.run_in_executor(
-            None, _load_models
+            get_load_executor(), _load_models
         )
         
         # Initialize classification head
         self._classifier_head = SeverityClassificationHead(self.config)
         self._classifier_head.to(self.config.device)
         self._classifier_head.eval()
+        self._classifier_head.requires_grad_(False)
         
         # NOTE: In production, load pre-trained weights here
         # self._classifier_head.load_state_dict(torch.load("path/to/weights.pt"))
         # CLINICAL_VALIDATION_REQUIRED: Weights must be trained on clinical data
         
+        # Quantize the head after its weights are in place
+        if self._should_quantize():
+            self._classifier_head = quantize_dynamic(
+                self._classifier_head, {nn.Linear}, dtype=torch.qint8
+            )
+        
+        fused = _FusedClassifier(self._base_model, self._classifier_head).eval()
+        self._forward = await loop.run_in_executor(
+            get_load_executor(), self._build_forward, fused
+        )
+        
         self._loaded = True
-        logger.info("Panic severity classifier loaded")
+        logger.info(
+            "Panic severity classifier loaded",
+            forward=type(self._forward).__name__,
+            quantized=self._should_quantize(),
+            autocast=str(self._autocast_dtype()),
+            quantized_engine=torch.backends.quantized.engine,
+        )
+    
+    def _should_quantize(self) -> bool:
+        """Dynamic int8 quantization applies to CPU torch inference only."""
+        return (
+            self.config.quantize_on_cpu
+            and self.config.device == "cpu"
+            and self.config.backend != "onnx"
+        )
+    
+    def _autocast_dtype(self) -> Optional[torch.dtype]:
+        """
+        Reduced-precision autocast dtype for the forward, if any.
+        
+        float16 on CUDA; bfloat16 on CPU only for the unquantized
+        model on AVX-512 (BF16/AMX) hardware, where it pays off.
+        """
+        if self.config.backend == "onnx":
+            return None
+        if self.config.device.startswith("cuda"):
+            return torch.float16 if self.config.fp16_autocast_on_cuda else None
+        if (
+            self.config.bf16_autocast_on_cpu
+            and self.config.device == "cpu"
+            and not self._should_quantize()
+            and torch.backends.cpu.get_cpu_capability().startswith("AVX512")
+        ):
+            return torch.bfloat16
+        return None
+    
+    def _build_forward(
+        self,
+        fused: _FusedClassifier,
+    ) -> Callable[..., torch.Tensor]:
+        """
+        Pick the fastest available forward for the fused model.
+        
+        ONNX Runtime if configured and exportable, else torch.compile
+        if configured, else a TorchScript trace when autocast is off,
+        else eager.
+        """
+        if self.config.backend == "onnx":
+            example = (
+                torch.ones(1, 16, dtype=torch.long, device=self.config.device),
+            ) * 2
+            onnx_forward = export_onnx_for_inference(
+                fused,
+                example,
+                ("input_ids", "attention_mask"),
+                self.config.onnx_path,
+                self.config.device,
+            )
+            if onnx_forward is not None:
+                return onnx_forward
+        
+        if self.config.compile_model:
+            device = self.config.device
+            warmup = [
+                (torch.ones(1, 8, dtype=torch.long, device=device),) * 2,
+                (torch.ones(2, self.config.max_length, dtype=torch.long, device=device),) * 2,
+            ]
+            return compile_module_for_inference(fused, warmup, self.config.compile_mode)
+        
+        if self.config.torchscript and self._autocast_dtype() is None:
+            return self._trace(fused)
+        return fused
+    
+    def _trace(self, fused: _FusedClassifier) -> nn.Module:
+        """Trace the fused model at max_length; verify on a shorter batch."""
+        device = self.config.device
+        example = (
+            torch.ones(1, self.config.max_length, dtype=torch.long, device=device),
+        ) * 2
+        check = (torch.ones(2, 8, dtype=torch.long, device=device),) * 2
+        return trace_for_inference(fused, example, check_inputs=[check])
     
     async def unload(self) -> None:
         """Unload model to free memory."""
+        await self._scheduler.stop()
         self._tokenizer = None
         self._base_model = None
         self._classifier_head = None
+        self._forward = None
+        self._token_cache.clear()
         self._loaded = False
         
         # Clear CUDA cache if using GPU
@@ -192,7 +405,7 @@ class PanicSeverityClassifier:
         
         Args:
             text: Input text (Arabic or English)
-            
+        
         Returns:
             SeverityClassification with probabilities
         """
@@ -202,69 +415,34 @@ class PanicSeverityClassifier:
         if not text or not text.strip():
             return SeverityClassification(
                 predicted_severity=PanicSeverity.NONE,
-                probabilities={s: 0.0 for s in self.SEVERITY_CLASSES},
+                probabilities=dict.fromkeys(self.SEVERITY_CLASSES, 0.0),
                 confidence=1.0,
                 model_version=self.config.version,
             )
         
-        # Get embeddings and classify
-        loop = asyncio.get_event_loop()
-        
-        def _inference():
-            # Tokenize
-            inputs = self._tokenizer(
-                text,
-                max_length=self.config.max_length,
-                padding="max_length",
-                truncation=True,
-                return_tensors="pt",
-            )
-            inputs = {k: v.to(self.config.device) for k, v in inputs.items()}
-            
-            with torch.no_grad():
-                # Get base model outputs
-                outputs = self._base_model(**inputs)
-                
-                # Use [CLS] token (first token) as pooled representation
-                pooled = outputs.last_hidden_state[:, 0, :]
-                
-                # Get classification logits
-                logits = self._classifier_head(pooled)
-                
-                # Apply softmax for probabilities
-                probs = torch.softmax(logits, dim=-1)
-                
-            return probs.cpu().numpy()[0]
-        
-        probs = await loop.run_in_executor(None, _inference)
-        
-        # Build probability dictionary
-        probabilities = {
-            severity: float(probs[i])
-            for i, severity in enumerate(self.SEVERITY_CLASSES)
-        }
-        
-        # Get predicted class
-        predicted_idx = probs.argmax()
-        predicted_severity = self.SEVERITY_CLASSES[predicted_idx]
-        confidence = float(probs[predicted_idx])
-        
-        result = SeverityClassification(
-            predicted_severity=predicted_severity,
-            probabilities=probabilities,
-            confidence=confidence,
-            model_version=self.config.version,
-        )
+        # Get embeddings and classify (coalesced with concurrent calls)
+        result = self._build_result(await self._scheduler.submit(text))
         
         logger.debug(
             "Severity prediction",
-            predicted=predicted_severity.name,
-            confidence=round(confidence, 3),
+            predicted=result.predicted_severity.name,
+            confidence=round(result.confidence, 3),
             uncertainty=result.uncertainty_flag,
         )
         
         return result
     
+    def _build_result(self, probs: np.ndarray) -> SeverityClassification:
+        """Build a classification from one row of probabilities."""
+        predicted_idx = int(probs.argmax())
+        row = probs.tolist()
+        return SeverityClassification(
+            predicted_severity=self.SEVERITY_CLASSES[predicted_idx],
+            probabilities=dict(zip(self.SEVERITY_CLASSES, row)),
+            confidence=row[predicted_idx],
+            model_version=self.config.version,
+        )
+    
     async def predict_batch(
         self,
         texts: list[str],
@@ -276,7 +454,7 @@ class PanicSeverityClassifier:
         
         Args:
             texts: List of input texts
-            
+        
         Returns:
             List of classifications
         """
@@ -286,47 +464,112 @@ class PanicSeverityClassifier:
         if not texts:
             return []
         
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        all_probs = await loop.run_in_executor(
+            get_inference_executor(), self._infer_length_sorted, texts
+        )
+        
+        # Argmax and confidence for the whole batch in one call each
+        predicted_idxs = all_probs.argmax(axis=1)
+        confidences = all_probs[np.arange(len(all_probs)), predicted_idxs]
+        
+        return [
+            SeverityClassification(
+                predicted_severity=self.SEVERITY_CLASSES[predicted_idx],
+                probabilities=dict(zip(self.SEVERITY_CLASSES, probs.tolist())),
+                confidence=confidence,
+                model_version=self.config.version,
+            )
+            for probs, predicted_idx, confidence in zip(
+                all_probs, predicted_idxs.tolist(), confidences.tolist()
+            )
+        ]
+    
+    def _infer_length_sorted(self, texts: list[str]) -> np.ndarray:
+        """
+        Run inference over an arbitrary number of texts.
+        
+        Texts are sorted by length and run in chunks of batch_size,
+        so each chunk pads only to a length close to its members;
+        results are returned in input order.
+        """
+        order = np.argsort([len(t) for t in texts], kind="stable")
+        probs = np.empty((len(texts), self.config.num_classes), dtype=np.float32)
+        
+        for start in range(0, len(texts), self.config.batch_size):
+            chunk = order[start:start + self.config.batch_size]
+            probs[chunk] = self._infer_batch([texts[i] for i in chunk])
+        
+        return probs
+    
+    def _infer_batch(self, texts: list[str]) -> np.ndarray:
+        """
+        Run one forward pass over a batch of texts.
+        
+        Pads only to the longest text in the batch.
+        
+        Returns:
+            Probabilities [batch, num_classes]
+        """
+        # A plain copy: pinning fresh tensors per batch costs a pinned
+        # allocation plus an extra host copy, more than it saves on
+        # inputs this small
+        inputs = {
+            k: v.to(self.config.device)
+            for k, v in self._pad(self._encode(texts)).items()
+        }
+        
+        autocast_dtype = self._autocast_dtype()
+        with torch.inference_mode(), torch.autocast(
+            device_type=torch.device(self.config.device).type,
+            dtype=autocast_dtype,
+            enabled=autocast_dtype is not None,
+        ):
+            # Probabilities from the traced (or eager) fused forward
+            probs = self._forward(inputs["input_ids"], inputs["attention_mask"])
+        
+        # Argmax/confidence stay on the host: the full distribution is
+        # part of SeverityClassification, so it is transferred anyway.
+        # Upcast so reduced-precision runs report float32 confidences.
+        return probs.float().cpu().numpy()
+    
+    def _encode(self, texts: list[str]) -> list[tuple[int, ...]]:
+        """Token ids per text; only texts not seen recently are tokenized."""
+        with self._token_cache_lock:
+            encoded = [self._token_cache.get(text) for text in texts]
         
-        def _batch_inference():
-            # Tokenize all texts
-            inputs = self._tokenizer(
-                texts,
+        missing = [i for i, ids in enumerate(encoded) if ids is None]
+        if missing:
+            fresh = self._tokenizer(
+                [texts[i] for i in missing],
                 max_length=self.config.max_length,
-                padding="max_length",
                 truncation=True,
-                return_tensors="pt",
-            )
-            inputs = {k: v.to(self.config.device) for k, v in inputs.items()}
+                return_attention_mask=False,
+            )["input_ids"]
             
-            with torch.no_grad():
-                outputs = self._base_model(**inputs)
-                pooled = outputs.last_hidden_state[:, 0, :]
-                logits = self._classifier_head(pooled)
-                probs = torch.softmax(logits, dim=-1)
-                
-            return probs.cpu().numpy()
-        
-        all_probs = await loop.run_in_executor(None, _batch_inference)
-        
-        results = []
-        for probs in all_probs:
-            probabilities = {
-                severity: float(probs[i])
-                for i, severity in enumerate(self.SEVERITY_CLASSES)
-            }
-            predicted_idx = probs.argmax()
-            predicted_severity = self.SEVERITY_CLASSES[predicted_idx]
-            confidence = float(probs[predicted_idx])
-            
-            results.append(SeverityClassification(
-                predicted_severity=predicted_severity,
-                probabilities=probabilities,
-                confidence=confidence,
-                model_version=self.config.version,
-            ))
+            with self._token_cache_lock:
+                for i, ids in zip(missing, fresh):
+                    encoded[i] = tuple(ids)
+                    self._token_cache.set(texts[i], encoded[i])
         
-        return results
+        return encoded
+    
+    def _pad(self, encoded: list[tuple[int, ...]]) -> dict[str, torch.Tensor]:
+        """Right-pad token ids to the longest sequence in the batch."""
+        width = max(len(ids) for ids in encoded)
+        input_ids = np.full(
+            (len(encoded), width), self._tokenizer.pad_token_id, dtype=np.int64
+        )
+        attention_mask = np.zeros((len(encoded), width), dtype=np.int64)
+        
+        for row, ids in enumerate(encoded):
+            input_ids[row, :len(ids)] = ids
+            attention_mask[row, :len(ids)] = 1
+        
+        return {
+            "input_ids": torch.from_numpy(input_ids),
+            "attention_mask": torch.from_numpy(attention_mask),
+        }
     
     def is_loaded(self) -> bool:
         """Check if model is loaded."""
@@ -13,17 +13,32 @@ and clinical interpretations need psychologist input.
 
 import hashlib
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Final, Optional
 from uuid import UUID
 
 from hope.domain.models.clinical_output import TriggerAnalysis
 from hope.infrastructure.vector_db.client import VectorDBClient, VectorSearchResult
+from hope.services.detection.keyword_matcher import KeywordMatcher, WholeWordMatcher
 from hope.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+def _hour_lookup(windows: dict[str, tuple[int, int]]) -> tuple[tuple[str, ...], ...]:
+    """
+    Map each hour of the day to the names of the windows covering it.
+    
+    Windows are [start, end) in hours; start > end wraps midnight.
+    """
+    table: list[list[str]] = [[] for _ in range(24)]
+    for name, (start, end) in windows.items():
+        hours = range(start, end) if start <= end else [*range(start, 24), *range(end)]
+        for hour in hours:
+            table[hour].append(name)
+    return tuple(tuple(names) for names in table)
+
+
 @dataclass
 class PatternMatch:
     """
@@ -105,7 +120,7 @@ class PatternRecognitionEngine:
     
     # Trigger phrase patterns
     # CLINICAL_VALIDATION_REQUIRED
-    TRIGGER_PHRASES: dict[str, list[str]] = {
+    TRIGGER_PHRASES: Final[dict[str, list[str]]] = {
         "work_stress": [
             "work", "job", "boss", "deadline", "meeting",
             "fired", "presentation", "workload",
@@ -143,8 +158,27 @@ class PatternRecognitionEngine:
         ],
     }
     
+    # Context factor markers
+    LOCATION_MARKERS: Final[dict[str, list[str]]] = {
+        "at_home": ["home", "house", "apartment", "room", "bed"],
+        "at_work": ["office", "desk", "workplace", "cubicle"],
+        "in_public": ["outside", "street", "mall", "store", "restaurant"],
+        "in_transit": ["car", "bus", "train", "plane", "driving"],
+    }
+    
+    # Social and activity markers; earlier keys take precedence
+    SOCIAL_MARKERS: Final[dict[str, list[str]]] = {
+        "alone": ["alone", "by myself", "nobody"],
+        "with_others": ["with", "people", "someone"],
+    }
+    
+    ACTIVITY_MARKERS: Final[dict[str, list[str]]] = {
+        "upon_waking": ["woke up", "waking", "morning"],
+        "before_sleep": ["sleep", "bed", "night"],
+    }
+    
     # Temporal patterns to detect
-    TEMPORAL_WINDOWS: dict[str, tuple[int, int]] = {
+    TEMPORAL_WINDOWS: Final[dict[str, tuple[int, int]]] = {
         "early_morning": (4, 7),    # 4 AM - 7 AM
         "morning": (7, 12),          # 7 AM - 12 PM
         "afternoon": (12, 17),       # 12 PM - 5 PM
@@ -153,6 +187,29 @@ class PatternRecognitionEngine:
         "late_night": (0, 4),        # 12 AM - 4 AM
     }
     
+    # TEMPORAL_WINDOWS resolved per hour once, at class creation
+    _HOUR_TO_WINDOWS: Final = _hour_lookup(TEMPORAL_WINDOWS)
+    
+    # Weekdays with their own pattern name
+    _WEEKDAY_PATTERNS: Final[dict[int, str]] = {
+        0: "monday",  # Monday anxiety
+        6: "sunday",  # Sunday scaries
+    }
+    
+    # Matchers and category orders derived from the tables above,
+    # built once at import and shared by every engine instance.
+    # One pass over the text per matcher instead of one per phrase;
+    # context markers are short words, matched whole-word so that
+    # e.g. "car" does not fire on "scared" or "with" on "without"
+    _TRIGGER_MATCHER: Final = KeywordMatcher(TRIGGER_PHRASES)
+    _CONTEXT_MATCHER: Final = WholeWordMatcher(
+        {**LOCATION_MARKERS, **SOCIAL_MARKERS, **ACTIVITY_MARKERS}
+    )
+    _TRIGGER_CATEGORIES: Final = tuple(TRIGGER_PHRASES)
+    _LOCATION_CONTEXTS: Final = tuple(LOCATION_MARKERS)
+    _SOCIAL_CONTEXTS: Final = tuple(SOCIAL_MARKERS)
+    _ACTIVITY_CONTEXTS: Final = tuple(ACTIVITY_MARKERS)
+    
     # How far back to look for patterns
     HISTORY_WINDOW_DAYS: int = 30
     
@@ -184,6 +241,7 @@ class PatternRecognitionEngine:
         user_id: UUID,
         embeddings: Optional[list[float]] = None,
         timestamp: Optional[datetime] = None,
+        text_lower: Optional[str] = None,
     ) -> TriggerAnalysis:
         """
         Analyze text for patterns and triggers.
@@ -193,14 +251,17 @@ class PatternRecognitionEngine:
             user_id: User ID for history lookup
             embeddings: Text embeddings for similarity search
             timestamp: Time of message (for temporal patterns)
-            
+            text_lower: Precomputed text.casefold(), if the caller has it
+        
         Returns:
             TriggerAnalysis with detected patterns
         """
-        timestamp = timestamp or datetime.utcnow()
+        timestamp = timestamp or datetime.now(timezone.utc)
+        if text_lower is None:
+            text_lower = text.casefold()
         
         # Step 1: Immediate trigger detection
-        immediate_triggers = self._detect_immediate_triggers(text)
+        immediate_triggers = self._detect_immediate_triggers(text_lower)
         
         # Step 2: Historical pattern lookup (if vector client available)
         historical_triggers = []
@@ -213,7 +274,7 @@ class PatternRecognitionEngine:
         temporal_patterns = self._detect_temporal_patterns(timestamp)
         
         # Step 4: Context factor extraction
-        context_factors = self._extract_context_factors(text)
+        context_factors = self._extract_context_factors(text_lower)
         
         analysis = TriggerAnalysis(
             immediate_triggers=immediate_triggers,
@@ -230,20 +291,14 @@ class PatternRecognitionEngine:
         
         return analysis
     
-    def _detect_immediate_triggers(self, text: str) -> list[str]:
+    def _detect_immediate_triggers(self, text_lower: str) -> list[str]:
         """
-        Detect triggers in current text.
+        Detect triggers in current (case-folded) text.
         
         Returns list of trigger categories found.
         """
-        text_lower = text.lower()
-        detected = []
-        
-        for category, phrases in self.TRIGGER_PHRASES.items():
-            if any(phrase in text_lower for phrase in phrases):
-                detected.append(category)
-        
-        return detected
+        found = self._TRIGGER_MATCHER.labels_in(text_lower)
+        return [category for category in self._TRIGGER_CATEGORIES if category in found]
     
     async def _find_historical_patterns(
         self,
@@ -264,19 +319,17 @@ class PatternRecognitionEngine:
                 vector=embeddings,
                 top_k=10,
                 filter={"user_id": str(user_id)},
+                min_score=self.SIMILARITY_THRESHOLD,
             )
             
-            # Extract trigger categories from similar past events
-            historical = []
-            for result in results:
-                if result.score >= self.SIMILARITY_THRESHOLD:
-                    # Get triggers from metadata
-                    triggers = result.metadata.get("triggers", [])
-                    historical.extend(triggers)
-            
-            # Deduplicate
-            return list(set(historical))
-            
+            # Extract (deduplicated) trigger categories from similar past events
+            historical = {
+                trigger
+                for result in results
+                for trigger in result.metadata.get("triggers", [])
+            }
+            return list(historical)
+        
         except Exception as e:
             logger.error(f"Historical pattern lookup failed: {e}")
             return []
@@ -290,59 +343,38 @@ class PatternRecognitionEngine:
         
         Returns list of temporal pattern names.
         """
-        hour = timestamp.hour
-        patterns = []
-        
-        # Check time windows
-        for window_name, (start, end) in self.TEMPORAL_WINDOWS.items():
-            if start <= end:
-                if start <= hour < end:
-                    patterns.append(window_name)
-            else:  # Wraps around midnight
-                if hour >= start or hour < end:
-                    patterns.append(window_name)
+        patterns = list(self._HOUR_TO_WINDOWS[timestamp.hour])
         
         # Check day of week
-        day = timestamp.weekday()
-        if day == 0:
-            patterns.append("monday")  # Monday anxiety
-        elif day == 6:
-            patterns.append("sunday")  # Sunday scaries
+        day_pattern = self._WEEKDAY_PATTERNS.get(timestamp.weekday())
+        if day_pattern is not None:
+            patterns.append(day_pattern)
         
         return patterns
     
-    def _extract_context_factors(self, text: str) -> list[str]:
+    def _extract_context_factors(self, text_lower: str) -> list[str]:
         """
-        Extract contextual factors from text.
+        Extract contextual factors from (case-folded) text.
         
-        Identifies situational context that may be relevant.
+        Identifies situational context that may be relevant,
+        matching markers as whole words.
         """
-        factors = []
-        text_lower = text.lower()
+        found = self._CONTEXT_MATCHER.labels_in(text_lower)
         
         # Location context
-        location_markers = {
-            "at_home": ["home", "house", "apartment", "room", "bed"],
-            "at_work": ["office", "desk", "workplace", "cubicle"],
-            "in_public": ["outside", "street", "mall", "store", "restaurant"],
-            "in_transit": ["car", "bus", "train", "plane", "driving"],
-        }
-        
-        for context, markers in location_markers.items():
-            if any(m in text_lower for m in markers):
-                factors.append(context)
+        factors = [context for context in self._LOCATION_CONTEXTS if context in found]
         
         # Social context
-        if any(w in text_lower for w in ["alone", "by myself", "nobody"]):
-            factors.append("alone")
-        elif any(w in text_lower for w in ["with", "people", "someone"]):
-            factors.append("with_others")
+        for context in self._SOCIAL_CONTEXTS:
+            if context in found:
+                factors.append(context)
+                break
         
         # Activity context
-        if any(w in text_lower for w in ["woke up", "waking", "morning"]):
-            factors.append("upon_waking")
-        elif any(w in text_lower for w in ["sleep", "bed", "night"]):
-            factors.append("before_sleep")
+        for context in self._ACTIVITY_CONTEXTS:
+            if context in found:
+                factors.append(context)
+                break
         
         return factors
     
@@ -363,7 +395,7 @@ class PatternRecognitionEngine:
             triggers: Detected trigger categories
             severity: Severity classification
             timestamp: Time of event
-            
+        
         Returns:
             True if stored successfully
         """
@@ -371,17 +403,18 @@ class PatternRecognitionEngine:
             logger.warning("No vector client, pattern not stored")
             return False
         
-        timestamp = timestamp or datetime.utcnow()
+        timestamp = timestamp or datetime.now(timezone.utc)
+        timestamp_iso = timestamp.isoformat()
         
         # Generate unique ID
-        id_string = f"{user_id}:{timestamp.isoformat()}"
-        pattern_id = hashlib.md5(id_string.encode()).hexdigest()
+        id_string = f"{user_id}:{timestamp_iso}"
+        pattern_id = hashlib.blake2b(id_string.encode(), digest_size=16).hexdigest()
         
         metadata = {
             "user_id": str(user_id),
             "triggers": triggers,
             "severity": severity,
-            "timestamp": timestamp.isoformat(),
+            "timestamp": timestamp_iso,
             "hour": timestamp.hour,
             "day_of_week": timestamp.weekday(),
         }
@@ -401,7 +434,7 @@ class PatternRecognitionEngine:
                 )
             
             return success
-            
+        
         except Exception as e:
             logger.error(f"Failed to store pattern: {e}")
             return False
@@ -11,6 +11,10 @@ CLINICAL_VALIDATION_REQUIRED: Metric definitions and
 effectiveness calculations need clinical validation.
 """
 
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
@@ -26,8 +30,17 @@ from hope.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Underlying stdlib logger, for cheap level checks on hot paths
+_stdlib_logger = logging.getLogger(__name__)
 
-@dataclass
+# Severity thresholds as plain ints; reading a member off the enum
+# class costs several times more than the IntEnum comparison itself
+_MODERATE = int(PanicSeverity.MODERATE)
+_SEVERE = int(PanicSeverity.SEVERE)
+_CRITICAL = int(PanicSeverity.CRITICAL)
+
+
+@dataclass(slots=True)
 class SessionState:
     """
     Current state of the session being analyzed.
@@ -38,6 +51,8 @@ class SessionState:
         current_severity: Current severity classification
         is_escalating: Whether intensity is increasing
         trend_direction: Up, down, or stable
+        start_intensity: Intensity of the first message
+        high_intensity_streak: Consecutive latest messages at high intensity
     """
     
     message_count: int = 0
@@ -45,6 +60,8 @@ class SessionState:
     current_severity: PanicSeverity = PanicSeverity.NONE
     is_escalating: bool = False
     trend_direction: str = "stable"
+    start_intensity: Optional[float] = None
+    high_intensity_streak: int = 0
     
     def to_dict(self) -> dict:
         return {
@@ -84,6 +101,12 @@ class SessionAnalyzer:
     # Escalation threshold
     ESCALATION_THRESHOLD: float = 0.2
     
+    # Sustained high intensity: this many consecutive messages at or
+    # above this intensity trigger escalation
+    # CLINICAL_VALIDATION_REQUIRED
+    SUSTAINED_HIGH_INTENSITY: float = 0.7
+    SUSTAINED_HIGH_MESSAGES: int = 3
+    
     def __init__(
         self,
         session_id: UUID,
@@ -98,7 +121,10 @@ class SessionAnalyzer:
         """
         self._session_id = session_id
         self._user_id = user_id
+        # One wall-clock read per session; later times are derived from
+        # the monotonic clock, which is also immune to clock jumps
         self._started_at = datetime.utcnow()
+        self._started_at_ns = time.monotonic_ns()
         
         self._metrics = SessionMetrics(
             session_id=session_id,
@@ -106,6 +132,8 @@ class SessionAnalyzer:
             started_at=self._started_at,
         )
         self._state = SessionState()
+        # Last TREND_WINDOW intensities, for O(1) trend updates
+        self._trend_window: deque[float] = deque(maxlen=self.TREND_WINDOW)
     
     def record_message(
         self,
@@ -120,21 +148,30 @@ class SessionAnalyzer:
             intensity: Panic intensity (0.0-1.0)
             severity: Severity classification
             intervention: Intervention applied (if any)
-            
+        
         Returns:
             Updated session state
         """
         # Add data point
-        self._metrics.add_data_point(
+        message_count = self._metrics.add_data_point(
             intensity=intensity,
             severity=severity,
             intervention=intervention,
+            offset_us=self.elapsed_ns() // 1000,
         )
         
-        # Update state
-        self._state.message_count = len(self._metrics.intensity_trajectory)
-        self._state.current_intensity = intensity
-        self._state.current_severity = severity
+        # Update state (running aggregates, so no trajectory rescans)
+        state = self._state
+        state.message_count = message_count
+        state.current_intensity = intensity
+        state.current_severity = severity
+        self._trend_window.append(intensity)
+        if state.start_intensity is None:
+            state.start_intensity = intensity
+        if intensity >= self.SUSTAINED_HIGH_INTENSITY:
+            state.high_intensity_streak += 1
+        else:
+            state.high_intensity_streak = 0
         
         # Calculate trend
         self._update_trend()
@@ -142,36 +179,29 @@ class SessionAnalyzer:
         # Check for escalation
         self._check_escalation()
         
-        logger.debug(
-            "Session message recorded",
-            session_id=str(self._session_id),
-            intensity=round(intensity, 3),
-            trend=self._state.trend_direction,
-        )
+        # Skip argument formatting when debug logging is off
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Session message recorded",
+                session_id=str(self._session_id),
+                intensity=round(intensity, 3),
+                trend=self._state.trend_direction,
+            )
         
         return self._state
     
     def _update_trend(self) -> None:
         """Calculate intensity trend direction."""
-        trajectory = self._metrics.intensity_trajectory
-        
-        if len(trajectory) < 2:
-            self._state.trend_direction = "stable"
-            return
+        window = self._trend_window
         
         # Look at last N data points
-        window = trajectory[-self.TREND_WINDOW:]
-        
-        if len(window) < 2:
+        n = len(window)
+        if n < 2:
             self._state.trend_direction = "stable"
             return
         
-        # Calculate average change
-        changes = [
-            window[i].intensity - window[i-1].intensity
-            for i in range(1, len(window))
-        ]
-        avg_change = sum(changes) / len(changes)
+        # Average of consecutive changes telescopes to (last - first) / steps
+        avg_change = (window[-1] - window[0]) / (n - 1)
         
         if avg_change > 0.05:
             self._state.trend_direction = "increasing"
@@ -182,24 +212,19 @@ class SessionAnalyzer:
     
     def _check_escalation(self) -> None:
         """Check if intensity is escalating."""
-        trajectory = self._metrics.intensity_trajectory
+        state = self._state
         
-        if len(trajectory) < 2:
-            self._state.is_escalating = False
+        # An increasing trend needs at least two messages, so this also
+        # covers the single-message case
+        if state.trend_direction != "increasing":
+            state.is_escalating = False
             return
         
         # Compare current to start
-        start_intensity = trajectory[0].intensity
-        current = self._state.current_intensity
-        
-        increase = current - start_intensity
-        
-        self._state.is_escalating = (
-            increase > self.ESCALATION_THRESHOLD and
-            self._state.trend_direction == "increasing"
-        )
+        increase = state.current_intensity - state.start_intensity
+        state.is_escalating = increase > self.ESCALATION_THRESHOLD
         
-        if self._state.is_escalating:
+        if state.is_escalating:
             self._metrics.escalation_occurred = True
     
     def mark_intervention(
@@ -214,18 +239,27 @@ class SessionAnalyzer:
         Args:
             intervention_type: Type of intervention
         """
-        if not self._metrics.intensity_trajectory:
+        metrics = self._metrics
+        if not metrics.total_messages:
             return
         
-        latest = self._metrics.intensity_trajectory[-1]
-        
+        # final_intensity is the latest recorded intensity
         record = InterventionRecord(
             intervention_type=intervention_type,
-            applied_at=datetime.utcnow(),
-            intensity_before=latest.intensity,
+            applied_at=self._now(),
+            intensity_before=metrics.final_intensity,
         )
         
-        self._metrics.interventions.append(record)
+        metrics.interventions.append(record)
+        metrics.mark_interventions_changed()
+    
+    def elapsed_ns(self) -> int:
+        """Nanoseconds since the session analyzer was created."""
+        return time.monotonic_ns() - self._started_at_ns
+    
+    def _now(self) -> datetime:
+        """Current time on the session clock (naive UTC, like the metrics)."""
+        return self._started_at + timedelta(microseconds=self.elapsed_ns() // 1000)
     
     def get_state(self) -> SessionState:
         """Get current session state."""
@@ -258,20 +292,16 @@ class SessionAnalyzer:
         - Escalation trend
         - Duration at high intensity
         """
-        if self._state.current_severity >= PanicSeverity.CRITICAL:
+        severity = self._state.current_severity
+        
+        if severity >= _CRITICAL:
             return True
         
-        if self._state.is_escalating and self._state.current_severity >= PanicSeverity.SEVERE:
+        if self._state.is_escalating and severity >= _SEVERE:
             return True
         
         # Check sustained high intensity
-        trajectory = self._metrics.intensity_trajectory
-        if len(trajectory) >= 3:
-            recent = trajectory[-3:]
-            if all(p.intensity >= 0.7 for p in recent):
-                return True
-        
-        return False
+        return self._state.high_intensity_streak >= self.SUSTAINED_HIGH_MESSAGES
     
     def get_recommended_strategy(self) -> Optional[str]:
         """
@@ -289,7 +319,7 @@ class SessionAnalyzer:
         if self._state.trend_direction == "decreasing":
             return "continue_current"
         
-        if self._state.current_severity >= PanicSeverity.MODERATE:
+        if self._state.current_severity >= _MODERATE:
             # Check what's worked before
             effective = self._metrics.get_most_effective_intervention()
             if effective:
@@ -306,25 +336,28 @@ class SessionAnalyzer:
         
         Args:
             summary: Optional session summary
-            
+        
         Returns:
             Final session metrics
         """
+        metrics = self._metrics
+        
         # Update final intervention effectiveness
-        if self._metrics.interventions:
-            last = self._metrics.interventions[-1]
-            if last.intensity_after is None and self._metrics.intensity_trajectory:
-                last.intensity_after = self._metrics.intensity_trajectory[-1].intensity
+        if metrics.interventions:
+            last = metrics.interventions[-1]
+            if last.intensity_after is None and metrics.total_messages:
+                last.intensity_after = metrics.final_intensity
                 last.was_effective = last.intensity_after < last.intensity_before
+                metrics.mark_interventions_changed()
         
         logger.info(
             "Session analysis finalized",
             session_id=str(self._session_id),
-            peak_intensity=round(self._metrics.peak_intensity, 3),
-            was_successful=self._metrics.was_session_successful(),
+            peak_intensity=round(metrics.peak_intensity, 3),
+            was_successful=metrics.was_session_successful(),
         )
         
-        return self._metrics
+        return metrics
 
 
 class SessionAnalyzerRegistry:
@@ -332,9 +365,29 @@ class SessionAnalyzerRegistry:
     Registry for active session analyzers.
     
     Provides singleton-like access to analyzers by session ID.
+    
+    Bounded LRU: analyzers are ordered by last access and the least
+    recently used one is evicted beyond MAX_SESSIONS, so sessions
+    that never call remove() cannot leak. Analyzers idle for longer
+    than SESSION_TTL_SECONDS are dropped on the next get_or_create
+    (expired entries sit at the front, so this costs O(expired));
+    remove_expired() applies any other TTL on demand.
+    
+    A single lock guards the map. Callers run on the event loop
+    (or, for sync routes, a thread pool under the GIL), so the
+    lock is effectively uncontended and sharding it would not
+    reduce any contention.
     """
     
-    _analyzers: dict[UUID, SessionAnalyzer] = {}
+    # Upper bound on tracked sessions
+    MAX_SESSIONS: int = 10_000
+    
+    # Idle time after which an analyzer is dropped
+    SESSION_TTL_SECONDS: float = 3600.0
+    
+    # Session ID -> (analyzer, monotonic time of last access)
+    _analyzers: OrderedDict[UUID, tuple[SessionAnalyzer, float]] = OrderedDict()
+    _lock = threading.Lock()
     
     @classmethod
     def get_or_create(
@@ -343,24 +396,76 @@ class SessionAnalyzerRegistry:
         user_id: UUID,
     ) -> SessionAnalyzer:
         """Get existing analyzer or create new one."""
-        if session_id not in cls._analyzers:
-            cls._analyzers[session_id] = SessionAnalyzer(
-                session_id=session_id,
-                user_id=user_id,
-            )
-        return cls._analyzers[session_id]
+        now = time.monotonic()
+        
+        with cls._lock:
+            entry = cls._analyzers.get(session_id)
+            if entry is None:
+                analyzer = SessionAnalyzer(
+                    session_id=session_id,
+                    user_id=user_id,
+                )
+            else:
+                analyzer = entry[0]
+            
+            cls._analyzers[session_id] = (analyzer, now)
+            cls._analyzers.move_to_end(session_id)
+            
+            cls._remove_idle_locked(now - cls.SESSION_TTL_SECONDS)
+            
+            while len(cls._analyzers) > cls.MAX_SESSIONS:
+                evicted_id, _ = cls._analyzers.popitem(last=False)
+                logger.warning(
+                    "Session analyzer evicted",
+                    session_id=str(evicted_id),
+                )
+            
+            return analyzer
     
     @classmethod
     def get(cls, session_id: UUID) -> Optional[SessionAnalyzer]:
         """Get analyzer if exists."""
-        return cls._analyzers.get(session_id)
+        entry = cls._analyzers.get(session_id)
+        return entry[0] if entry is not None else None
     
     @classmethod
     def remove(cls, session_id: UUID) -> Optional[SessionAnalyzer]:
         """Remove and return analyzer."""
-        return cls._analyzers.pop(session_id, None)
+        with cls._lock:
+            entry = cls._analyzers.pop(session_id, None)
+        return entry[0] if entry is not None else None
+    
+    @classmethod
+    def remove_expired(cls, ttl_seconds: float) -> int:
+        """
+        Remove analyzers not accessed within ttl_seconds.
+        
+        Args:
+            ttl_seconds: Maximum idle time
+        
+        Returns:
+            Number of analyzers removed
+        """
+        with cls._lock:
+            return cls._remove_idle_locked(time.monotonic() - ttl_seconds)
+    
+    @classmethod
+    def _remove_idle_locked(cls, cutoff: float) -> int:
+        """Remove analyzers last accessed before cutoff; caller holds the lock."""
+        removed = 0
+        
+        # Ordered by last access, so expired entries are at the front
+        while cls._analyzers:
+            session_id, (_, last_used) = next(iter(cls._analyzers.items()))
+            if last_used >= cutoff:
+                break
+            del cls._analyzers[session_id]
+            removed += 1
+        
+        return removed
     
     @classmethod
     def clear(cls) -> None:
         """Clear all analyzers."""
-        cls._analyzers.clear()
+        with cls._lock:
+            cls._analyzers.clear()
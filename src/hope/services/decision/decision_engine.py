@@ -11,9 +11,10 @@ CLINICAL_REVIEW_REQUIRED: Decision rules and intervention mappings
 require clinical validation before production deployment.
 """
 
+import logging
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Optional, Union
+from typing import NamedTuple, Optional, Sequence, Union
 from uuid import UUID
 
 from hope.domain.enums.panic_severity import PanicSeverity, UrgencyLevel
@@ -26,6 +27,18 @@ from hope.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Underlying stdlib logger, for cheap level checks on hot paths
+_stdlib_logger = logging.getLogger(__name__)
+
+# Value -> member lookups; dict.get avoids EnumMeta.__call__ and the
+# ValueError raised for unknown values
+_INTERVENTION_BY_VALUE: dict[str, PanicIntervention] = {
+    intervention.value: intervention for intervention in PanicIntervention
+}
+_TRIGGER_BY_VALUE: dict[str, PanicTrigger] = {
+    trigger.value: trigger for trigger in PanicTrigger
+}
+
 
 class ResponseStrategy(StrEnum):
     """
@@ -68,7 +81,7 @@ class ResponseTone(StrEnum):
     """Urgent but not alarming tone."""
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionContext:
     """
     Context for decision making.
@@ -109,7 +122,7 @@ class DecisionContext:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     """
     Decision output from the engine.
@@ -131,8 +144,8 @@ class Decision:
     strategy: ResponseStrategy
     tone: ResponseTone
     primary_intervention: Optional[PanicIntervention] = None
-    secondary_interventions: list[PanicIntervention] = field(default_factory=list)
-    response_constraints: list[str] = field(default_factory=list)
+    secondary_interventions: tuple[PanicIntervention, ...] = ()
+    response_constraints: Sequence[str] = ()
     prompt_modifiers: dict = field(default_factory=dict)
     escalate_to_crisis: bool = False
     require_consent_check: bool = False
@@ -147,6 +160,84 @@ class Decision:
         }
 
 
+class _SeverityProfile(NamedTuple):
+    """Everything decide() derives from severity alone."""
+    
+    strategy: ResponseStrategy
+    tone: ResponseTone
+    interventions: tuple[PanicIntervention, ...]
+    constraints: tuple[str, ...]
+    escalate: bool
+
+
+def _severity_table(
+    strategies: dict[PanicSeverity, ResponseStrategy],
+    tones: dict[PanicSeverity, ResponseTone],
+    interventions: dict[PanicSeverity, list[PanicIntervention]],
+    constraints: dict[PanicSeverity, tuple[str, ...]],
+) -> tuple[_SeverityProfile, ...]:
+    """
+    Fuse the per-severity mappings into one table indexed by severity.
+    
+    PanicSeverity is an IntEnum numbered 0..N-1, so the table is a
+    plain tuple and interventions are frozen as tuples. Evaluating the
+    severity rules here leaves decide() with a single lookup.
+    """
+    return tuple(
+        _SeverityProfile(
+            strategy=strategies[severity],
+            tone=tones[severity],
+            interventions=tuple(interventions[severity]),
+            constraints=constraints[severity],
+            # Professional referral from SEVERE upwards
+            escalate=severity >= PanicSeverity.SEVERE,
+        )
+        for severity in sorted(PanicSeverity)
+    )
+
+
+def _move_to_front(
+    interventions: tuple[PanicIntervention, ...],
+    first: PanicIntervention,
+) -> tuple[PanicIntervention, ...]:
+    """Reorder so first leads; returns interventions itself if already so or absent."""
+    if not interventions or interventions[0] is first or first not in interventions:
+        return interventions
+    return (first, *(i for i in interventions if i is not first))
+
+
+def _constraints_by_severity(
+    universal: tuple[str, ...],
+) -> dict[PanicSeverity, tuple[str, ...]]:
+    """
+    Build the full response constraint tuple for every severity.
+    
+    CLINICAL_REVIEW_REQUIRED: Severity-specific constraints.
+    """
+    table: dict[PanicSeverity, tuple[str, ...]] = {}
+    
+    for severity in PanicSeverity:
+        constraints = universal
+        
+        if severity >= PanicSeverity.MODERATE:
+            constraints = (
+                *constraints,
+                "Keep response focused and concise",
+                "Avoid lengthy explanations during crisis",
+            )
+        
+        if severity >= PanicSeverity.SEVERE:
+            constraints = (
+                *constraints,
+                "Include option for professional help",
+                "Use simple, clear language",
+            )
+        
+        table[severity] = constraints
+    
+    return table
+
+
 class DecisionEngine:
     """
     Decision engine for response strategy selection.
@@ -208,14 +299,33 @@ class DecisionEngine:
     }
     
     # Universal response constraints
-    UNIVERSAL_CONSTRAINTS: list[str] = [
+    UNIVERSAL_CONSTRAINTS: tuple[str, ...] = (
         "NEVER provide medical diagnosis",
         "NEVER prescribe medication or dosages",
         "NEVER claim to be a replacement for professional help",
         "NEVER minimize user's experience",
         "ALWAYS validate user's feelings",
         "ALWAYS use trauma-informed language",
-    ]
+    )
+    
+    # Final constraints per severity and for the crisis path; shared
+    # immutable tuples, so decisions never copy them
+    _CONSTRAINTS_BY_SEVERITY = _constraints_by_severity(UNIVERSAL_CONSTRAINTS)
+    _CRISIS_CONSTRAINTS: tuple[str, ...] = (
+        *UNIVERSAL_CONSTRAINTS,
+        "MUST provide crisis hotline number",
+        "MUST recommend immediate professional help",
+        "Response MUST be clear and actionable",
+    )
+    
+    # Severity profile per severity, built once from the mappings above;
+    # indexed directly by PanicSeverity
+    _SEVERITY_TABLE = _severity_table(
+        SEVERITY_STRATEGY,
+        SEVERITY_TONE,
+        SEVERITY_INTERVENTIONS,
+        _CONSTRAINTS_BY_SEVERITY,
+    )
     
     def __init__(self) -> None:
         """Initialize decision engine."""
@@ -230,7 +340,7 @@ class DecisionEngine:
         
         Args:
             context: Decision context with clinical assessment
-            
+        
         Returns:
             Decision with strategy and interventions
         """
@@ -241,40 +351,34 @@ class DecisionEngine:
         if assessment.requires_crisis_protocol:
             return self._crisis_decision(context)
         
-        # Rule 2: Select strategy based on severity
-        strategy = self.SEVERITY_STRATEGY[severity]
-        tone = self.SEVERITY_TONE[severity]
+        # Rule 2: Select strategy based on severity; the profile also
+        # carries the severity-only outcomes of rules 5 and 7
+        profile = self._SEVERITY_TABLE[severity]
+        strategy = profile.strategy
+        
+        immediate_triggers = assessment.trigger_analysis.immediate_triggers
         
-        # Rule 3: Adjust tone based on emotion profile
-        tone = self._adjust_tone_for_emotions(tone, assessment)
+        # Rules 3 and 6: Adjust tone and build prompt modifiers in one
+        # pass over the assessment
+        tone, modifiers = self._apply_clinical_context(
+            profile.tone, context, severity, immediate_triggers
+        )
         
         # Rule 4: Select interventions based on triggers
-        triggers = [
-            PanicTrigger.UNKNOWN  # Base trigger
-        ]
-        for trigger in assessment.trigger_analysis.immediate_triggers:
-            try:
-                triggers.append(PanicTrigger(trigger))
-            except ValueError:
-                pass
+        triggers = {
+            PanicTrigger.UNKNOWN,  # Base trigger
+            *map(_TRIGGER_BY_VALUE.get, immediate_triggers),
+        }
+        triggers.discard(None)
         
         interventions = self._select_interventions(
-            severity,
+            profile.interventions,
             context.last_intervention_used,
             triggers,
         )
         
         primary = interventions[0] if interventions else None
-        secondary = interventions[1:] if len(interventions) > 1 else []
-        
-        # Rule 5: Build constraints
-        constraints = self._build_constraints(severity)
-        
-        # Rule 6: Build prompt modifiers from clinical assessment
-        modifiers = self._build_clinical_modifiers(context)
-        
-        # Rule 7: Determine if professional referral needed
-        escalate = severity >= PanicSeverity.SEVERE
+        secondary = interventions[1:]
         
         # Rule 8: Flag for human review if uncertain
         require_consent = assessment.requires_human_review
@@ -284,71 +388,75 @@ class DecisionEngine:
             tone=tone,
             primary_intervention=primary,
             secondary_interventions=secondary,
-            response_constraints=constraints,
+            response_constraints=profile.constraints,
             prompt_modifiers=modifiers,
-            escalate_to_crisis=escalate,
+            escalate_to_crisis=profile.escalate,
             require_consent_check=require_consent,
         )
         
-        logger.debug(
-            "Decision made from clinical assessment",
-            strategy=strategy.value,
-            severity=severity.name,
-            confidence=round(assessment.confidence_score, 3),
-        )
+        # Skip argument formatting when debug logging is off
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Decision made from clinical assessment",
+                strategy=strategy.value,
+                severity=severity.name,
+                confidence=round(assessment.confidence_score, 3),
+            )
         
         return decision
     
-    def _adjust_tone_for_emotions(
+    def _apply_clinical_context(
         self,
         base_tone: ResponseTone,
-        assessment: ClinicalAssessment,
-    ) -> ResponseTone:
-        """
-        Adjust communication tone based on emotion profile.
-        
-        CLINICAL_REVIEW_REQUIRED: Tone adjustments need validation.
+        context: DecisionContext,
+        severity: PanicSeverity,
+        immediate_triggers: list[str],
+    ) -> tuple[ResponseTone, dict]:
         """
-        emotion_profile = assessment.emotion_profile
+        Adjust tone and build prompt modifiers in a single pass.
         
-        if not emotion_profile.dominant_emotion:
-            return base_tone
+        Each assessment attribute is read once and feeds both outputs.
         
-        # Dissociation requires more grounded, direct communication
-        if emotion_profile.dominant_emotion == EmotionCategory.DISSOCIATION:
-            return ResponseTone.DIRECT
-        
-        # Loss of control benefits from calm reassurance
-        if emotion_profile.dominant_emotion == EmotionCategory.LOSS_OF_CONTROL:
-            return ResponseTone.CALM
+        CLINICAL_REVIEW_REQUIRED: Tone adjustments need validation.
         
-        # High volatility needs steady tone
-        if emotion_profile.emotional_volatility > 0.7:
-            return ResponseTone.CALM
+        Args:
+            base_tone: Tone selected from severity
+            context: Decision context with clinical assessment
+            severity: Predicted severity
+            immediate_triggers: Raw trigger values from the assessment
         
-        return base_tone
-    
-    def _build_clinical_modifiers(
-        self,
-        context: DecisionContext,
-    ) -> dict:
-        """Build prompt modifiers from clinical assessment."""
+        Returns:
+            Tuple of (adjusted tone, prompt modifiers)
+        """
         assessment = context.clinical_assessment
+        emotion_profile = assessment.emotion_profile
+        dominant_emotion = emotion_profile.dominant_emotion
         
         modifiers = {
-            "severity_level": assessment.severity.predicted_severity.name,
+            "severity_level": severity.name,
             "confidence_score": assessment.confidence_score,
             "session_message_count": context.session_message_count,
             "is_recurring": context.previous_panic_count > 0,
         }
         
-        # Include emotion context
-        if assessment.emotion_profile.dominant_emotion:
-            modifiers["dominant_emotion"] = assessment.emotion_profile.dominant_emotion.value
+        tone = base_tone
+        if dominant_emotion:
+            # Include emotion context
+            modifiers["dominant_emotion"] = dominant_emotion.value
+            
+            if dominant_emotion == EmotionCategory.DISSOCIATION:
+                # Dissociation requires more grounded, direct communication
+                tone = ResponseTone.DIRECT
+            elif dominant_emotion == EmotionCategory.LOSS_OF_CONTROL:
+                # Loss of control benefits from calm reassurance
+                tone = ResponseTone.CALM
+            elif emotion_profile.emotional_volatility > 0.7:
+                # High volatility needs steady tone
+                tone = ResponseTone.CALM
         
         # Include trigger context
-        if assessment.trigger_analysis.immediate_triggers:
-            modifiers["triggers"] = assessment.trigger_analysis.immediate_triggers
+        if immediate_triggers:
+            modifiers["triggers"] = immediate_triggers
         
         # Include distress level
         modifiers["distress_level"] = assessment.distress_indicators.overall_distress_level
@@ -357,14 +465,14 @@ class DecisionEngine:
         if assessment.uncertainty_flags:
             modifiers["has_uncertainty"] = True
         
-        return modifiers
+        return tone, modifiers
     
     def _default_decision(self) -> Decision:
         """Create default decision for no detection."""
         return Decision(
             strategy=ResponseStrategy.CHECK_IN,
             tone=ResponseTone.WARM,
-            response_constraints=self.UNIVERSAL_CONSTRAINTS,
+            response_constraints=self._CONSTRAINTS_BY_SEVERITY[PanicSeverity.NONE],
         )
     
     def _crisis_decision(self, context: DecisionContext) -> Decision:
@@ -383,16 +491,11 @@ class DecisionEngine:
             strategy=ResponseStrategy.CRISIS,
             tone=ResponseTone.DIRECT,
             primary_intervention=PanicIntervention.CRISIS_RESOURCES,
-            secondary_interventions=[
+            secondary_interventions=(
                 PanicIntervention.GROUNDING_TECHNIQUE,
                 PanicIntervention.PROFESSIONAL_REFERRAL,
-            ],
-            response_constraints=[
-                *self.UNIVERSAL_CONSTRAINTS,
-                "MUST provide crisis hotline number",
-                "MUST recommend immediate professional help",
-                "Response MUST be clear and actionable",
-            ],
+            ),
+            response_constraints=self._CRISIS_CONSTRAINTS,
             prompt_modifiers={
                 "include_crisis_hotline": True,
                 "include_emergency_grounding": True,
@@ -402,56 +505,37 @@ class DecisionEngine:
     
     def _select_interventions(
         self,
-        severity: PanicSeverity,
+        base_interventions: tuple[PanicIntervention, ...],
         last_intervention: Optional[str],
-        triggers: list[PanicTrigger],
-    ) -> list[PanicIntervention]:
+        triggers: set[PanicTrigger],
+    ) -> Sequence[PanicIntervention]:
         """
         Select appropriate interventions.
         
         Considers severity, what worked before, and triggers.
         
         Args:
-            severity: Panic severity
+            base_interventions: Interventions for the severity, in order
             last_intervention: Last intervention that helped
             triggers: Detected triggers
-            
+        
         Returns:
-            Ordered list of interventions
+            Ordered interventions; base_interventions itself when no
+            reordering applies, otherwise a new tuple
         """
-        base_interventions = list(self.SEVERITY_INTERVENTIONS.get(severity, []))
-        
         # Prioritize last successful intervention
         if last_intervention:
-            try:
-                last = PanicIntervention(last_intervention)
-                if last in base_interventions:
-                    base_interventions.remove(last)
-                    base_interventions.insert(0, last)
-            except ValueError:
-                pass
+            last = _INTERVENTION_BY_VALUE.get(last_intervention)
+            if last is not None:
+                base_interventions = _move_to_front(base_interventions, last)
         
         # Adjust based on triggers
         # CLINICAL_REVIEW_REQUIRED: Trigger-intervention mappings
         if PanicTrigger.HEALTH_ANXIETY in triggers:
             # Grounding over breathing for health anxiety
             # (breathing focus can increase symptom awareness)
-            if PanicIntervention.GROUNDING_TECHNIQUE in base_interventions:
-                base_interventions.remove(PanicIntervention.GROUNDING_TECHNIQUE)
-                base_interventions.insert(0, PanicIntervention.GROUNDING_TECHNIQUE)
+            base_interventions = _move_to_front(
+                base_interventions, PanicIntervention.GROUNDING_TECHNIQUE
+            )
         
         return base_interventions
-    
-    def _build_constraints(self, severity: PanicSeverity) -> list[str]:
-        """Build response constraints based on severity."""
-        constraints = list(self.UNIVERSAL_CONSTRAINTS)
-        
-        if severity >= PanicSeverity.MODERATE:
-            constraints.append("Keep response focused and concise")
-            constraints.append("Avoid lengthy explanations during crisis")
-        
-        if severity >= PanicSeverity.SEVERE:
-            constraints.append("Include option for professional help")
-            constraints.append("Use simple, clear language")
-        
-        return constraints
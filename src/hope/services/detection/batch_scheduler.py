@@ -0,0 +1,163 @@
+"""
+Batch Scheduler
+
+Dynamic micro-batching for transformer inference.
+Concurrent single-text requests are coalesced into one forward pass.
+
+ARCHITECTURE: Callers await submit(text) exactly as they would a
+single inference. A background task collects requests for up to
+max_wait_ms (or until max_batch_size is reached), runs the batch
+function once in the executor and resolves each caller's future
+with its row of the output.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable, Generic, Optional, Sequence, TypeVar
+
+from hope.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class BatchScheduler(Generic[T]):
+    """
+    Micro-batching scheduler for a blocking batch inference function.
+    
+    The worker task is started lazily on first submit and is bound
+    to the running event loop; it is restarted if the loop changes.
+    
+    Usage:
+        scheduler = BatchScheduler(model.infer_batch, max_batch_size=16)
+        row = await scheduler.submit(text)
+        ...
+        await scheduler.stop()
+    """
+    
+    def __init__(
+        self,
+        batch_fn: Callable[[list[str]], Sequence[T]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Initialize scheduler.
+        
+        Args:
+            batch_fn: Blocking function mapping texts to per-text outputs
+            max_batch_size: Maximum texts per forward pass
+            max_wait_ms: Maximum time to wait for a batch to fill
+            executor: Executor for batch_fn (loop default if None)
+        """
+        self._batch_fn = batch_fn
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait_seconds = max_wait_ms / 1000.0
+        self._executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    async def submit(self, text: str) -> T:
+        """
+        Queue text for batched inference.
+        
+        Args:
+            text: Input text
+        
+        Returns:
+            Output row for this text
+        """
+        loop = asyncio.get_running_loop()
+        
+        if (
+            self._worker is None
+            or self._worker.done()
+            or self._worker.get_loop() is not loop
+        ):
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        
+        future: asyncio.Future = loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+    
+    async def stop(self) -> None:
+        """Stop the worker and fail any queued requests."""
+        worker, queue = self._worker, self._queue
+        self._worker = None
+        self._queue = None
+        
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        
+        while queue is not None and not queue.empty():
+            _, future = queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batch scheduler stopped"))
+    
+    async def _collect(
+        self,
+        queue: asyncio.Queue,
+    ) -> list[tuple[str, asyncio.Future]]:
+        """Wait for one request, then gather more until full or timed out."""
+        loop = asyncio.get_running_loop()
+        batch = [await queue.get()]
+        deadline = loop.time() + self._max_wait_seconds
+        
+        while len(batch) < self._max_batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        # Callers that were cancelled while waiting need no inference
+        return [item for item in batch if not item[1].done()]
+    
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Worker loop: collect, infer, resolve."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = await self._collect(queue)
+            if not batch:
+                continue
+            
+            texts = [text for text, _ in batch]
+            
+            try:
+                outputs = await loop.run_in_executor(
+                    self._executor, self._batch_fn, texts
+                )
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("Batch scheduler stopped"))
+                raise
+            except Exception as e:
+                logger.error(
+                    "Batched inference failed",
+                    batch_size=len(texts),
+                    error=str(e),
+                )
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
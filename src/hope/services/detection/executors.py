@@ -0,0 +1,42 @@
+"""
+ML Executors
+
+Dedicated thread pools for blocking model work.
+
+ARCHITECTURE: Model forwards and model loads run here rather than in
+the event loop's default executor, which is shared with FastAPI/anyio
+sync endpoints and other I/O. A burst of inference (or a slow load
+during startup) therefore cannot starve unrelated blocking calls.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+_INFERENCE_MAX_WORKERS = os.cpu_count() or 1
+_LOAD_MAX_WORKERS = 4
+
+_inference_executor: Optional[ThreadPoolExecutor] = None
+_load_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_inference_executor() -> ThreadPoolExecutor:
+    """Get or create the shared thread pool for model forwards."""
+    global _inference_executor
+    if _inference_executor is None:
+        _inference_executor = ThreadPoolExecutor(
+            max_workers=_INFERENCE_MAX_WORKERS,
+            thread_name_prefix="ml-inf",
+        )
+    return _inference_executor
+
+
+def get_load_executor() -> ThreadPoolExecutor:
+    """Get or create the shared thread pool for model loading."""
+    global _load_executor
+    if _load_executor is None:
+        _load_executor = ThreadPoolExecutor(
+            max_workers=_LOAD_MAX_WORKERS,
+            thread_name_prefix="ml-load",
+        )
+    return _load_executor
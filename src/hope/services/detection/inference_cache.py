@@ -0,0 +1,95 @@
+"""
+Inference Cache
+
+Bounded LRU cache with TTL for model outputs keyed by input text.
+Repeated utterances (common during panic conversations) skip the
+transformer forward pass entirely.
+
+ARCHITECTURE: Keys are BLAKE2b digests of the exact text, so raw
+user text is never held as a dictionary key. The text is not
+normalized: inference runs on it as given, and subword tokenizers
+encode e.g. "x" and " x" differently.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class InferenceCache(Generic[T]):
+    """
+    LRU + TTL cache for per-text model outputs.
+    
+    Not locked: get/set never await, so they are atomic with
+    respect to the event loop.
+    
+    Usage:
+        cache: InferenceCache[dict[str, float]] = InferenceCache()
+        predictions = cache.get(text)
+        if predictions is None:
+            predictions = await run_model(text)
+            cache.set(text, predictions)
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 2048,
+        ttl_seconds: float = 300.0,
+    ) -> None:
+        """
+        Initialize cache.
+        
+        Args:
+            max_size: Maximum number of entries (0 disables caching)
+            ttl_seconds: Entry lifetime in seconds
+        """
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[float, T]] = OrderedDict()
+    
+    @staticmethod
+    def key_for(text: str) -> bytes:
+        """Compute the cache key for a text."""
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+    
+    def get(self, text: str) -> Optional[T]:
+        """
+        Get cached value for text.
+        
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        key = self.key_for(text)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, text: str, value: T) -> None:
+        """Store value for text, evicting the least recently used entry."""
+        if self._max_size <= 0:
+            return
+        
+        key = self.key_for(text)
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,106 @@
+"""
+Keyword Matcher
+
+Single-pass multi-keyword matching shared by the rule-based parts
+of the clinical pipeline.
+
+ARCHITECTURE: Keyword tables map a label to the phrases that signal
+it. KeywordMatcher keeps plain substring semantics ("phrase in text")
+and replaces one Python-level scan per phrase with one C-level pass.
+WholeWordMatcher matches on word boundaries instead, for tables whose
+short words would otherwise fire inside longer ones ("car" in
+"scared").
+"""
+
+import re
+from typing import Hashable, Iterable, Mapping
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional accelerator
+    ahocorasick = None
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class KeywordMatcher:
+    """
+    Single-pass multi-keyword substring matcher.
+    
+    Uses a pyahocorasick automaton when installed, which reports
+    every (possibly overlapping) keyword in one pass over the text.
+    Falls back to one compiled alternation per label.
+    
+    A keyword may belong to several labels.
+    """
+    
+    def __init__(self, keywords: Mapping[Hashable, Iterable[str]]) -> None:
+        self._automaton = None
+        self._patterns: list[tuple[Hashable, re.Pattern]] = []
+        
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for label, words in keywords.items():
+                for word in words:
+                    labels = automaton.get(word, ())
+                    automaton.add_word(word, labels + (label,))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._patterns = [
+                (label, re.compile("|".join(re.escape(w) for w in words)))
+                for label, words in keywords.items()
+            ]
+    
+    def labels_in(self, text: str) -> set[Hashable]:
+        """Return the labels of all keywords occurring in text."""
+        if self._automaton is not None:
+            return {
+                label
+                for _, labels in self._automaton.iter(text)
+                for label in labels
+            }
+        return {
+            label for label, pattern in self._patterns if pattern.search(text)
+        }
+
+
+class WholeWordMatcher:
+    """
+    Whole-word multi-keyword matcher.
+    
+    The text is split into word tokens once; single-word keywords
+    are then hash lookups, and multi-word keywords are matched
+    against the space-joined token sequence.
+    
+    A keyword may belong to several labels.
+    """
+    
+    def __init__(self, keywords: Mapping[Hashable, Iterable[str]]) -> None:
+        self._word_labels: dict[str, tuple[Hashable, ...]] = {}
+        self._phrases: list[tuple[str, Hashable]] = []
+        
+        for label, words in keywords.items():
+            for word in words:
+                tokens = _WORD_RE.findall(word)
+                if len(tokens) == 1:
+                    labels = self._word_labels.get(tokens[0], ())
+                    self._word_labels[tokens[0]] = labels + (label,)
+                elif tokens:
+                    self._phrases.append((f" {' '.join(tokens)} ", label))
+    
+    def labels_in(self, text: str) -> set[Hashable]:
+        """Return the labels of all keywords occurring as whole words in text."""
+        tokens = _WORD_RE.findall(text)
+        
+        found = {
+            label
+            for token in self._word_labels.keys() & set(tokens)
+            for label in self._word_labels[token]
+        }
+        
+        if self._phrases:
+            joined = f" {' '.join(tokens)} "
+            found.update(label for phrase, label in self._phrases if phrase in joined)
+        
+        return found
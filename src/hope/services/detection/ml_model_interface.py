@@ -9,12 +9,28 @@ service layer code. Critical for transitioning from external APIs
 to self-hosted fine-tuned models.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Callable, NamedTuple, Optional
 
+import numpy as np
 import torch
-from transformers import AutoTokenizer, AutoModel, AutoModelForSequenceClassification
+from torch import nn
+from torch.ao.quantization import quantize_dynamic
+from transformers import AutoModelForSequenceClassification
+
+from hope.services.detection.batch_scheduler import BatchScheduler
+from hope.services.detection.executors import (
+    get_inference_executor,
+    get_load_executor,
+)
+from hope.services.detection.inference_cache import InferenceCache
+from hope.services.detection.model_optimization import (
+    compile_module_for_inference,
+    export_onnx_for_inference,
+)
+from hope.services.detection.tokenizer_registry import SharedTokenizer, get_tokenizer
 
 
 @dataclass
@@ -56,7 +72,7 @@ class MLModelInterface(ABC):
         
         Args:
             text: Input text to classify
-            
+        
         Returns:
             ModelPrediction with label and confidence
         """
@@ -69,12 +85,28 @@ class MLModelInterface(ABC):
         
         Args:
             text: Input text
-            
+        
         Returns:
             Embedding vector
         """
         pass
     
+    async def predict_and_embed(
+        self, text: str
+    ) -> tuple[ModelPrediction, list[float]]:
+        """
+        Run inference and generate embeddings for input text.
+        
+        Override when both can come from one forward pass.
+        
+        Args:
+            text: Input text
+        
+        Returns:
+            Tuple of (prediction, embedding vector)
+        """
+        return await self.predict(text), await self.get_embeddings(text)
+    
     @abstractmethod
     def is_loaded(self) -> bool:
         """Check if model is loaded and ready."""
@@ -91,6 +123,58 @@ class MLModelInterface(ABC):
         pass
 
 
+class _EmotionForward(NamedTuple):
+    """Outputs of one emotion model forward for a single text (read-only)."""
+    
+    probabilities: np.ndarray
+    embedding: np.ndarray
+
+
+class _EmotionHeads(nn.Module):
+    """
+    Emotion classifier producing softmax probabilities and the
+    mask-weighted mean of the last hidden state from one forward.
+    
+    Takes positional tensors and returns a tuple, so the same module
+    can be exported to ONNX or run eagerly.
+    """
+    
+    def __init__(self, model: nn.Module) -> None:
+        super().__init__()
+        
+        self.model = model
+    
+    def forward(
+        self,
+        input_ids: torch.Tensor,
+        attention_mask: torch.Tensor,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Forward pass.
+        
+        Args:
+            input_ids: Token ids [batch, seq_len]
+            attention_mask: Attention mask [batch, seq_len]
+        
+        Returns:
+            Tuple of (probabilities [batch, num_labels],
+            embeddings [batch, hidden_size])
+        """
+        outputs = self.model(
+            input_ids=input_ids,
+            attention_mask=attention_mask,
+            output_hidden_states=True,
+        )
+        probabilities = torch.softmax(outputs.logits, dim=-1)
+        
+        # Mean-pool the last hidden state over real tokens only
+        hidden_states = outputs.hidden_states[-1]
+        mask = attention_mask.unsqueeze(-1).to(hidden_states.dtype)
+        embeddings = (hidden_states * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+        
+        return probabilities, embeddings
+
+
 class HuggingFaceEmotionModel(MLModelInterface):
     """
     HuggingFace Transformers implementation for emotion detection.
@@ -116,6 +200,16 @@ class HuggingFaceEmotionModel(MLModelInterface):
         self,
         model_name: str = "j-hartmann/emotion-english-distilroberta-base",
         device: Optional[str] = None,
+        cache_size: int = 2048,
+        cache_ttl_seconds: float = 300.0,
+        batch_size: int = 16,
+        batch_max_wait_ms: float = 5.0,
+        backend: str = "torch",
+        onnx_path: Optional[str] = None,
+        quantize: bool = True,
+        autocast_on_cuda: bool = True,
+        compile_model: bool = False,
+        compile_mode: str = "reduce-overhead",
     ) -> None:
         """
         Initialize emotion detection model.
@@ -123,30 +217,132 @@ class HuggingFaceEmotionModel(MLModelInterface):
         Args:
             model_name: HuggingFace model identifier
             device: Device to run on (cuda/cpu/auto)
+            cache_size: Max cached forward outputs (0 disables caching)
+            cache_ttl_seconds: Cached output lifetime
+            batch_size: Max concurrent texts per forward pass
+            batch_max_wait_ms: Max wait for a batch to fill
+            backend: "torch", or "onnx" to export to ONNX Runtime at
+                load (falls back to torch if unavailable)
+            onnx_path: App-owned path to keep the ONNX export (None
+                keeps no file)
+            quantize: Dynamic int8 quantization of Linear layers on CPU
+                (torch backend only)
+            autocast_on_cuda: Run the CUDA forward under bfloat16 (if
+                supported) or float16 autocast (torch backend only)
+            compile_model: Wrap the forward with torch.compile (adds
+                warm-up time at load; falls back to eager on failure)
+            compile_mode: torch.compile mode
         """
         self._model_name = model_name
         self._device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self._backend = backend
+        self._onnx_path = onnx_path
+        self._quantize = quantize
+        self._autocast_on_cuda = autocast_on_cuda
+        self._compile_model = compile_model
+        self._compile_mode = compile_mode
         self._model: Optional[AutoModelForSequenceClassification] = None
-        self._tokenizer: Optional[AutoTokenizer] = None
+        self._tokenizer: Optional[SharedTokenizer] = None
+        self._forward_fn: Optional[Callable[..., tuple[torch.Tensor, torch.Tensor]]] = None
+        self._labels: tuple[str, ...] = ()
         self._loaded = False
+        # predict() and get_embeddings() on the same text share one forward
+        self._forward_cache: InferenceCache[_EmotionForward] = InferenceCache(
+            max_size=cache_size,
+            ttl_seconds=cache_ttl_seconds,
+        )
+        # Concurrent detect() calls are coalesced into one padded forward
+        self._scheduler: BatchScheduler[_EmotionForward] = BatchScheduler(
+            self._infer_batch,
+            max_batch_size=batch_size,
+            max_wait_ms=batch_max_wait_ms,
+            executor=get_inference_executor(),
+        )
     
     async def load(self) -> None:
         """Load model and tokenizer."""
         if self._loaded:
             return
         
-        self._tokenizer = AutoTokenizer.from_pretrained(self._model_name)
-        self._model = AutoModelForSequenceClassification.from_pretrained(
-            self._model_name
-        ).to(self._device)
-        self._model.eval()
+        def _load():
+            tokenizer = get_tokenizer(self._model_name)
+            model = AutoModelForSequenceClassification.from_pretrained(
+                self._model_name
+            ).to(self._device)
+            model.eval()
+            if self._should_quantize():
+                model = quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+            return tokenizer, model, self._build_forward(_EmotionHeads(model).eval())
+        
+        loop = asyncio.get_running_loop()
+        self._tokenizer, self._model, self._forward_fn = await loop.run_in_executor(
+            get_load_executor(), _load
+        )
+        id2label = self._model.config.id2label
+        self._labels = tuple(id2label[i] for i in range(len(id2label)))
         self._loaded = True
     
+    def _should_quantize(self) -> bool:
+        """Dynamic int8 quantization applies to CPU torch inference only."""
+        return self._quantize and self._device == "cpu" and self._backend != "onnx"
+    
+    def _autocast_dtype(self) -> Optional[torch.dtype]:
+        """
+        Reduced-precision autocast dtype for the forward, if any.
+        
+        bfloat16 where the GPU supports it (same range as float32, so
+        softmax cannot overflow), else float16.
+        """
+        if not (
+            self._autocast_on_cuda
+            and self._device.startswith("cuda")
+            and self._backend != "onnx"
+        ):
+            return None
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    
+    def _build_forward(
+        self,
+        heads: _EmotionHeads,
+    ) -> Callable[..., tuple[torch.Tensor, torch.Tensor]]:
+        """
+        Pick the forward for the emotion heads.
+        
+        ONNX Runtime if configured and exportable, else torch.compile
+        if configured, else eager.
+        """
+        if self._backend == "onnx":
+            example = (torch.ones(1, 16, dtype=torch.long, device=self._device),) * 2
+            onnx_forward = export_onnx_for_inference(
+                heads,
+                example,
+                ("input_ids", "attention_mask"),
+                self._onnx_path,
+                self._device,
+                output_names=("probabilities", "embeddings"),
+            )
+            if onnx_forward is not None:
+                return onnx_forward
+        
+        if self._compile_model:
+            # Warm up a short and a full-length input so the first
+            # requests do not pay for (re)compilation
+            warmup = [
+                (torch.ones(1, 8, dtype=torch.long, device=self._device),) * 2,
+                (torch.ones(1, 512, dtype=torch.long, device=self._device),) * 2,
+            ]
+            return compile_module_for_inference(heads, warmup, self._compile_mode)
+        
+        return heads
+    
     async def unload(self) -> None:
         """Unload model from memory."""
+        await self._scheduler.stop()
         self._model = None
+        self._forward_fn = None
         self._tokenizer = None
         self._loaded = False
+        self._forward_cache.clear()
         if torch.cuda.is_available():
             torch.cuda.empty_cache()
     
@@ -160,37 +356,35 @@ class HuggingFaceEmotionModel(MLModelInterface):
         
         Args:
             text: Input text
-            
+        
         Returns:
             ModelPrediction with emotion label and confidence
         """
-        if not self.is_loaded():
-            await self.load()
-        
-        # Tokenize input
-        inputs = self._tokenizer(
-            text,
-            return_tensors="pt",
-            truncation=True,
-            max_length=512,
-            padding=True,
-        ).to(self._device)
+        return self._to_prediction((await self._forward(text)).probabilities)
+    
+    async def predict_and_embed(
+        self, text: str
+    ) -> tuple[ModelPrediction, list[float]]:
+        """
+        Predict emotion and get embeddings from a single forward pass.
         
-        # Run inference
-        with torch.no_grad():
-            outputs = self._model(**inputs)
-            probabilities = torch.nn.functional.softmax(outputs.logits, dim=-1)
+        Args:
+            text: Input text
         
+        Returns:
+            Tuple of (prediction, mean-pooled hidden-state embedding)
+        """
+        output = await self._forward(text)
+        return self._to_prediction(output.probabilities), output.embedding.tolist()
+    
+    def _to_prediction(self, probs: np.ndarray) -> ModelPrediction:
+        """Build a ModelPrediction from one row of class probabilities."""
         # Get prediction
-        probs = probabilities[0].cpu().numpy()
-        predicted_idx = probs.argmax()
-        labels = self._model.config.id2label
+        predicted_idx = int(probs.argmax())
+        labels = self._labels
         
         # Build probability distribution
-        prob_dict = {
-            labels[i]: float(probs[i])
-            for i in range(len(labels))
-        }
+        prob_dict = dict(zip(labels, probs.tolist()))
         
         predicted_label = labels[predicted_idx]
         confidence = float(probs[predicted_idx])
@@ -221,28 +415,66 @@ class HuggingFaceEmotionModel(MLModelInterface):
         
         Args:
             text: Input text
-            
+        
         Returns:
             Embedding vector
         """
+        return (await self._forward(text)).embedding.tolist()
+    
+    async def _forward(self, text: str) -> _EmotionForward:
+        """
+        Get probabilities and embedding for text from one forward pass.
+        
+        Cached per text, so predict() followed by get_embeddings()
+        (or repeats of either) cost a single forward. Misses are
+        micro-batched with concurrent callers.
+        """
+        cached = self._forward_cache.get(text)
+        if cached is not None:
+            return cached
+        
         if not self.is_loaded():
             await self.load()
         
+        output = await self._scheduler.submit(text)
+        self._forward_cache.set(text, output)
+        return output
+    
+    def _infer_batch(self, texts: list[str]) -> list[_EmotionForward]:
+        """
+        Run one forward over a micro-batch, returning both heads' outputs.
+        
+        Texts are padded to the longest in the batch; the embedding is
+        the last hidden state mean-pooled over real tokens only.
+        
+        Returns:
+            Per-text outputs, in input order
+        """
         inputs = self._tokenizer(
-            text,
+            texts,
             return_tensors="pt",
             truncation=True,
             max_length=512,
             padding=True,
         ).to(self._device)
         
-        with torch.no_grad():
-            outputs = self._model(**inputs, output_hidden_states=True)
-            # Use last hidden state, mean pooling
-            hidden_states = outputs.hidden_states[-1]
-            embeddings = hidden_states.mean(dim=1).squeeze()
+        autocast_dtype = self._autocast_dtype()
+        with torch.inference_mode(), torch.autocast(
+            device_type=torch.device(self._device).type,
+            dtype=autocast_dtype,
+            enabled=autocast_dtype is not None,
+        ):
+            probabilities, embeddings = self._forward_fn(
+                inputs["input_ids"], inputs["attention_mask"]
+            )
         
-        return embeddings.cpu().numpy().tolist()
+        # Upcast so reduced-precision runs return float32 outputs
+        probs = probabilities.float().cpu().numpy()
+        embeds = embeddings.float().cpu().numpy()
+        probs.setflags(write=False)
+        embeds.setflags(write=False)
+        
+        return [_EmotionForward(p, e) for p, e in zip(probs, embeds)]
 
 
 class SentenceEmbeddingModel(MLModelInterface):
@@ -255,16 +487,34 @@ class SentenceEmbeddingModel(MLModelInterface):
     def __init__(
         self,
         model_name: str = "all-MiniLM-L6-v2",
+        cache_size: int = 2048,
+        cache_ttl_seconds: float = 300.0,
+        batch_size: int = 32,
+        batch_max_wait_ms: float = 5.0,
     ) -> None:
         """
         Initialize sentence embedding model.
         
         Args:
             model_name: Sentence-Transformers model name
+            cache_size: Max cached embeddings (0 disables caching)
+            cache_ttl_seconds: Cached embedding lifetime
+            batch_size: Max concurrent texts encoded per call
+            batch_max_wait_ms: Max wait for a batch to fill
         """
         self._model_name = model_name
         self._model = None
         self._loaded = False
+        self._embedding_cache: InferenceCache[list[float]] = InferenceCache(
+            max_size=cache_size,
+            ttl_seconds=cache_ttl_seconds,
+        )
+        self._scheduler: BatchScheduler[list[float]] = BatchScheduler(
+            self._encode_batch,
+            max_batch_size=batch_size,
+            max_wait_ms=batch_max_wait_ms,
+            executor=get_inference_executor(),
+        )
     
     async def load(self) -> None:
         """Load sentence-transformers model."""
@@ -272,13 +522,18 @@ class SentenceEmbeddingModel(MLModelInterface):
             return
         
         from sentence_transformers import SentenceTransformer
-        self._model = SentenceTransformer(self._model_name)
+        loop = asyncio.get_running_loop()
+        self._model = await loop.run_in_executor(
+            get_load_executor(), SentenceTransformer, self._model_name
+        )
         self._loaded = True
     
     async def unload(self) -> None:
         """Unload model."""
+        await self._scheduler.stop()
         self._model = None
         self._loaded = False
+        self._embedding_cache.clear()
     
     def is_loaded(self) -> bool:
         """Check if loaded."""
@@ -303,12 +558,25 @@ class SentenceEmbeddingModel(MLModelInterface):
         
         Args:
             text: Input text
-            
+        
         Returns:
             Embedding vector (384 dimensions for all-MiniLM-L6-v2)
         """
+        cached = self._embedding_cache.get(text)
+        if cached is not None:
+            return list(cached)
+        
         if not self.is_loaded():
             await self.load()
         
-        embeddings = self._model.encode(text, convert_to_numpy=True)
-        return embeddings.tolist()
+        embeddings = await self._scheduler.submit(text)
+        self._embedding_cache.set(text, embeddings)
+        return list(embeddings)
+    
+    def _encode_batch(self, texts: list[str]) -> list[list[float]]:
+        """Encode a micro-batch of texts in one call."""
+        return self._model.encode(
+            texts,
+            batch_size=len(texts),
+            convert_to_numpy=True,
+        ).tolist()
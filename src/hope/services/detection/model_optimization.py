@@ -0,0 +1,299 @@
+"""
+Model Optimization
+
+Optional torch.compile / TorchScript / ONNX Runtime wrapping for
+transformer inference models.
+
+ARCHITECTURE: torch.compile is lazy, so graph capture errors only
+surface on the first forward. compile_for_inference runs a warm-up
+forward at load time and falls back to the eager model if
+compilation fails (missing C++ toolchain, unsupported quantized
+ops, etc.), so a bad compile can never break request handling.
+trace_for_inference follows the same contract for torch.jit.trace,
+and export_onnx_for_inference returns None so callers keep PyTorch.
+"""
+
+import contextlib
+import inspect
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Optional, Sequence, Union
+
+import torch
+
+from hope.config.logging_config import get_logger
+
+try:
+    import onnxruntime
+except ImportError:  # pragma: no cover - optional accelerator
+    onnxruntime = None
+
+logger = get_logger(__name__)
+
+# torch.onnx.export keeps exporter state in process globals
+_onnx_export_lock = threading.Lock()
+
+
+def compile_for_inference(
+    model: torch.nn.Module,
+    tokenizer: Any,
+    device: str,
+    mode: str = "reduce-overhead",
+) -> torch.nn.Module:
+    """
+    Compile a model with torch.compile, falling back to eager on failure.
+    
+    Blocking; call from an executor during model load.
+    
+    Args:
+        model: Model in eval mode
+        tokenizer: Tokenizer used to build the warm-up input
+        device: Device the model lives on
+        mode: torch.compile mode
+    
+    Returns:
+        Compiled model, or the original model if compilation failed
+    """
+    warmup = tokenizer(["warm up"], padding=True, return_tensors="pt")
+    warmup = {k: v.to(device) for k, v in warmup.items()}
+    return _compile(model, mode, lambda compiled: compiled(**warmup))
+
+
+def compile_module_for_inference(
+    model: torch.nn.Module,
+    example_inputs: Sequence[tuple[torch.Tensor, ...]],
+    mode: str = "reduce-overhead",
+) -> torch.nn.Module:
+    """
+    Compile a model taking positional tensors, warming up each shape.
+    
+    Warming up a short and a long input primes the dynamic-shape
+    graph so the first real requests do not pay for compilation.
+    
+    Blocking; call from an executor during model load.
+    
+    Args:
+        model: Model in eval mode
+        example_inputs: Positional inputs for each warm-up call
+        mode: torch.compile mode
+    
+    Returns:
+        Compiled model, or the original model if compilation failed
+    """
+    def warmup(compiled: torch.nn.Module) -> None:
+        for inputs in example_inputs:
+            compiled(*inputs)
+    
+    return _compile(model, mode, warmup)
+
+
+def _compile(
+    model: torch.nn.Module,
+    mode: str,
+    warmup: Callable[[torch.nn.Module], Any],
+) -> torch.nn.Module:
+    """Compile and warm up; return the eager model on any failure."""
+    if not hasattr(torch, "compile"):
+        return model
+    
+    try:
+        compiled = torch.compile(model, mode=mode, dynamic=True)
+        with torch.inference_mode():
+            warmup(compiled)
+        return compiled
+    
+    except Exception as e:
+        logger.warning(
+            "torch.compile failed, using eager model",
+            model=type(model).__name__,
+            error=str(e),
+        )
+        return model
+
+
+def trace_for_inference(
+    model: torch.nn.Module,
+    example_inputs: tuple[torch.Tensor, ...],
+    check_inputs: Sequence[tuple[torch.Tensor, ...]] = (),
+    atol: float = 1e-4,
+) -> torch.nn.Module:
+    """
+    Trace, freeze and optimize a model with TorchScript.
+    
+    Falls back to the eager model if tracing fails or if the traced
+    graph disagrees with eager on any of check_inputs (traces bake in
+    Python control flow, so they are checked on other shapes).
+    
+    Blocking; call from an executor during model load.
+    
+    Args:
+        model: Model in eval mode
+        example_inputs: Positional inputs used for tracing
+        check_inputs: Further inputs compared against eager output
+        atol: Absolute tolerance for the comparison
+    
+    Returns:
+        Frozen TorchScript module, or the original model on failure
+    """
+    try:
+        with torch.no_grad():
+            traced = torch.jit.trace(model, example_inputs, strict=False)
+            traced = torch.jit.freeze(traced)
+            traced = torch.jit.optimize_for_inference(traced)
+            
+            # Warm-up: the profiling executor specializes on early calls
+            with torch.jit.optimized_execution(True):
+                for _ in range(2):
+                    traced(*example_inputs)
+            
+            for inputs in check_inputs:
+                if not torch.allclose(traced(*inputs), model(*inputs), atol=atol):
+                    raise ValueError("traced output differs from eager")
+        
+        return traced
+    
+    except Exception as e:
+        logger.warning(
+            "TorchScript tracing failed, using eager model",
+            model=type(model).__name__,
+            error=str(e),
+        )
+        return model
+
+
+class OnnxForward:
+    """
+    ONNX Runtime session with a torch-module-like call signature.
+    
+    Takes and returns torch tensors so it can replace a module's
+    forward; InferenceSession.run is safe to call from many threads.
+    Returns a single tensor for single-output graphs, else a tuple.
+    """
+    
+    def __init__(self, session: Any, input_names: Sequence[str]) -> None:
+        self._session = session
+        self._input_names = list(input_names)
+    
+    def __call__(
+        self, *inputs: torch.Tensor
+    ) -> Union[torch.Tensor, tuple[torch.Tensor, ...]]:
+        feeds = {
+            name: tensor.cpu().numpy()
+            for name, tensor in zip(self._input_names, inputs)
+        }
+        outputs = self._session.run(None, feeds)
+        if len(outputs) == 1:
+            return torch.from_numpy(outputs[0])
+        return tuple(torch.from_numpy(output) for output in outputs)
+
+
+def _legacy_exporter_kwargs() -> dict[str, Any]:
+    """
+    Select the TorchScript-based ONNX exporter.
+    
+    torch >= 2.5 accepts dynamo= (and later defaults it to True);
+    older releases such as the pinned 2.2 reject the keyword.
+    """
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        return {"dynamo": False}
+    return {}
+
+
+def export_onnx_for_inference(
+    model: torch.nn.Module,
+    example_inputs: tuple[torch.Tensor, ...],
+    input_names: Sequence[str],
+    path: Optional[str],
+    device: str,
+    opset_version: int = 17,
+    output_names: Sequence[str] = ("output",),
+) -> Optional[OnnxForward]:
+    """
+    Export a model to ONNX and open an optimized ONNX Runtime session.
+    
+    Every input gets dynamic batch and sequence axes; every output a
+    dynamic batch axis.
+    
+    The export is written to a private, uniquely named file (mkstemp)
+    so concurrent workers never share or race on a predictable path.
+    With a path it is then atomically renamed into place; without one
+    it is deleted once the session has loaded it.
+    
+    Blocking; call from an executor during model load.
+    
+    Args:
+        model: Unquantized model in eval mode
+        example_inputs: Positional inputs used for export
+        input_names: ONNX names for the positional inputs
+        path: Where to keep the .onnx file (None keeps no file); its
+            directory should be app-owned, not a shared temp dir
+        device: Device the model lives on (selects the provider)
+        opset_version: ONNX opset
+        output_names: ONNX names for the model's outputs, in order
+    
+    Returns:
+        Callable session wrapper, or None if onnxruntime is missing
+        or export failed
+    """
+    if onnxruntime is None:
+        logger.warning("onnxruntime not installed, using PyTorch backend")
+        return None
+    
+    export_path: Optional[str] = None
+    try:
+        # Same directory as the target so the rename stays atomic
+        export_dir = os.path.dirname(path) if path else ""
+        fd, export_path = tempfile.mkstemp(
+            prefix="hope-", suffix=".onnx", dir=export_dir or None
+        )
+        os.close(fd)
+        
+        with _onnx_export_lock, torch.no_grad():
+            torch.onnx.export(
+                model,
+                example_inputs,
+                export_path,
+                input_names=list(input_names),
+                output_names=list(output_names),
+                dynamic_axes={
+                    **{name: {0: "batch", 1: "sequence"} for name in input_names},
+                    **{name: {0: "batch"} for name in output_names},
+                },
+                opset_version=opset_version,
+                **_legacy_exporter_kwargs(),
+            )
+        
+        if path:
+            os.replace(export_path, path)
+            export_path = path
+        
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        providers = ["CPUExecutionProvider"]
+        if (
+            device.startswith("cuda")
+            and "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+        ):
+            providers.insert(0, "CUDAExecutionProvider")
+        
+        session = onnxruntime.InferenceSession(
+            export_path, sess_options=options, providers=providers
+        )
+        return OnnxForward(session, input_names)
+    
+    except Exception as e:
+        logger.warning(
+            "ONNX export failed, using PyTorch backend",
+            model=type(model).__name__,
+            error=str(e),
+        )
+        return None
+    
+    finally:
+        # The session holds the model in memory; drop the private copy
+        if export_path is not None and export_path != path:
+            with contextlib.suppress(OSError):
+                os.remove(export_path)
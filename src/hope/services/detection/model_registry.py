@@ -0,0 +1,54 @@
+"""
+Model Registry
+
+Process-wide sharing of loaded model weights between component
+instances.
+
+ARCHITECTURE: Creating a second classifier for the same checkpoint
+(multiple pipelines in one worker, test suites) would otherwise
+deserialize and allocate the weights again. Models are held weakly:
+once the last component instance drops its reference (e.g. on
+unload), the entry disappears and the memory can be reclaimed.
+Loads of the same key are serialized so concurrent first loads
+share one copy; loads of different keys proceed in parallel.
+"""
+
+import threading
+import weakref
+from typing import Callable, Hashable
+
+import torch
+
+_models: "weakref.WeakValueDictionary[Hashable, torch.nn.Module]" = (
+    weakref.WeakValueDictionary()
+)
+_key_locks: dict[Hashable, threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def get_shared_model(
+    key: Hashable,
+    load: Callable[[], torch.nn.Module],
+) -> torch.nn.Module:
+    """
+    Get a live shared model for key, loading it if none exists.
+    
+    Blocking; call from an executor.
+    
+    Args:
+        key: Identifies the prepared weights, e.g. (model name,
+            device, quantized); must capture everything load() varies
+        load: Loads and prepares the model
+    
+    Returns:
+        Shared model
+    """
+    with _registry_lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+    
+    with key_lock:
+        model = _models.get(key)
+        if model is None:
+            model = load()
+            _models[key] = model
+        return model
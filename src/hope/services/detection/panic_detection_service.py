@@ -107,6 +107,7 @@ class PanicDetectionService:
         emotion_model: Optional[MLModelInterface] = None,
         embedding_model: Optional[MLModelInterface] = None,
         enable_ml: bool = True,
+        shared_embeddings: bool = False,
     ) -> None:
         """
         Initialize panic detection service.
@@ -115,11 +116,17 @@ class PanicDetectionService:
             emotion_model: ML model for emotion detection
             embedding_model: Model for generating embeddings
             enable_ml: Whether to use ML models (can be disabled)
+            shared_embeddings: Take detect() embeddings from the emotion
+                model's forward instead of loading the embedding model.
+                These live in the emotion model's space (768-D for the
+                default), not the 384-D space of the vector index; use
+                get_index_embeddings() for vectors that will be stored.
         """
         self._text_analyzer = TextAnalyzer()
         self._emotion_model = emotion_model or HuggingFaceEmotionModel()
         self._embedding_model = embedding_model or SentenceEmbeddingModel()
         self._enable_ml = enable_ml
+        self._shared_embeddings = shared_embeddings
         self._models_loaded = False
     
     async def load_models(self) -> None:
@@ -133,7 +140,8 @@ class PanicDetectionService:
         
         logger.info("Loading panic detection ML models")
         await self._emotion_model.load()
-        await self._embedding_model.load()
+        if not self._shared_embeddings:
+            await self._embedding_model.load()
         self._models_loaded = True
         logger.info("Panic detection models loaded successfully")
     
@@ -163,7 +171,7 @@ class PanicDetectionService:
             user_id: Optional user ID for context
             session_id: Optional session ID for context
             include_embeddings: Whether to generate embeddings
-            
+        
         Returns:
             DetectionResult with severity classification and analysis
         """
@@ -190,18 +198,24 @@ class PanicDetectionService:
         
         # Step 3: ML model inference (if enabled)
         ml_prediction = None
+        embeddings = None
+        share_forward = include_embeddings and self._shared_embeddings
         if self._enable_ml:
             try:
                 if not self._models_loaded:
                     await self.load_models()
-                ml_prediction = await self._emotion_model.predict(text)
+                if share_forward:
+                    ml_prediction, embeddings = (
+                        await self._emotion_model.predict_and_embed(text)
+                    )
+                else:
+                    ml_prediction = await self._emotion_model.predict(text)
             except Exception as e:
                 logger.error("ML model inference failed", error=str(e))
                 # Continue with rule-based only
         
         # Step 4: Generate embeddings (if requested)
-        embeddings = None
-        if include_embeddings and self._enable_ml:
+        if include_embeddings and self._enable_ml and not share_forward:
             try:
                 if not self._models_loaded:
                     await self.load_models()
@@ -260,9 +274,11 @@ class PanicDetectionService:
             try:
                 if not self._models_loaded:
                     await self.load_models()
-                embeddings = await self._embedding_model.get_embeddings(
-                    text_analysis.raw_text
+                model = (
+                    self._emotion_model if self._shared_embeddings
+                    else self._embedding_model
                 )
+                embeddings = await model.get_embeddings(text_analysis.raw_text)
             except Exception:
                 pass  # Don't fail crisis detection on embedding failure
         
@@ -276,6 +292,22 @@ class PanicDetectionService:
             requires_escalation=True,  # ALWAYS escalate for crisis
         )
     
+    async def get_index_embeddings(self, text: str) -> list[float]:
+        """
+        Generate embeddings in the vector index's space.
+        
+        Always uses the embedding model (loaded on first use), so it
+        is safe for vector storage whether or not shared_embeddings
+        is enabled.
+        
+        Args:
+            text: Text to embed
+        
+        Returns:
+            Embedding vector
+        """
+        return await self._embedding_model.get_embeddings(text)
+    
     def _calculate_combined_score(
         self,
         text_analysis: TextAnalysisResult,
@@ -290,7 +322,7 @@ class PanicDetectionService:
         Args:
             text_analysis: Rule-based analysis result
             ml_prediction: ML model prediction (if available)
-            
+        
         Returns:
             Combined confidence score (0.0-1.0)
         """
@@ -324,7 +356,7 @@ class PanicDetectionService:
         
         Args:
             score: Combined confidence score
-            
+        
         Returns:
             PanicSeverity level
         """
@@ -350,7 +382,7 @@ class PanicDetectionService:
         
         Args:
             text_analysis: Text analysis result
-            
+        
         Returns:
             List of suggested trigger categories
         """
@@ -410,7 +442,7 @@ class PanicDetectionService:
             detection_result: Detection result
             user_id: User ID
             session_id: Optional session ID
-            
+        
         Returns:
             PanicEvent domain object
         """
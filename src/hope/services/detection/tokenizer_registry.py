@@ -0,0 +1,57 @@
+"""
+Tokenizer Registry
+
+Process-wide tokenizer instances keyed by model name.
+
+ARCHITECTURE: Several components load the same checkpoint (e.g. the
+clinical EmotionDetector and the detection HuggingFaceEmotionModel
+both use the DistilRoBERTa emotion model). Loading through this
+registry parses each tokenizer once and shares the Rust object.
+
+Fast tokenizers mutate their truncation/padding state on every call
+and raise "Already borrowed" when used from two threads at once, so
+calls on a shared instance are serialized by a per-tokenizer lock.
+"""
+
+import threading
+from functools import lru_cache
+from typing import Any
+
+from transformers import AutoTokenizer
+
+
+class SharedTokenizer:
+    """
+    Thread-safe wrapper around a shared HuggingFace tokenizer.
+    
+    Calls are serialized; attribute access (pad_token_id, etc.)
+    is delegated to the wrapped tokenizer.
+    """
+    
+    def __init__(self, tokenizer: Any) -> None:
+        self._tokenizer = tokenizer
+        self._lock = threading.Lock()
+    
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return self._tokenizer(*args, **kwargs)
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tokenizer, name)
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(model_name: str) -> SharedTokenizer:
+    """
+    Get the shared tokenizer for a model, loading it on first use.
+    
+    Blocking; call from an executor.
+    
+    Args:
+        model_name: HuggingFace model identifier
+    
+    Returns:
+        Shared tokenizer
+    """
+    # Force the Rust tokenizer; the SentencePiece fallback is far slower
+    return SharedTokenizer(AutoTokenizer.from_pretrained(model_name, use_fast=True))
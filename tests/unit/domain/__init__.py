@@ -0,0 +1 @@
+"""Tests for domain models package."""
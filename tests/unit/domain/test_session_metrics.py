@@ -0,0 +1,162 @@
+"""
+Unit Tests for Session Metrics
+
+Tests the column-stored trajectory against the original list-of-points
+implementation and the read-only trajectory snapshot.
+"""
+
+import random
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import uuid4
+
+import pytest
+
+from hope.domain.enums.panic_severity import PanicSeverity
+from hope.domain.models import session_metrics
+from hope.domain.models.session_metrics import IntensityDataPoint, SessionMetrics
+
+_START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class _ReferenceMetrics:
+    """The original list-of-points trajectory logic."""
+    
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self.points: list[tuple[datetime, float, PanicSeverity, Optional[str]]] = []
+        self.peak_intensity = 0.0
+        self.peak_severity = PanicSeverity.NONE
+        self.peak_timestamp: Optional[datetime] = None
+        self.time_to_calm: Optional[timedelta] = None
+        self.final_intensity = 0.0
+        self.messages_to_effect: list[int] = []
+    
+    def add(
+        self,
+        now: datetime,
+        intensity: float,
+        severity: PanicSeverity,
+        intervention: Optional[str],
+    ) -> None:
+        self.points.append((now, intensity, severity, intervention))
+        if intensity > self.peak_intensity:
+            self.peak_intensity = intensity
+            self.peak_severity = severity
+            self.peak_timestamp = now
+        self.final_intensity = intensity
+        
+        if self.peak_timestamp:
+            if self.final_intensity >= self.threshold:
+                self.time_to_calm = None
+            else:
+                for timestamp, value, _, _ in self.points:
+                    if timestamp > self.peak_timestamp and value < self.threshold:
+                        self.time_to_calm = timestamp - self.peak_timestamp
+                        break
+        
+        if intervention:
+            self.messages_to_effect.append(len(self.points) - 1)
+
+
+@pytest.fixture
+def no_wall_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail if SessionMetrics reads the wall clock per message."""
+    
+    class _NoUtcnow(datetime):
+        @classmethod
+        def utcnow(cls) -> datetime:
+            raise AssertionError("per-message wall-clock read")
+    
+    monkeypatch.setattr(session_metrics, "datetime", _NoUtcnow)
+
+
+class TestSessionMetricsEquivalence:
+    """Column storage must match the original list-based model."""
+    
+    def test_random_sessions_match_reference(self, no_wall_clock: None) -> None:
+        """Test peak, calm, summary and trajectory over random sessions."""
+        rng = random.Random(0)
+        severities = list(PanicSeverity)
+        
+        for _ in range(200):
+            offset_us = 0
+            metrics = SessionMetrics(session_id=uuid4(), user_id=uuid4(), started_at=_START)
+            reference = _ReferenceMetrics(metrics.CALM_THRESHOLD)
+            
+            # Longer than the initial column capacity so growth is covered
+            for _ in range(rng.randint(1, 40)):
+                # Zero steps give equal timestamps, exercising the strict
+                # "after the peak" comparison
+                offset_us += rng.choice([0, 1, 1500, 250_000])
+                intensity = round(rng.random(), 3)
+                severity = rng.choice(severities)
+                intervention = rng.choice([None, None, "breathing", "grounding"])
+                
+                reference.add(
+                    _START + timedelta(microseconds=offset_us), intensity, severity, intervention
+                )
+                metrics.add_data_point(intensity, severity, intervention, offset_us=offset_us)
+            
+            values = [point[1] for point in reference.points]
+            assert metrics.peak_intensity == reference.peak_intensity
+            assert metrics.peak_severity == reference.peak_severity
+            assert metrics.peak_timestamp == reference.peak_timestamp
+            assert metrics.time_to_calm == reference.time_to_calm
+            assert metrics.final_intensity == reference.final_intensity
+            assert metrics.total_messages == len(values)
+            assert metrics.get_intensity_change() == (
+                values[-1] - values[0] if len(values) > 1 else 0.0
+            )
+            assert metrics.get_average_intensity() == pytest.approx(sum(values) / len(values))
+            assert list(metrics.intensities) == values
+            assert [
+                record.messages_to_effect for record in metrics.interventions[:-1]
+            ] == reference.messages_to_effect[1:]
+            assert [record.applied_at for record in metrics.interventions] == [
+                timestamp for timestamp, _, _, intervention in reference.points if intervention
+            ]
+            assert metrics.intensity_trajectory == tuple(
+                IntensityDataPoint(
+                    timestamp=timestamp,
+                    intensity=intensity,
+                    severity=severity,
+                    message_index=index,
+                    intervention_applied=intervention,
+                )
+                for index, (timestamp, intensity, severity, intervention)
+                in enumerate(reference.points)
+            )
+
+
+class TestTrajectorySnapshot:
+    """The trajectory property must reject mutation loudly."""
+    
+    @pytest.fixture
+    def metrics(self) -> SessionMetrics:
+        """Create metrics with two data points."""
+        metrics = SessionMetrics(session_id=uuid4(), user_id=uuid4())
+        metrics.add_data_point(0.8, PanicSeverity.SEVERE, offset_us=0)
+        metrics.add_data_point(0.2, PanicSeverity.MILD, offset_us=1_000_000)
+        return metrics
+    
+    def test_append_raises(self, metrics: SessionMetrics) -> None:
+        """Test that appending to the snapshot fails."""
+        with pytest.raises(AttributeError):
+            metrics.intensity_trajectory.append(metrics.intensity_trajectory[0])
+    
+    def test_point_edit_raises(self, metrics: SessionMetrics) -> None:
+        """Test that editing a snapshot point fails."""
+        with pytest.raises(FrozenInstanceError):
+            metrics.intensity_trajectory[0].intensity = 0.0
+    
+    def test_assignment_raises(self, metrics: SessionMetrics) -> None:
+        """Test that replacing the trajectory fails."""
+        with pytest.raises(AttributeError):
+            metrics.intensity_trajectory = []
+    
+    def test_intensities_view_is_read_only(self, metrics: SessionMetrics) -> None:
+        """Test that the intensity column cannot be written through."""
+        with pytest.raises(ValueError):
+            metrics.intensities[0] = 0.0
@@ -0,0 +1 @@
+"""Tests for detection services package."""
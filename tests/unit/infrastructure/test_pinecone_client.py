@@ -0,0 +1,175 @@
+"""
+Unit Tests for Pinecone Client
+
+Tests upsert batching, failure reporting and int8 quantization
+without a live Pinecone index.
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from hope.infrastructure.vector_db.pinecone_client import PineconeVectorClient, _quantize
+
+
+class _FakeIndex:
+    """Records upsert calls; optionally fails them."""
+    
+    def __init__(self, fail: bool = False, delay: float = 0.0) -> None:
+        self.fail = fail
+        self.delay = delay
+        self.upserts: list[list[tuple]] = []
+        self.queries: list[list[float]] = []
+    
+    def upsert(self, vectors: list[tuple]) -> None:
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upsert rejected")
+        self.upserts.append(vectors)
+    
+    def query(self, vector: list[float], **kwargs) -> object:
+        self.queries.append(vector)
+        return type("Response", (), {"matches": []})()
+
+
+def _client(index: _FakeIndex, **kwargs: bool) -> PineconeVectorClient:
+    """Create a client wired to a fake index."""
+    client = PineconeVectorClient(api_key="test", index_name="test", **kwargs)
+    client._index = index
+    client._do_upsert = index.upsert
+    client._do_query = index.query
+    client._initialized = True
+    return client
+
+
+class TestUpsertBatching:
+    """Test suite for buffered upserts."""
+    
+    async def test_concurrent_upserts_share_one_call(self) -> None:
+        """Test that concurrent upserts are written together."""
+        index = _FakeIndex()
+        client = _client(index)
+        
+        results = await asyncio.gather(
+            *(client.upsert(f"id-{i}", [0.1, 0.2, 0.3], {"i": i}) for i in range(5))
+        )
+        
+        assert results == [True] * 5
+        assert len(index.upserts) == 1
+        assert [v[0] for v in index.upserts[0]] == [f"id-{i}" for i in range(5)]
+    
+    async def test_full_batch_flushes_immediately(self) -> None:
+        """Test that reaching the batch size flushes without waiting."""
+        index = _FakeIndex()
+        client = _client(index)
+        client.UPSERT_MAX_DELAY_SECONDS = 60.0
+        client.UPSERT_BATCH_SIZE = 3
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(*(client.upsert(f"id-{i}", [1.0], {}) for i in range(3))),
+            timeout=5.0,
+        )
+        
+        assert results == [True] * 3
+        assert len(index.upserts) == 1
+        client._flush_task.cancel()
+    
+    async def test_upsert_during_inflight_write_is_flushed(self) -> None:
+        """Test that vectors queued mid-write are not stranded."""
+        index = _FakeIndex(delay=0.1)
+        client = _client(index)
+        
+        first = asyncio.create_task(client.upsert("first", [1.0], {}))
+        await asyncio.sleep(client.UPSERT_MAX_DELAY_SECONDS + 0.02)
+        second = client.upsert("second", [1.0], {})
+        
+        assert await asyncio.wait_for(asyncio.gather(first, second), timeout=5.0) == [
+            True,
+            True,
+        ]
+        assert [[v[0] for v in batch] for batch in index.upserts] == [["first"], ["second"]]
+    
+    async def test_failed_batch_is_reported_to_every_caller(self) -> None:
+        """Test that a failed write returns False instead of being dropped silently."""
+        client = _client(_FakeIndex(fail=True))
+        
+        results = await asyncio.gather(
+            *(client.upsert(f"id-{i}", [1.0, 0.0], {}) for i in range(3))
+        )
+        
+        assert results == [False] * 3
+        assert client._pending == []
+    
+    async def test_close_writes_buffered_vectors(self) -> None:
+        """Test that close() returns only after buffered vectors are written."""
+        index = _FakeIndex()
+        client = _client(index)
+        
+        pending = asyncio.create_task(client.upsert("id", [1.0, 2.0], {}))
+        await asyncio.sleep(0)
+        await client.close()
+        
+        assert index.upserts and index.upserts[0][0][0] == "id"
+        assert await pending is True
+
+
+class TestQuantization:
+    """Test suite for int8 vector quantization."""
+    
+    def test_values_on_int8_grid(self) -> None:
+        """Test that quantized values are integers in [-127, 127]."""
+        vector = np.random.default_rng(0).normal(size=384).astype(np.float32)
+        
+        values, scale = _quantize(vector)
+        
+        assert np.abs(values).max() == 127
+        assert np.array_equal(values, np.rint(values))
+        assert scale == pytest.approx(127.0 / np.abs(vector).max())
+    
+    def test_cosine_similarity_preserved(self) -> None:
+        """Test that quantization barely changes cosine similarity."""
+        rng = np.random.default_rng(1)
+        a, b = rng.normal(size=(2, 384)).astype(np.float32)
+        qa, _ = _quantize(a)
+        qb, _ = _quantize(b)
+        
+        def cosine(x: np.ndarray, y: np.ndarray) -> float:
+            return float(x @ y / (np.linalg.norm(x) * np.linalg.norm(y)))
+        
+        assert cosine(qa, qb) == pytest.approx(cosine(a, b), abs=0.01)
+        assert cosine(qa, a) > 0.999
+    
+    def test_zero_vector_unchanged(self) -> None:
+        """Test that an all-zero vector passes through."""
+        vector = np.zeros(4, dtype=np.float32)
+        
+        values, scale = _quantize(vector)
+        
+        assert np.array_equal(values, vector)
+        assert scale == 1.0
+    
+    async def test_upsert_records_scale(self) -> None:
+        """Test that upserts carry the scale in metadata and search quantizes too."""
+        index = _FakeIndex()
+        client = _client(index, quantize=True)
+        
+        assert await client.upsert("id", [0.5, -1.0], {"user_id": "u"})
+        await client.search([0.5, -1.0])
+        
+        _, values, metadata = index.upserts[0][0]
+        assert values == [64.0, -127.0]
+        assert metadata == {"user_id": "u", "quant_scale": 127.0}
+        assert index.queries == [[64.0, -127.0]]
+    
+    async def test_quantization_is_off_by_default(self) -> None:
+        """Test that vectors and metadata are sent unchanged unless opted in."""
+        index = _FakeIndex()
+        client = _client(index)
+        
+        assert await client.upsert("id", [0.5, -1.0], {})
+        await client.search([0.5, -1.0])
+        
+        assert index.upserts[0][0] == ("id", [0.5, -1.0], {})
+        assert index.queries == [[0.5, -1.0]]
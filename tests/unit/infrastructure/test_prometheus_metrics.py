@@ -0,0 +1,74 @@
+"""
+Unit Tests for Prometheus Metrics
+
+Tests how LLMTimer classifies LLM request outcomes.
+"""
+
+from typing import Optional
+
+import pytest
+from prometheus_client import REGISTRY
+
+from hope.infrastructure.metrics.prometheus_metrics import LLMTimer
+
+
+class _ProviderRateLimit(Exception):
+    """Stand-in for a provider's translated rate-limit error."""
+
+
+class _SdkError(Exception):
+    """Stand-in for an untranslated SDK error with an HTTP status."""
+    
+    def __init__(self, message: str, status_code: int) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _count(provider: str, status: str) -> float:
+    """Current value of the LLM request counter for provider/status."""
+    value: Optional[float] = REGISTRY.get_sample_value(
+        "hope_llm_requests_total", {"provider": provider, "status": status}
+    )
+    return value or 0.0
+
+
+async def _run(provider: str, error: Optional[Exception]) -> None:
+    """Run one timed request that raises error (if any)."""
+    try:
+        async with LLMTimer(provider, rate_limit_errors=(_ProviderRateLimit,)):
+            if error is not None:
+                raise error
+    except Exception as exc:
+        assert exc is error
+
+
+class TestLLMTimer:
+    """Test suite for LLMTimer."""
+    
+    @pytest.mark.parametrize(
+        "error, status",
+        [
+            (None, "success"),
+            (_ProviderRateLimit("slow down"), "rate_limited"),
+            (_SdkError("Too Many Requests", status_code=429), "rate_limited"),
+            (_SdkError("Bad Gateway", status_code=502), "error"),
+            (ValueError("failed to generate a moderate, accurate reply"), "error"),
+            (RuntimeError("separate failure"), "error"),
+        ],
+    )
+    async def test_outcome_classification(
+        self, error: Optional[Exception], status: str
+    ) -> None:
+        """Test that only rate-limit types or HTTP 429 count as rate limited."""
+        provider = f"test-{status}-{type(error).__name__}"
+        
+        await _run(provider, error)
+        
+        for label in ("success", "error", "rate_limited"):
+            assert _count(provider, label) == (1.0 if label == status else 0.0)
+    
+    async def test_exception_is_not_suppressed(self) -> None:
+        """Test that the timed block's exception propagates."""
+        with pytest.raises(_ProviderRateLimit):
+            async with LLMTimer("test-propagate", rate_limit_errors=(_ProviderRateLimit,)):
+                raise _ProviderRateLimit()
@@ -0,0 +1,190 @@
+"""
+Unit Tests for Sentry Scrubbing
+
+Tests that sensitive values are redacted exactly as the original
+one-pattern-at-a-time scrubber did.
+"""
+
+import contextlib
+import random
+import re
+import threading
+
+import pytest
+
+from hope.infrastructure.monitoring import sentry_integration
+from hope.infrastructure.monitoring.sentry_integration import (
+    SENSITIVE_PATTERNS,
+    _scrub_string,
+    before_send,
+    capture_exception_with_context,
+)
+
+
+def _baseline_scrub(value: str) -> str:
+    """Reference scrubber: each pattern applied in turn."""
+    for pattern in SENSITIVE_PATTERNS:
+        value = re.sub(pattern, "[REDACTED]", value, flags=re.IGNORECASE)
+    return value
+
+
+_FRAGMENTS = [
+    "Authorization", "authorization", "Bearer", "bearer", "token", "Token",
+    "password", "api_key", "api-key", "apikey", "secret", "jwt", "x",
+    "abc.def", "s3cr3t", "=", ":", ": ", " ", "\xa0", "'", '"', ",", "}",
+    "[REDACTED]", "==", "/", "ſecret", "é",
+]
+
+_CASES = [
+    "Authorization: Bearer abc.def",
+    "authorization=Bearer abc.def",
+    "Bearer token=abc",
+    "Bearer abc.def==",
+    "Bearer\xa0abc",
+    "token: bearer abc",
+    "password='hunter2', api_key=\"k-123\"",
+    "{'secret': 'shh', 'user': 'bob'}",
+    "nothing sensitive here",
+    "tok",
+]
+
+
+@pytest.fixture
+def re_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Force the re path even when Hyperscan is installed."""
+    monkeypatch.setattr(sentry_integration, "_HYPERSCAN_DB", None)
+
+
+class TestScrubString:
+    """Test suite for _scrub_string."""
+    
+    @pytest.mark.parametrize("value", _CASES)
+    def test_matches_baseline(self, re_only: None, value: str) -> None:
+        """Test known inputs against the baseline scrubber."""
+        assert _scrub_string(value) == _baseline_scrub(value)
+    
+    def test_matches_baseline_on_random_input(self, re_only: None) -> None:
+        """Test random fragment mixes, covering the cheap prefilters."""
+        rng = random.Random(0)
+        for _ in range(5000):
+            value = "".join(rng.choices(_FRAGMENTS, k=rng.randint(1, 8)))
+            assert _scrub_string(value) == _baseline_scrub(value), value
+    
+    @pytest.mark.parametrize(
+        "value",
+        ["Authorization: Bearer abc.def", "authorization=Bearer abc.def"],
+    )
+    def test_authorization_token_is_redacted(self, value: str) -> None:
+        """Test that the token after an authorization scheme never survives."""
+        assert _scrub_string(value) == "[REDACTED]"
+    
+    def test_bearer_value_is_redacted(self) -> None:
+        """Test that a bearer token holding an assignment is redacted."""
+        assert "abc" not in _scrub_string("Bearer token=abc")
+    
+    @pytest.mark.parametrize("value", ["Bearer\xa0abc", "BEARER\u2003abc", "ſecret=abc"])
+    def test_non_ascii_input_is_redacted(self, value: str) -> None:
+        """Test Unicode whitespace and case folding on the default path."""
+        assert _scrub_string(value) == _baseline_scrub(value) == "[REDACTED]"
+    
+    def test_concurrent_scrubbing(self) -> None:
+        """Test that scrubbing from many threads neither raises nor leaks."""
+        barrier = threading.Barrier(8)
+        errors: list[BaseException] = []
+        leaks: list[str] = []
+        
+        def worker() -> None:
+            barrier.wait()
+            try:
+                for _ in range(500):
+                    result = _scrub_string("Authorization: Bearer abc.def " * 10)
+                    if "abc" in result:
+                        leaks.append(result)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert leaks == []
+
+
+class TestBeforeSend:
+    """Test suite for before_send."""
+    
+    def test_scrubs_event_sections(self) -> None:
+        """Test keys, headers, breadcrumbs and extra are scrubbed."""
+        event = {
+            "request": {
+                "data": {"password": "hunter2", "note": ["token=abc", {"x": 1}]},
+                "headers": {"Authorization": "Bearer abc", "X-Info": "api_key=k"},
+            },
+            "breadcrumbs": {"values": [{"data": {"msg": "secret: shh"}}]},
+            "extra": {"nested": {"Session-Token": "t", "ok": "fine"}},
+        }
+        
+        result = before_send(event, {})
+        
+        assert result["request"]["data"] == {
+            "password": "[REDACTED]",
+            "note": ["[REDACTED]", {"x": 1}],
+        }
+        assert result["request"]["headers"] == {
+            "Authorization": "[REDACTED]",
+            "X-Info": "[REDACTED]",
+        }
+        assert result["breadcrumbs"]["values"][0]["data"] == {"msg": "[REDACTED]"}
+        assert result["extra"] == {
+            "nested": {"Session-Token": "[REDACTED]", "ok": "fine"}
+        }
+
+
+class _RecordingScope:
+    """Stand-in for a Sentry scope that records what is set on it."""
+    
+    def __init__(self) -> None:
+        self.tags: dict = {}
+        self.extras: dict = {}
+    
+    def set_tag(self, key: str, value: object) -> None:
+        self.tags[key] = value
+    
+    def set_extra(self, key: str, value: object) -> None:
+        self.extras[key] = value
+
+
+class TestCaptureExceptionWithContext:
+    """Test suite for capture_exception_with_context."""
+    
+    @pytest.fixture
+    def scope(self, monkeypatch: pytest.MonkeyPatch) -> _RecordingScope:
+        sentry_sdk = pytest.importorskip("sentry_sdk")
+        scope = _RecordingScope()
+        monkeypatch.setattr(sentry_sdk, "push_scope", lambda: contextlib.nullcontext(scope))
+        monkeypatch.setattr(sentry_sdk, "capture_exception", lambda exc: "event-id")
+        return scope
+    
+    def test_uncopyable_extra_is_still_reported(self, scope: _RecordingScope) -> None:
+        """Test that extras holding locks or clients do not block reporting."""
+        lock = threading.Lock()
+        extra = {"lock": lock, "ctx": {"token": "abc", "items": ["password=x", lock]}}
+        
+        event_id = capture_exception_with_context(ValueError("boom"), "s-1", extra)
+        
+        assert event_id == "event-id"
+        assert scope.tags == {"session_id": "s-1"}
+        assert scope.extras["lock"] is lock
+        assert scope.extras["ctx"] == {"token": "[REDACTED]", "items": ["[REDACTED]", lock]}
+    
+    def test_caller_extra_is_untouched(self, scope: _RecordingScope) -> None:
+        """Test that scrubbing works on a copy of the caller's containers."""
+        extra = {"ctx": {"token": "abc", "items": ["password=x"]}}
+        
+        capture_exception_with_context(ValueError("boom"), extra=extra)
+        
+        assert extra == {"ctx": {"token": "abc", "items": ["password=x"]}}
+        assert scope.extras["ctx"]["token"] == "[REDACTED]"
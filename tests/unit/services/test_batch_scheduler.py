@@ -0,0 +1,44 @@
+"""
+Unit Tests for Batch Scheduler
+
+Tests that concurrent submissions are coalesced and resolved in order.
+"""
+
+import asyncio
+
+import pytest
+
+from hope.services.detection.batch_scheduler import BatchScheduler
+
+
+class TestBatchScheduler:
+    """Test suite for BatchScheduler."""
+    
+    async def test_concurrent_submits_are_batched(self) -> None:
+        """Test that concurrent calls share forward passes."""
+        batch_sizes: list[int] = []
+        
+        def batch_fn(texts: list[str]) -> list[str]:
+            batch_sizes.append(len(texts))
+            return [t.upper() for t in texts]
+        
+        scheduler = BatchScheduler(batch_fn, max_batch_size=4)
+        results = await asyncio.gather(
+            *(scheduler.submit(f"text {i}") for i in range(10))
+        )
+        await scheduler.stop()
+        
+        assert results == [f"TEXT {i}" for i in range(10)]
+        assert batch_sizes == [4, 4, 2]
+    
+    async def test_batch_failure_propagates(self) -> None:
+        """Test that a failing batch raises in every caller."""
+        def batch_fn(texts: list[str]) -> list[str]:
+            raise ValueError("inference failed")
+        
+        scheduler = BatchScheduler(batch_fn)
+        
+        with pytest.raises(ValueError):
+            await scheduler.submit("text")
+        
+        await scheduler.stop()
@@ -4,6 +4,7 @@ Unit Tests for Clinical Pipeline
 Tests the clinical intelligence layer components.
 """
 
+import asyncio
 import pytest
 from uuid import uuid4
 from datetime import datetime
@@ -18,6 +19,8 @@ from hope.domain.models.clinical_output import (
     DistressIndicators,
     TriggerAnalysis,
 )
+from hope.services.clinical.clinical_pipeline import ClinicalPipeline
+from hope.services.clinical.session_analyzer import SessionAnalyzerRegistry
 from hope.services.decision.decision_engine import (
     DecisionEngine,
     DecisionContext,
@@ -282,3 +285,83 @@ class TestDecisionEngineWithClinicalAssessment:
         decision = engine.decide(context)
         assert "dominant_emotion" in decision.prompt_modifiers
         assert decision.prompt_modifiers["dominant_emotion"] == "fear"
+
+
+class TestLowSignalSkip:
+    """Tests for the ML skip on bare acknowledgements."""
+    
+    @pytest.fixture
+    def pipeline(self) -> ClinicalPipeline:
+        """Create pipeline that never loads its models."""
+        pipeline = ClinicalPipeline()
+        pipeline._initialized = True
+        return pipeline
+    
+    @pytest.mark.parametrize("text", ["ok", "Thanks!", "thank  you.", "yes", "شكرا"])
+    def test_acknowledgements_skip_ml(
+        self,
+        pipeline: ClinicalPipeline,
+        text: str,
+    ) -> None:
+        """Test that acknowledgements outside a session are low-signal."""
+        assert pipeline._is_low_signal(text, None)
+    
+    @pytest.mark.parametrize(
+        "text",
+        ["help me", "please help", "getting worse", "still bad", "ساعدني", "خائف جدا", "no"],
+    )
+    def test_short_messages_run_ml(
+        self,
+        pipeline: ClinicalPipeline,
+        text: str,
+    ) -> None:
+        """Test that short non-acknowledgements are never skipped."""
+        assert not pipeline._is_low_signal(text, None)
+    
+    def test_active_session_runs_ml(self, pipeline: ClinicalPipeline) -> None:
+        """Test that acknowledgements inside an active session are analyzed."""
+        session_id = uuid4()
+        SessionAnalyzerRegistry.get_or_create(session_id, uuid4())
+        try:
+            assert not pipeline._is_low_signal("ok", session_id)
+        finally:
+            SessionAnalyzerRegistry.remove(session_id)
+    
+    async def test_skip_records_no_session_data(self, pipeline: ClinicalPipeline) -> None:
+        """Test that a skipped message adds nothing to the session."""
+        session_id = uuid4()
+        
+        assessment = await pipeline.analyze("ok", user_id=uuid4(), session_id=session_id)
+        
+        assert assessment.severity.predicted_severity == PanicSeverity.NONE
+        assert SessionAnalyzerRegistry.get(session_id) is None
+
+
+class _SharedVectorClient:
+    """Vector client stand-in that records close() calls."""
+    
+    def __init__(self) -> None:
+        self.closed = False
+    
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestShutdown:
+    """Tests for ClinicalPipeline.shutdown."""
+    
+    async def test_waits_for_writes_and_leaves_client_open(self) -> None:
+        """Test that shutdown drains background writes but never closes the injected client."""
+        client = _SharedVectorClient()
+        pipeline = ClinicalPipeline(vector_client=client)
+        written = []
+        
+        async def write() -> None:
+            await asyncio.sleep(0)
+            written.append(True)
+        
+        pipeline._spawn_background(write())
+        await pipeline.shutdown()
+        
+        assert written == [True]
+        assert client.closed is False
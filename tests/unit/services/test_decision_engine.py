@@ -0,0 +1,246 @@
+"""
+Unit Tests for Decision Engine
+
+Tests the precomputed severity tables against the per-call decision rules.
+"""
+
+import itertools
+import logging
+from typing import Optional
+from uuid import uuid4
+
+import pytest
+
+from hope.domain.enums.panic_severity import PanicSeverity
+from hope.domain.models.clinical_output import (
+    ClinicalAssessment,
+    EmotionCategory,
+    EmotionProfile,
+    SeverityClassification,
+    TriggerAnalysis,
+)
+from hope.domain.models.panic_event import PanicIntervention, PanicTrigger
+from hope.services.decision import decision_engine
+from hope.services.decision.decision_engine import (
+    DecisionContext,
+    DecisionEngine,
+    ResponseStrategy,
+    ResponseTone,
+)
+
+
+class _DebugOnlyLogger:
+    """Logger stub with only debug(), so no structlog level API can be relied on."""
+    
+    def __init__(self) -> None:
+        self.events: list[str] = []
+    
+    def debug(self, event: str, **kwargs: object) -> None:
+        self.events.append(event)
+
+
+def _reference_decision(context: DecisionContext) -> dict:
+    """Reference: the decision rules as evaluated per call before the tables."""
+    engine = DecisionEngine
+    assessment = context.clinical_assessment
+    severity = assessment.severity.predicted_severity
+    
+    if assessment.requires_crisis_protocol:
+        return {
+            "strategy": ResponseStrategy.CRISIS,
+            "tone": ResponseTone.DIRECT,
+            "primary": PanicIntervention.CRISIS_RESOURCES,
+            "secondary": [
+                PanicIntervention.GROUNDING_TECHNIQUE,
+                PanicIntervention.PROFESSIONAL_REFERRAL,
+            ],
+            "constraints": [
+                *engine.UNIVERSAL_CONSTRAINTS,
+                "MUST provide crisis hotline number",
+                "MUST recommend immediate professional help",
+                "Response MUST be clear and actionable",
+            ],
+            "modifiers": {
+                "include_crisis_hotline": True,
+                "include_emergency_grounding": True,
+            },
+            "escalate": True,
+            "consent": False,
+        }
+    
+    tone = engine.SEVERITY_TONE[severity]
+    emotions = assessment.emotion_profile
+    if emotions.dominant_emotion:
+        if emotions.dominant_emotion == EmotionCategory.DISSOCIATION:
+            tone = ResponseTone.DIRECT
+        elif emotions.dominant_emotion == EmotionCategory.LOSS_OF_CONTROL:
+            tone = ResponseTone.CALM
+        elif emotions.emotional_volatility > 0.7:
+            tone = ResponseTone.CALM
+    
+    triggers = [PanicTrigger.UNKNOWN]
+    for trigger in assessment.trigger_analysis.immediate_triggers:
+        try:
+            triggers.append(PanicTrigger(trigger))
+        except ValueError:
+            pass
+    
+    interventions = list(engine.SEVERITY_INTERVENTIONS.get(severity, []))
+    if context.last_intervention_used:
+        try:
+            last = PanicIntervention(context.last_intervention_used)
+            if last in interventions:
+                interventions.remove(last)
+                interventions.insert(0, last)
+        except ValueError:
+            pass
+    if PanicTrigger.HEALTH_ANXIETY in triggers:
+        if PanicIntervention.GROUNDING_TECHNIQUE in interventions:
+            interventions.remove(PanicIntervention.GROUNDING_TECHNIQUE)
+            interventions.insert(0, PanicIntervention.GROUNDING_TECHNIQUE)
+    
+    constraints = list(engine.UNIVERSAL_CONSTRAINTS)
+    if severity >= PanicSeverity.MODERATE:
+        constraints.append("Keep response focused and concise")
+        constraints.append("Avoid lengthy explanations during crisis")
+    if severity >= PanicSeverity.SEVERE:
+        constraints.append("Include option for professional help")
+        constraints.append("Use simple, clear language")
+    
+    modifiers = {
+        "severity_level": severity.name,
+        "confidence_score": assessment.confidence_score,
+        "session_message_count": context.session_message_count,
+        "is_recurring": context.previous_panic_count > 0,
+    }
+    if emotions.dominant_emotion:
+        modifiers["dominant_emotion"] = emotions.dominant_emotion.value
+    if assessment.trigger_analysis.immediate_triggers:
+        modifiers["triggers"] = assessment.trigger_analysis.immediate_triggers
+    modifiers["distress_level"] = assessment.distress_indicators.overall_distress_level
+    if assessment.uncertainty_flags:
+        modifiers["has_uncertainty"] = True
+    
+    return {
+        "strategy": engine.SEVERITY_STRATEGY[severity],
+        "tone": tone,
+        "primary": interventions[0] if interventions else None,
+        "secondary": interventions[1:],
+        "constraints": constraints,
+        "modifiers": modifiers,
+        "escalate": severity >= PanicSeverity.SEVERE,
+        "consent": assessment.requires_human_review,
+    }
+
+
+def _context(
+    severity: PanicSeverity,
+    crisis: bool,
+    last_intervention: Optional[str],
+    triggers: list[str],
+    emotion: Optional[EmotionCategory],
+    volatility: float,
+    review: bool,
+) -> DecisionContext:
+    """Build a decision context for one scenario."""
+    assessment = ClinicalAssessment(
+        severity=SeverityClassification(predicted_severity=severity),
+        requires_crisis_protocol=crisis,
+        emotion_profile=EmotionProfile(
+            dominant_emotion=emotion,
+            emotional_volatility=volatility,
+        ),
+        trigger_analysis=TriggerAnalysis(immediate_triggers=triggers),
+        requires_human_review=review,
+        confidence_score=0.5,
+        uncertainty_flags=["low_confidence"] if review else [],
+    )
+    return DecisionContext(
+        user_id=uuid4(),
+        clinical_assessment=assessment,
+        last_intervention_used=last_intervention,
+        session_message_count=3,
+        previous_panic_count=1 if review else 0,
+    )
+
+
+SCENARIOS = list(itertools.product(
+    list(PanicSeverity),
+    [False, True],
+    [None, "not_an_intervention", *(i.value for i in PanicIntervention)],
+    [[], [PanicTrigger.HEALTH_ANXIETY.value], ["unknown_trigger", "social"]],
+    [None, EmotionCategory.DISSOCIATION, EmotionCategory.LOSS_OF_CONTROL, EmotionCategory.FEAR],
+    [0.1, 0.9],
+    [False, True],
+))
+
+
+class TestDecisionEngineTables:
+    """Test suite for the DecisionEngine severity tables."""
+    
+    @pytest.fixture
+    def engine(self) -> DecisionEngine:
+        return DecisionEngine()
+    
+    def test_matches_per_call_rules(self, engine: DecisionEngine) -> None:
+        """Test that decisions equal the per-call rules across the scenario grid."""
+        for scenario in SCENARIOS:
+            context = _context(*scenario)
+            decision = engine.decide(context)
+            expected = _reference_decision(context)
+            
+            actual = {
+                "strategy": decision.strategy,
+                "tone": decision.tone,
+                "primary": decision.primary_intervention,
+                "secondary": list(decision.secondary_interventions),
+                "constraints": list(decision.response_constraints),
+                "modifiers": decision.prompt_modifiers,
+                "escalate": decision.escalate_to_crisis,
+                "consent": decision.require_consent_check,
+            }
+            assert actual == expected, scenario
+    
+    def test_decisions_do_not_share_mutable_state(self, engine: DecisionEngine) -> None:
+        """Test that mutating one decision does not leak into the next."""
+        context = _context(PanicSeverity.SEVERE, False, None, [], None, 0.1, False)
+        first = engine.decide(context)
+        
+        if isinstance(first.secondary_interventions, list):
+            first.secondary_interventions.clear()
+        if isinstance(first.response_constraints, list):
+            first.response_constraints.clear()
+        first.prompt_modifiers["injected"] = True
+        
+        second = engine.decide(context)
+        assert second.secondary_interventions
+        assert second.response_constraints
+        assert "injected" not in second.prompt_modifiers
+    
+    def test_public_tables_cover_every_severity(self) -> None:
+        """Test that every severity has a strategy, tone and intervention list."""
+        for severity in PanicSeverity:
+            assert severity in DecisionEngine.SEVERITY_STRATEGY
+            assert severity in DecisionEngine.SEVERITY_TONE
+            assert severity in DecisionEngine.SEVERITY_INTERVENTIONS
+    
+    @pytest.mark.parametrize("level, logged", [(logging.DEBUG, True), (logging.INFO, False)])
+    def test_debug_log_follows_stdlib_level(
+        self,
+        engine: DecisionEngine,
+        monkeypatch: pytest.MonkeyPatch,
+        level: int,
+        logged: bool,
+    ) -> None:
+        """Test that the debug guard only relies on the stdlib logger level."""
+        fake = _DebugOnlyLogger()
+        monkeypatch.setattr(decision_engine, "logger", fake)
+        stdlib_logger = decision_engine._stdlib_logger
+        previous = stdlib_logger.level
+        stdlib_logger.setLevel(level)
+        try:
+            engine.decide(_context(PanicSeverity.MILD, False, None, [], None, 0.1, False))
+        finally:
+            stdlib_logger.setLevel(previous)
+        
+        assert bool(fake.events) is logged
@@ -0,0 +1,95 @@
+"""
+Unit Tests for Inference Cache
+
+Tests LRU eviction, TTL expiry and exact-text keys.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from hope.services.detection import inference_cache
+from hope.services.detection.inference_cache import InferenceCache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Control the monotonic time the cache sees."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        inference_cache, "time", SimpleNamespace(monotonic=lambda: clock.now)
+    )
+    return clock
+
+
+class TestInferenceCache:
+    """Test suite for InferenceCache."""
+    
+    def test_hit_and_miss(self, clock: SimpleNamespace) -> None:
+        """Test that stored values are returned and unknown texts miss."""
+        cache: InferenceCache[int] = InferenceCache(max_size=4, ttl_seconds=10)
+        cache.set("hello", 1)
+        
+        assert cache.get("hello") == 1
+        assert cache.get("other") is None
+    
+    def test_keys_on_exact_text(self, clock: SimpleNamespace) -> None:
+        """Test that texts tokenizing differently never share an entry."""
+        cache: InferenceCache[int] = InferenceCache()
+        cache.set("I can't breathe", 1)
+        
+        assert cache.get("I can't breathe") == 1
+        assert cache.get(" I can't breathe") is None
+        assert cache.get("I can't breathe\n") is None
+        assert cache.get("i can't breathe") is None
+    
+    def test_entries_expire_after_ttl(self, clock: SimpleNamespace) -> None:
+        """Test that entries are dropped once their TTL has passed."""
+        cache: InferenceCache[int] = InferenceCache(max_size=4, ttl_seconds=10)
+        cache.set("a", 1)
+        
+        clock.now += 9.9
+        assert cache.get("a") == 1
+        
+        clock.now += 0.1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+    
+    def test_set_refreshes_ttl(self, clock: SimpleNamespace) -> None:
+        """Test that re-setting a key restarts its lifetime."""
+        cache: InferenceCache[int] = InferenceCache(max_size=4, ttl_seconds=10)
+        cache.set("a", 1)
+        clock.now += 8
+        cache.set("a", 2)
+        clock.now += 8
+        
+        assert cache.get("a") == 2
+    
+    def test_least_recently_used_is_evicted(self, clock: SimpleNamespace) -> None:
+        """Test that a get protects an entry from eviction."""
+        cache: InferenceCache[int] = InferenceCache(max_size=2, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+    
+    def test_zero_size_disables_caching(self, clock: SimpleNamespace) -> None:
+        """Test that max_size=0 stores nothing."""
+        cache: InferenceCache[int] = InferenceCache(max_size=0)
+        cache.set("a", 1)
+        
+        assert cache.get("a") is None
+        assert len(cache) == 0
+    
+    def test_clear(self, clock: SimpleNamespace) -> None:
+        """Test that clear() empties the cache."""
+        cache: InferenceCache[int] = InferenceCache()
+        cache.set("a", 1)
+        cache.clear()
+        
+        assert cache.get("a") is None
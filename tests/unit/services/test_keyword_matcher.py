@@ -0,0 +1,146 @@
+"""
+Unit Tests for Keyword Matchers
+
+Tests the single-pass matchers against the per-phrase rules they replace.
+"""
+
+import random
+import re
+from typing import Hashable, Iterable, Mapping
+
+import pytest
+
+from hope.services.clinical.emotion_detector import EmotionDetector
+from hope.services.clinical.pattern_engine import PatternRecognitionEngine
+from hope.services.detection import keyword_matcher
+from hope.services.detection.keyword_matcher import KeywordMatcher, WholeWordMatcher
+
+CONTEXT_MARKERS = {
+    **PatternRecognitionEngine.LOCATION_MARKERS,
+    **PatternRecognitionEngine.SOCIAL_MARKERS,
+    **PatternRecognitionEngine.ACTIVITY_MARKERS,
+}
+
+FILLER = [
+    "i", "am", "so", "scared", "without", "today", "the", "a", "and",
+    "again", "really", "feel", "it", "cars", "workplace", "alone-ish",
+    "!", ",", ".", "  ", "\n", "'", "-", "é", "中",
+]
+
+
+def _random_texts(tables: Iterable[Mapping[Hashable, Iterable[str]]], n: int) -> list[str]:
+    """Build texts mixing table phrases, filler and joining punctuation."""
+    rng = random.Random(1234)
+    phrases = [p for table in tables for words in table.values() for p in words]
+    texts = []
+    for _ in range(n):
+        parts = [
+            rng.choice(phrases) if rng.random() < 0.3 else rng.choice(FILLER)
+            for _ in range(rng.randint(0, 12))
+        ]
+        joiner = rng.choice(["", " ", " ", ", ", "-"])
+        texts.append(joiner.join(parts))
+    return texts
+
+
+def _substring_labels(
+    keywords: Mapping[Hashable, Iterable[str]], text: str
+) -> set[Hashable]:
+    """Reference: the per-phrase ``phrase in text`` rule."""
+    return {
+        label
+        for label, words in keywords.items()
+        if any(word in text for word in words)
+    }
+
+
+def _whole_word_labels(
+    keywords: Mapping[Hashable, Iterable[str]], text: str
+) -> set[Hashable]:
+    """Reference: one word-bounded regex per phrase."""
+    found = set()
+    for label, words in keywords.items():
+        for word in words:
+            tokens = re.findall(r"\w+", word)
+            pattern = r"(?<!\w)" + r"\W+".join(map(re.escape, tokens)) + r"(?!\w)"
+            if re.search(pattern, text):
+                found.add(label)
+    return found
+
+
+@pytest.fixture(params=["ahocorasick", "regex"])
+def matcher_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run KeywordMatcher tests against both backends."""
+    if request.param == "ahocorasick":
+        if keyword_matcher.ahocorasick is None:
+            pytest.skip("pyahocorasick not installed")
+    else:
+        monkeypatch.setattr(keyword_matcher, "ahocorasick", None)
+    return request.param
+
+
+class TestKeywordMatcher:
+    """Test suite for KeywordMatcher."""
+    
+    @pytest.mark.parametrize(
+        "table",
+        [PatternRecognitionEngine.TRIGGER_PHRASES, EmotionDetector.PANIC_EMOTION_KEYWORDS],
+        ids=["triggers", "emotions"],
+    )
+    def test_matches_substring_rule(
+        self, matcher_backend: str, table: Mapping[Hashable, list[str]]
+    ) -> None:
+        """Test that labels equal the per-phrase substring rule on real tables."""
+        matcher = KeywordMatcher(table)
+        
+        for text in _random_texts([table], 2000):
+            text = text.lower()
+            assert matcher.labels_in(text) == _substring_labels(table, text), text
+    
+    def test_overlapping_and_shared_keywords(self, matcher_backend: str) -> None:
+        """Test that overlapping keywords and keywords shared by labels all report."""
+        matcher = KeywordMatcher({
+            "a": ["panic attack"],
+            "b": ["attack"],
+            "c": ["attack", "heart"],
+        })
+        
+        assert matcher.labels_in("a panic attack") == {"a", "b", "c"}
+        assert matcher.labels_in("heartbeat") == {"c"}
+        assert matcher.labels_in("calm") == set()
+    
+    def test_regex_metacharacters_are_literal(self, matcher_backend: str) -> None:
+        """Test that keywords are matched literally."""
+        matcher = KeywordMatcher({"x": ["can't (breathe)", "a.b"]})
+        
+        assert matcher.labels_in("i can't (breathe)") == {"x"}
+        assert matcher.labels_in("i can't breathe") == set()
+        assert matcher.labels_in("axb") == set()
+
+
+class TestWholeWordMatcher:
+    """Test suite for WholeWordMatcher."""
+    
+    def test_matches_word_bounded_regex(self) -> None:
+        """Test that labels equal the word-bounded regex rule on the context tables."""
+        matcher = WholeWordMatcher(CONTEXT_MARKERS)
+        
+        for text in _random_texts([CONTEXT_MARKERS], 2000):
+            text = text.lower()
+            assert matcher.labels_in(text) == _whole_word_labels(CONTEXT_MARKERS, text), text
+    
+    def test_does_not_match_inside_words(self) -> None:
+        """Test that short markers do not fire inside longer words."""
+        matcher = WholeWordMatcher({"car": ["car"], "social": ["with"]})
+        
+        assert matcher.labels_in("i am scared without you") == set()
+        assert matcher.labels_in("in the car, with friends") == {"car", "social"}
+    
+    def test_multi_word_phrases(self) -> None:
+        """Test that phrases match across any non-word separators."""
+        matcher = WholeWordMatcher({"alone": ["by myself"]})
+        
+        assert matcher.labels_in("all by  myself!") == {"alone"}
+        assert matcher.labels_in("by-myself") == {"alone"}
+        assert matcher.labels_in("by myselfish") == set()
+        assert matcher.labels_in("standby myself") == set()
@@ -0,0 +1,103 @@
+"""
+Unit Tests for Model Optimization
+
+Tests that ONNX exports never use a shared, predictable temp path.
+"""
+
+import os
+import tempfile
+
+import pytest
+import torch
+
+from hope.services.detection import model_optimization
+from hope.services.detection.model_optimization import export_onnx_for_inference
+
+
+class _TwoInputModel(torch.nn.Module):
+    """Tiny model with the (input_ids, attention_mask) signature."""
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self.embed = torch.nn.Embedding(10, 4)
+    
+    def forward(self, input_ids: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+        return (self.embed(input_ids) * attention_mask.unsqueeze(-1)).sum(dim=1)
+
+
+_EXAMPLE = (torch.ones(1, 3, dtype=torch.long),) * 2
+_NAMES = ("input_ids", "attention_mask")
+
+
+@pytest.fixture
+def private_tempdir(tmp_path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Point the default temp directory at an empty per-test directory."""
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return str(tmp_path)
+
+
+class TestExportOnnxForInference:
+    """Test suite for export_onnx_for_inference."""
+    
+    def test_failed_export_leaves_no_file(
+        self,
+        private_tempdir: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a failed export falls back and cleans up its temp file."""
+        # Any non-None runtime gets past the availability check; the
+        # export itself fails on the mismatched example inputs
+        monkeypatch.setattr(model_optimization, "onnxruntime", object())
+        
+        result = export_onnx_for_inference(
+            _TwoInputModel().eval(), (torch.ones(1, 3),), _NAMES, None, "cpu"
+        )
+        
+        assert result is None
+        assert os.listdir(private_tempdir) == []
+    
+    def test_export_omits_dynamo_on_older_torch(
+        self,
+        private_tempdir: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that torch.onnx.export is not given dynamo= where it is not accepted."""
+        calls = []
+        
+        def export_2_2(model, args, f, input_names=None, output_names=None,
+                       dynamic_axes=None, opset_version=None):
+            calls.append(f)
+            raise RuntimeError("stop after the call")
+        
+        monkeypatch.setattr(model_optimization, "onnxruntime", object())
+        monkeypatch.setattr(torch.onnx, "export", export_2_2)
+        
+        result = export_onnx_for_inference(_TwoInputModel().eval(), _EXAMPLE, _NAMES, None, "cpu")
+        
+        assert result is None
+        assert len(calls) == 1
+    
+    def test_export_without_path_keeps_no_file(self, private_tempdir: str) -> None:
+        """Test that the private export is removed once the session loads."""
+        pytest.importorskip("onnx")
+        pytest.importorskip("onnxruntime")
+        model = _TwoInputModel().eval()
+        
+        forward = export_onnx_for_inference(model, _EXAMPLE, _NAMES, None, "cpu")
+        
+        assert forward is not None
+        assert os.listdir(private_tempdir) == []
+        assert torch.allclose(forward(*_EXAMPLE), model(*_EXAMPLE), atol=1e-5)
+    
+    def test_export_with_path_is_renamed_into_place(self, tmp_path) -> None:
+        """Test that only the final file remains in the target directory."""
+        pytest.importorskip("onnx")
+        pytest.importorskip("onnxruntime")
+        path = tmp_path / "model.onnx"
+        
+        forward = export_onnx_for_inference(
+            _TwoInputModel().eval(), _EXAMPLE, _NAMES, str(path), "cpu"
+        )
+        
+        assert forward is not None
+        assert os.listdir(tmp_path) == ["model.onnx"]
@@ -0,0 +1,49 @@
+"""
+Unit Tests for Panic Severity Classifier
+
+Tests the token-id cache in front of the tokenizer.
+"""
+
+import pytest
+
+from hope.services.clinical.panic_classifier import PanicSeverityClassifier
+
+
+class _CountingTokenizer:
+    """Tokenizer stand-in: one id per character, recording every batch."""
+    
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+    
+    def __call__(self, texts: list[str], **kwargs: object) -> dict:
+        self.calls.append(list(texts))
+        return {"input_ids": [[ord(c) for c in text] for text in texts]}
+
+
+class TestTokenCache:
+    """Test suite for PanicSeverityClassifier._encode."""
+    
+    @pytest.fixture
+    def classifier(self) -> PanicSeverityClassifier:
+        classifier = PanicSeverityClassifier()
+        classifier._tokenizer = _CountingTokenizer()
+        return classifier
+    
+    def test_repeated_text_is_tokenized_once(
+        self, classifier: PanicSeverityClassifier
+    ) -> None:
+        """Test that a cached text skips the tokenizer."""
+        first = classifier._encode(["help me"])
+        second = classifier._encode(["help me"])
+        
+        assert first == second
+        assert classifier._tokenizer.calls == [["help me"]]
+    
+    def test_whitespace_variants_are_tokenized_separately(
+        self, classifier: PanicSeverityClassifier
+    ) -> None:
+        """Test that texts differing only in whitespace keep their own ids."""
+        plain, padded = classifier._encode(["x"])[0], classifier._encode([" x"])[0]
+        
+        assert plain != padded
+        assert classifier._tokenizer.calls == [["x"], [" x"]]
@@ -0,0 +1,165 @@
+"""
+Unit Tests for Session Analyzer Registry
+
+Tests LRU eviction, idle expiry and lookup semantics, and the
+per-session clock analyzers stamp their metrics with.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Iterator
+from uuid import uuid4
+
+import pytest
+
+from hope.domain.enums.panic_severity import PanicSeverity
+from hope.services.clinical import session_analyzer
+from hope.services.clinical.session_analyzer import SessionAnalyzerRegistry
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Control the monotonic time the registry sees."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        session_analyzer,
+        "time",
+        SimpleNamespace(
+            monotonic=lambda: clock.now,
+            monotonic_ns=lambda: int(clock.now * 1e9),
+        ),
+    )
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def empty_registry() -> Iterator[None]:
+    """Isolate each test from registry state left by others."""
+    SessionAnalyzerRegistry.clear()
+    yield
+    SessionAnalyzerRegistry.clear()
+
+
+class TestSessionAnalyzerRegistry:
+    """Test suite for SessionAnalyzerRegistry."""
+    
+    def test_get_or_create_returns_same_analyzer(self, clock: SimpleNamespace) -> None:
+        """Test that a session keeps its analyzer across calls."""
+        session_id, user_id = uuid4(), uuid4()
+        
+        first = SessionAnalyzerRegistry.get_or_create(session_id, user_id)
+        second = SessionAnalyzerRegistry.get_or_create(session_id, user_id)
+        
+        assert first is second
+        assert SessionAnalyzerRegistry.get(session_id) is first
+        assert SessionAnalyzerRegistry.get(uuid4()) is None
+    
+    def test_least_recently_used_is_evicted(
+        self, clock: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the registry never exceeds MAX_SESSIONS."""
+        monkeypatch.setattr(SessionAnalyzerRegistry, "MAX_SESSIONS", 2)
+        a, b, c = uuid4(), uuid4(), uuid4()
+        user_id = uuid4()
+        
+        SessionAnalyzerRegistry.get_or_create(a, user_id)
+        SessionAnalyzerRegistry.get_or_create(b, user_id)
+        SessionAnalyzerRegistry.get_or_create(a, user_id)
+        SessionAnalyzerRegistry.get_or_create(c, user_id)
+        
+        assert SessionAnalyzerRegistry.get(a) is not None
+        assert SessionAnalyzerRegistry.get(b) is None
+        assert SessionAnalyzerRegistry.get(c) is not None
+    
+    def test_get_does_not_refresh_order(
+        self, clock: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a plain get() does not protect an entry from eviction."""
+        monkeypatch.setattr(SessionAnalyzerRegistry, "MAX_SESSIONS", 2)
+        a, b, c = uuid4(), uuid4(), uuid4()
+        user_id = uuid4()
+        
+        SessionAnalyzerRegistry.get_or_create(a, user_id)
+        SessionAnalyzerRegistry.get_or_create(b, user_id)
+        SessionAnalyzerRegistry.get(a)
+        SessionAnalyzerRegistry.get_or_create(c, user_id)
+        
+        assert SessionAnalyzerRegistry.get(a) is None
+        assert SessionAnalyzerRegistry.get(b) is not None
+    
+    def test_idle_sessions_expire_on_get_or_create(self, clock: SimpleNamespace) -> None:
+        """Test that analyzers idle beyond SESSION_TTL_SECONDS are dropped."""
+        ttl = SessionAnalyzerRegistry.SESSION_TTL_SECONDS
+        idle, active = uuid4(), uuid4()
+        user_id = uuid4()
+        
+        SessionAnalyzerRegistry.get_or_create(idle, user_id)
+        SessionAnalyzerRegistry.get_or_create(active, user_id)
+        clock.now += ttl / 2
+        SessionAnalyzerRegistry.get_or_create(active, user_id)
+        clock.now += ttl / 2 + 1
+        SessionAnalyzerRegistry.get_or_create(uuid4(), user_id)
+        
+        assert SessionAnalyzerRegistry.get(idle) is None
+        assert SessionAnalyzerRegistry.get(active) is not None
+    
+    def test_expired_session_gets_fresh_analyzer(self, clock: SimpleNamespace) -> None:
+        """Test that returning after the TTL starts a new analyzer."""
+        session_id, user_id = uuid4(), uuid4()
+        
+        first = SessionAnalyzerRegistry.get_or_create(session_id, user_id)
+        clock.now += SessionAnalyzerRegistry.SESSION_TTL_SECONDS + 1
+        SessionAnalyzerRegistry.get_or_create(uuid4(), user_id)
+        
+        assert SessionAnalyzerRegistry.get_or_create(session_id, user_id) is not first
+    
+    def test_remove_expired(self, clock: SimpleNamespace) -> None:
+        """Test that remove_expired() applies the given TTL and reports the count."""
+        user_id = uuid4()
+        old = [uuid4() for _ in range(3)]
+        for session_id in old:
+            SessionAnalyzerRegistry.get_or_create(session_id, user_id)
+        clock.now += 60
+        recent = uuid4()
+        SessionAnalyzerRegistry.get_or_create(recent, user_id)
+        clock.now += 30
+        
+        assert SessionAnalyzerRegistry.remove_expired(45) == 3
+        assert all(SessionAnalyzerRegistry.get(s) is None for s in old)
+        assert SessionAnalyzerRegistry.get(recent) is not None
+        assert SessionAnalyzerRegistry.remove_expired(45) == 0
+    
+    def test_remove(self, clock: SimpleNamespace) -> None:
+        """Test that remove() returns the analyzer and forgets the session."""
+        session_id = uuid4()
+        analyzer = SessionAnalyzerRegistry.get_or_create(session_id, uuid4())
+        
+        assert SessionAnalyzerRegistry.remove(session_id) is analyzer
+        assert SessionAnalyzerRegistry.get(session_id) is None
+        assert SessionAnalyzerRegistry.remove(session_id) is None
+
+
+class TestSessionClock:
+    """Test suite for the SessionAnalyzer monotonic session clock."""
+    
+    def test_interventions_share_the_session_clock(self, clock: SimpleNamespace) -> None:
+        """Test that both intervention paths stamp times on one clock."""
+        analyzer = SessionAnalyzerRegistry.get_or_create(uuid4(), uuid4())
+        metrics = analyzer.get_metrics()
+        
+        clock.now += 1.5
+        analyzer.record_message(0.9, PanicSeverity.SEVERE, intervention="breathing")
+        clock.now += 2.0
+        analyzer.mark_intervention("grounding")
+        clock.now += 0.25
+        analyzer.record_message(0.2, PanicSeverity.MILD)
+        
+        start = metrics.started_at
+        assert [record.applied_at for record in metrics.interventions] == [
+            start + timedelta(seconds=1.5),
+            start + timedelta(seconds=3.5),
+        ]
+        assert [point.timestamp for point in metrics.intensity_trajectory] == [
+            start + timedelta(seconds=1.5),
+            start + timedelta(seconds=3.75),
+        ]